@@ -26,7 +26,11 @@ from subagent.eda_agent import create_eda_agent
 from subagent.research_agent import create_research_agent
 from agentdk.core.logging_config import ensure_nest_asyncio
 from agentdk.agent.base_app import RootAgent, create_memory_session
-from agentdk.agent.app_utils import create_supervisor_workflow
+from agentdk.agent.app_utils import (
+    create_supervisor_workflow,
+    create_workflow_messages,
+    extract_response,
+)
 
 # Ensure async compatibility for IPython/Jupyter
 ensure_nest_asyncio()
@@ -122,15 +126,19 @@ class App(RootAgent):
         messages = self._create_workflow_messages(user_prompt, enhanced_input)
         result = self.workflow.invoke({"messages": messages})
         return self._extract_response(result)
-    
+
+    async def _aprocess_query(self, user_prompt: str, enhanced_input: Dict) -> str:
+        """Process using workflow without blocking the event loop."""
+        messages = self._create_workflow_messages(user_prompt, enhanced_input)
+        result = await self.workflow.ainvoke({"messages": messages})
+        return self._extract_response(result)
+
     def _create_workflow_messages(self, user_prompt: str, enhanced_input: Dict) -> list:
         """Create workflow messages from query and enhanced input."""
-        from agentdk.agent.app_utils import create_workflow_messages
         return create_workflow_messages(user_prompt, enhanced_input)
     
     def _extract_response(self, result: Any) -> str:
         """Extract response from workflow result."""
-        from agentdk.agent.app_utils import extract_response
         return extract_response(result)
     
     def _create_supervisor_prompt(self) -> str:
@@ -16,11 +16,29 @@ Examples:
     
 """
 
-from .agent.agent_interface import AgentInterface, SubAgent, App, RootAgent, create_memory_session
-from .agent.factory import create_agent
-from .builder.agent_builder import AgentBuilder, buildAgent
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from .exceptions import AgentDKError, MCPConfigError, AgentInitializationError
 
+if TYPE_CHECKING:
+    from .agent.agent_interface import AgentInterface, SubAgent, App, RootAgent, create_memory_session
+    from .agent.factory import create_agent
+    from .builder.agent_builder import AgentBuilder, buildAgent
+
+# Public names and the submodule defining each; imported on first access so
+# that light entry points (e.g. ``agentdk sessions list``) skip the agent stack
+_LAZY_EXPORTS = {
+    "AgentInterface": ".agent.agent_interface",
+    "SubAgent": ".agent.agent_interface",
+    "App": ".agent.agent_interface",
+    "RootAgent": ".agent.agent_interface",
+    "create_memory_session": ".agent.agent_interface",
+    "create_agent": ".agent.factory",
+    "AgentBuilder": ".builder.agent_builder",
+    "buildAgent": ".builder.agent_builder",
+}
+
 # Public API version
 __version__ = "0.1.0"
 
@@ -48,6 +66,16 @@ __all__ = [
 ]
 
 
+def __getattr__(name: str) -> Any:
+    """Import public API objects on first access (PEP 562)."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
 def quick_start() -> None:
     """Display quick start guide for AgentDK."""
     print("""
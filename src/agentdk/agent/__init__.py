@@ -3,9 +3,25 @@
 This module provides the clean AgentDK architecture with dependency injection.
 """
 
-from .agent_interface import AgentInterface, SubAgent, SubAgentWithMCP, SubAgentWithoutMCP, App, RootAgent, create_memory_session
-from .base_app import *  # Re-export clean architecture
-from .session_manager import SessionManager
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .agent_interface import AgentInterface, SubAgent, SubAgentWithMCP, SubAgentWithoutMCP, App, RootAgent, create_memory_session
+    from .session_manager import SessionManager
+
+# Public names and the submodule defining each; imported on first access.
+# base_app re-exports the agent_interface names, so they resolve there directly.
+_LAZY_EXPORTS = {
+    "AgentInterface": ".agent_interface",
+    "SubAgent": ".agent_interface",
+    "SubAgentWithMCP": ".agent_interface",
+    "SubAgentWithoutMCP": ".agent_interface",
+    "App": ".agent_interface",
+    "RootAgent": ".agent_interface",
+    "create_memory_session": ".agent_interface",
+    "SessionManager": ".session_manager",
+}
 
 __all__ = [
     "AgentInterface",
@@ -16,4 +32,14 @@ __all__ = [
     "RootAgent",
     "create_memory_session",
     "SessionManager",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str) -> Any:
+    """Import public agent classes on first access (PEP 562)."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -1,16 +1,137 @@
 """Abstract agent interface for ML agents with MCP integration."""
 
 import asyncio
-import inspect
+import importlib
+import logging
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional, List, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, Optional, List, Tuple, Union
 from pathlib import Path
 
-from ..core.mcp_load import get_mcp_config, transform_config_for_mcp_client
-from ..core.logging_config import get_logger, ensure_nest_asyncio
-from ..core.persistent_mcp import PersistentSessionManager, CleanupManager
+from ..core.mcp_load import get_class_dir, get_mcp_config, transform_config_for_mcp_client
+from ..core.logging_config import get_logger
+from ..core.loop_thread import get_loop_thread, run_sync
+from ..core.response_cache import ResponseCache
+from ..core.tool_cache import ToolCache
+from ..core.persistent_mcp import (
+    CleanupManager,
+    DEFAULT_SESSION_IDLE_TIMEOUT,
+    DEFAULT_SESSION_POOL_SIZE,
+    PersistentSessionManager,
+)
 from ..exceptions import AgentInitializationError, MCPConfigError
 
+logger = get_logger()
+
+# Message roles/types that identify user input in LangGraph state
+_USER_ROLES = frozenset(("human", "user"))
+
+# Content marker of supervisor handoff messages that are not user input
+_TRANSFER_MARKER = "transferred to agent"
+
+# Role/content readers keyed by message type, see _message_reader()
+_message_readers: Dict[type, Callable[[Any], Tuple[Any, Any]]] = {}
+
+# Heavyweight modules imported on first use, see _lazy_module()
+_lazy_modules: Dict[str, Any] = {}
+
+# Executor for RootAgent background memory writes, see _get_memory_writer()
+_memory_writer: Optional[ThreadPoolExecutor] = None
+
+# Default seconds to wait for an agent's MCP sessions to open
+DEFAULT_INIT_TIMEOUT = 30.0
+
+# Prompt layout produced by app_utils.prepare_query_with_memory
+_QUERY_MARKER = "User query: "
+_MEMORY_MARKER = "Memory context: "
+
+
+def _read_dict_message(message: Dict[str, Any]) -> Tuple[Any, Any]:
+    """Return the role and content of a dict-style message."""
+    return message.get("role"), message.get("content", "")
+
+
+def _read_object_message(message: Any) -> Tuple[Any, Any]:
+    """Return the type and content of a message object (e.g. LangChain messages)."""
+    content = getattr(message, "content", None)
+    if content is None:
+        content = str(message)
+    return getattr(message, "type", None), content
+
+
+def _message_reader(message_type: type) -> Callable[[Any], Tuple[Any, Any]]:
+    """Get the role/content reader for a message type, resolved once per type.
+
+    Message histories hold only a handful of concrete types, so the
+    dict-vs-object decision is made on first sight of a type and later
+    messages of that type dispatch with a single dictionary lookup.
+    """
+    reader = _message_readers.get(message_type)
+    if reader is None:
+        reader = _read_dict_message if issubclass(message_type, dict) else _read_object_message
+        _message_readers[message_type] = reader
+    return reader
+
+
+def _lazy_module(name: str) -> Any:
+    """Import a heavyweight module on first use and cache it for later calls.
+
+    Hot paths (``invoke``, ``query_async``) resolve classes as attributes of the
+    cached module instead of running an import statement on every call.
+
+    Args:
+        name: Fully qualified module name
+
+    Returns:
+        The imported module
+    """
+    module = _lazy_modules.get(name)
+    if module is None:
+        module = importlib.import_module(name)
+        _lazy_modules[name] = module
+    return module
+
+
+def _get_memory_writer() -> ThreadPoolExecutor:
+    """Get the shared single-thread executor for background memory writes."""
+    global _memory_writer
+    if _memory_writer is None:
+        _memory_writer = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="agentdk-memory"
+        )
+    return _memory_writer
+
+
+def _resolve_tools_fetcher(
+    mcp_client: Optional[Any],
+    session_manager: Optional[PersistentSessionManager],
+) -> Callable[[], Awaitable[List[Any]]]:
+    """Pick how tools are fetched for an MCP client, once per agent.
+
+    Args:
+        mcp_client: The configured MCP client, if any
+        session_manager: The agent's persistent session manager, if any
+
+    Returns:
+        Async callable returning the list of available tools
+    """
+    if session_manager is not None and session_manager.is_initialized:
+        return session_manager.get_tools_persistent
+
+    if mcp_client:
+        if hasattr(mcp_client, "get_tools"):
+            return mcp_client.get_tools
+        if hasattr(mcp_client, "tools"):
+            async def fetch_tools_property() -> List[Any]:
+                return mcp_client.tools
+
+            return fetch_tools_property
+
+    async def no_tools() -> List[Any]:
+        return []
+
+    return no_tools
+
 
 def create_memory_session(
     name: Optional[str] = None,
@@ -39,10 +160,8 @@ def create_memory_session(
         
     try:
         from ..memory.memory_aware_agent import MemoryAwareSession
-        from ..core.logging_config import get_logger
         
-        logger = get_logger()
-        logger.debug(f"Creating memory session: name={name}, user_id={user_id}")
+        logger.debug("Creating memory session: name=%s, user_id=%s", name, user_id)
         
         return MemoryAwareSession(
             name=name,
@@ -51,10 +170,6 @@ def create_memory_session(
         )
         
     except ImportError as e:
-        from ..core.logging_config import get_logger
-        from ..exceptions import AgentInitializationError
-        
-        logger = get_logger()
         error_msg = f"Memory functionality unavailable: {e}"
         
         if require_memory:
@@ -64,28 +179,28 @@ def create_memory_session(
                 "Install memory dependencies or set enable_memory=False."
             ) from e
         else:
-            logger.warning(f"{error_msg}. Continuing without memory functionality.")
+            logger.warning("%s. Continuing without memory functionality.", error_msg)
             return None
             
     except Exception as e:
-        from ..core.logging_config import get_logger
-        from ..exceptions import AgentInitializationError
-        
-        logger = get_logger()
-        logger.error(f"Failed to create memory session: {e}")
+        logger.error("Failed to create memory session: %s", e)
         
         if require_memory:
             raise AgentInitializationError(
                 f"Failed to create required memory session: {e}"
             ) from e
         else:
-            logger.warning(f"Memory session creation failed: {e}. Continuing without memory.")
+            logger.warning("Memory session creation failed: %s. Continuing without memory.", e)
             return None
 
 
 class AgentInterface(ABC):
     """Abstract base class for all ML agents with dependency injection."""
 
+    # Fixed per-agent state lives in slots; concrete subclasses that do not
+    # declare __slots__ still get a __dict__ for their own attributes.
+    __slots__ = ("memory_session", "config", "resume_session")
+
     def __init__(
         self, 
         memory_session: Optional[Any] = None,
@@ -137,11 +252,16 @@ class AgentInterface(ABC):
             self.memory_session.store_interaction(query, response)
 
     def get_memory_aware_prompt(self, base_prompt: str) -> str:
-        """Enhance prompt with memory context if available."""
+        """Enhance prompt with memory context if available.
+
+        The static base prompt always comes first and the per-query memory
+        context is appended after it, so the prompt prefix stays identical
+        across calls and remains eligible for provider-side prompt caching.
+        """
         if self.memory_session:
             memory_context = self.memory_session.get_memory_context(base_prompt)
             if memory_context:
-                return f"{memory_context}\n\n{base_prompt}"
+                return f"{base_prompt}\n\nMEMORY CONTEXT:\n{memory_context}"
         return base_prompt
 
 
@@ -201,22 +321,113 @@ class RootAgent(App, AgentInterface):
         # Initialize both parent classes
         App.__init__(self, config=config, name=name, **kwargs)
         AgentInterface.__init__(self, memory_session=memory_session, config=config, resume_session=resume_session, **kwargs)
+        self._response_cache = self._build_response_cache(config or {})
+        self._background_memory_writes = bool((config or {}).get("background_memory_writes"))
+
+    @staticmethod
+    def _build_response_cache(config: Dict[str, Any]) -> Optional[ResponseCache]:
+        """Create the response cache requested via the ``response_cache`` option.
+
+        The option accepts True (normalized exact matching) or a configured
+        ResponseCache instance, e.g. one with an embedding function.
+
+        Args:
+            config: Agent configuration dictionary
+
+        Returns:
+            ResponseCache instance, or None when caching is disabled
+        """
+        option = config.get("response_cache")
+        if isinstance(option, ResponseCache):
+            return option
+        return ResponseCache() if option else None
     
     def query(self, user_prompt: str, **kwargs) -> str:
         """Concrete implementation combining app logic + agent interface."""
-        # Memory integration
-        if self.memory_session:
-            enhanced_input = self.memory_session.process_with_memory(user_prompt)
+        # A cached response skips memory retrieval as well as the workflow
+        response = self._cached_response(user_prompt)
+        if response is None:
+            enhanced_input = (
+                self.memory_session.process_with_memory(user_prompt)
+                if self.memory_session else {}
+            )
             response = self._process_query(user_prompt, enhanced_input)
+            self._cache_response(user_prompt, response)
+        if self.memory_session:
+            return self._finalize_with_memory(user_prompt, response)
+        return response
+
+    async def query_async(self, user_prompt: str, **kwargs) -> str:
+        """Async counterpart of query() for serving concurrent requests.
+
+        Args:
+            user_prompt: The user's input prompt
+            **kwargs: Additional keyword arguments for the query
+
+        Returns:
+            str: The agent's response
+        """
+        # A cached response skips memory retrieval as well as the workflow
+        response = self._cached_response(user_prompt)
+        if response is None:
+            enhanced_input = (
+                self.memory_session.process_with_memory(user_prompt)
+                if self.memory_session else {}
+            )
+            response = await self._aprocess_query(user_prompt, enhanced_input)
+            self._cache_response(user_prompt, response)
+        if self.memory_session:
+            return self._finalize_with_memory(user_prompt, response)
+        return response
+
+    def _finalize_with_memory(self, user_prompt: str, response: str) -> str:
+        """Store the interaction in memory, in the background if configured.
+
+        With the ``background_memory_writes`` option the write is queued on a
+        single worker thread (preserving interaction order) and the response is
+        returned immediately instead of waiting on the memory backend.
+        """
+        if not self._background_memory_writes:
             return self.memory_session.finalize_with_memory(user_prompt, response)
-        else:
-            return self._process_query(user_prompt, {})
-    
-    @abstractmethod  
+
+        _get_memory_writer().submit(
+            self._finalize_in_background, self.memory_session, user_prompt, response
+        )
+        return response
+
+    @staticmethod
+    def _finalize_in_background(memory_session: Any, user_prompt: str, response: str) -> None:
+        """Worker body for background memory writes; failures are only logged."""
+        try:
+            memory_session.finalize_with_memory(user_prompt, response)
+        except Exception as e:
+            logger.warning("Background memory write failed: %s", e)
+
+    def _cached_response(self, user_prompt: str) -> Optional[str]:
+        """Return a cached response for the prompt, if response caching is on."""
+        if self._response_cache is None:
+            return None
+        return self._response_cache.get(user_prompt)
+
+    def _cache_response(self, user_prompt: str, response: str) -> None:
+        """Remember the response for the prompt, if response caching is on."""
+        if self._response_cache is not None:
+            self._response_cache.put(user_prompt, response)
+
+    @abstractmethod
     def _process_query(self, user_prompt: str, enhanced_input: Dict) -> str:
         """Subclasses implement processing logic."""
         pass
 
+    async def _aprocess_query(self, user_prompt: str, enhanced_input: Dict) -> str:
+        """Async processing hook used by query_async().
+
+        The default runs _process_query() in a worker thread so the event loop
+        is not blocked. Subclasses with a LangGraph workflow should override it
+        to await ``workflow.ainvoke`` directly.
+        """
+        return await asyncio.to_thread(self._process_query, user_prompt, enhanced_input)
+
 
 
 
@@ -233,6 +444,25 @@ try:
         SubAgent inherits from AgentInterface and implements agent-specific functionality
         with dependency injection for memory sessions.
         """
+
+        __slots__ = (
+            "llm",
+            "name",
+            "prompt",
+            "_mcp_client",
+            "_mcp_config_path",
+            "_tools",
+            "_initialized",
+            "_mcp_config_loaded",
+            "_persistent_session_manager",
+            "_cleanup_manager",
+            "_init_timeout",
+            "_tools_fetch",
+            "_system_message",
+            "_system_prompt",
+            "agent",
+            "logger",
+        )
         
         def __init__(
             self,
@@ -244,6 +474,7 @@ try:
             prompt: Optional[str] = None,
             tools: Optional[List[Any]] = None,
             resume_session: Optional[bool] = None,
+            init_timeout: Optional[float] = DEFAULT_INIT_TIMEOUT,
             **kwargs: Any,
         ) -> None:
             """Initialize SubAgent with dependency injection.
@@ -257,6 +488,8 @@ try:
                 prompt: Optional agent system prompt
                 tools: Optional available tools
                 resume_session: Whether to resume from previous session
+                init_timeout: Seconds to wait for MCP sessions to open
+                    (None waits indefinitely)
                 **kwargs: Additional keyword arguments
             """
             # Initialize with dependency injection
@@ -280,28 +513,25 @@ try:
             self._mcp_config_path: Optional[Path] = (
                 Path(mcp_config_path) if mcp_config_path else None
             )
-            self._tools: List[Any] = tools or []
+            self._tools: Tuple[Any, ...] = tuple(tools or ())
             self._initialized: bool = False
             self._mcp_config_loaded: bool = False
             self._persistent_session_manager: Optional[PersistentSessionManager] = None
+            self._init_timeout = init_timeout
+            self._tools_fetch: Optional[Callable[[], Awaitable[List[Any]]]] = None
+            self._system_message: Optional[Any] = None
+            self._system_prompt: Optional[str] = None
             self._cleanup_manager: Optional[CleanupManager] = None
             self.agent: Optional[Any] = None
             self.logger = get_logger()
-            ensure_nest_asyncio()
 
         def query(self, user_prompt: str, **kwargs) -> str:
             """FIXED: Concrete implementation with LLM integration (sync wrapper)."""
-            # Synchronous wrapper for async implementation
-            import asyncio
-            import nest_asyncio
-            
-            # Apply nest_asyncio to allow nested asyncio.run() calls
-            # This prevents event loop boundary issues with LangGraph supervisor
-            nest_asyncio.apply()
-            
             try:
                 if asyncio.iscoroutinefunction(self.query_async):
-                    return asyncio.run(self.query_async(user_prompt, **kwargs))
+                    # Run on the shared background loop so MCP sessions opened during
+                    # initialization stay bound to one loop across calls
+                    return run_sync(self.query_async(user_prompt, **kwargs))
                 else:
                     # Memory integration
                     if self.memory_session:
@@ -312,8 +542,8 @@ try:
                         return self._execute_with_llm(user_prompt, {})
             except Exception as e:
                 import traceback
-                self.logger.error(f"Query execution failed: {e}")
-                self.logger.error(f"Stack trace:\n{traceback.format_exc()}")
+                self.logger.error("Query execution failed: %s", e)
+                self.logger.error("Stack trace:\n%s", traceback.format_exc())
                 return f"Query execution failed: {e}"
         
         @abstractmethod
@@ -321,22 +551,52 @@ try:
             """Subclasses implement LLM execution logic."""
             pass
         
+        async def _prepare_langgraph(self) -> None:
+            """Import LangGraph's prebuilt agents off the event loop.
+
+            Loading ``langgraph.prebuilt`` does not depend on the MCP tools, so it is
+            warmed in a worker thread while MCP sessions are set up and tools are
+            discovered. Import failures are reported by _create_langgraph_agent.
+            """
+            try:
+                await asyncio.to_thread(_lazy_module, "langgraph.prebuilt")
+            except ImportError:
+                pass
+
         async def _create_langgraph_agent(self) -> None:
             """Create LangGraph reactive agent with available tools."""
             try:
-                from langgraph.prebuilt import create_react_agent
+                create_react_agent = _lazy_module("langgraph.prebuilt").create_react_agent
 
                 # Create react agent with LLM and tools
                 self.agent = create_react_agent(self.llm, self._tools)
 
-                self.logger.info(f"Created LangGraph agent with {len(self._tools)} tools")
+                self.logger.info("Created LangGraph agent with %d tools", len(self._tools))
 
             except ImportError as e:
-                self.logger.error(f"Failed to import LangGraph: {e}")
+                self.logger.error("Failed to import LangGraph: %s", e)
             except Exception as e:
-                self.logger.error(f"Failed to create LangGraph agent: {e}")
+                self.logger.error("Failed to create LangGraph agent: %s", e)
                 raise
 
+        async def _setup_and_load_tools(self) -> None:
+            """Set up the MCP client, then load its tools."""
+            await self._setup_mcp_client()
+            await self._load_tools()
+
+        async def _initialize_on_loop_thread(self) -> None:
+            """Run ``_initialize`` on the shared loop thread from any event loop.
+
+            MCP sessions stay bound to the loop that opens them. Opening them on
+            the shared loop keeps later sync ``query()`` calls (which also run
+            there) from hanging on sessions owned by a caller's loop.
+            """
+            loop_thread = get_loop_thread()
+            if loop_thread.in_loop_thread():
+                await self._initialize()
+            else:
+                await asyncio.wrap_future(loop_thread.submit(self._initialize()))
+
         async def _initialize(self) -> None:
             """Initialize MCP connections and load tools."""
             if self._initialized:
@@ -344,8 +604,8 @@ try:
                 return
 
             try:
-                await self._setup_mcp_client()
-                await self._load_tools()
+                # Tool discovery is I/O bound; overlap it with the LangGraph import
+                await asyncio.gather(self._setup_and_load_tools(), self._prepare_langgraph())
 
                 explicitly_requested_mcp = self._mcp_config_path is not None
                 if explicitly_requested_mcp and not self._tools:
@@ -356,7 +616,7 @@ try:
 
                 await self._create_langgraph_agent()
                 self._initialized = True
-                self.logger.debug(f"Agent {self.__class__.__name__} initialized successfully")
+                self.logger.debug("Agent %s initialized successfully", self.__class__.__name__)
 
             except AgentInitializationError:
                 raise
@@ -376,21 +636,72 @@ try:
                 config = get_mcp_config(self)
                 self._mcp_config_loaded = True
                 client_config = transform_config_for_mcp_client(config)
-                from langchain_mcp_adapters.client import MultiServerMCPClient
-                self._mcp_client = MultiServerMCPClient(client_config)
-                self.logger.debug(f"MCP client configured with {len(client_config)} servers")
-
-                self._persistent_session_manager = PersistentSessionManager(self._mcp_client)
-                await self._persistent_session_manager.initialize()
+                mcp_client_module = _lazy_module("langchain_mcp_adapters.client")
+                self._mcp_client = mcp_client_module.MultiServerMCPClient(client_config)
+                self.logger.debug("MCP client configured with %d servers", len(client_config))
+
+                self._persistent_session_manager = PersistentSessionManager(
+                    self._mcp_client,
+                    pool_size=self.config.get("mcp_session_pool_size", DEFAULT_SESSION_POOL_SIZE),
+                    idle_timeout=self.config.get(
+                        "mcp_session_idle_timeout", DEFAULT_SESSION_IDLE_TIMEOUT
+                    ),
+                    tool_cache=self._build_tool_cache(),
+                )
+                await self._initialize_sessions()
                 self._cleanup_manager = CleanupManager(self._persistent_session_manager)
                 self._cleanup_manager.register_cleanup()
+                self._tools_fetch = _resolve_tools_fetcher(
+                    self._mcp_client, self._persistent_session_manager
+                )
 
             except Exception as e:
-                self.logger.error(f"Failed to setup MCP client: {e}")
+                self.logger.error("Failed to setup MCP client: %s", e)
                 raise
 
+        async def _initialize_sessions(self) -> None:
+            """Open the persistent MCP sessions, bounded by ``init_timeout``.
+
+            Raises:
+                AgentInitializationError: If the sessions do not open in time
+            """
+            try:
+                async with asyncio.timeout(self._init_timeout):
+                    await self._persistent_session_manager.initialize()
+            except TimeoutError as e:
+                self.logger.error(
+                    "MCP sessions did not initialize within %ss", self._init_timeout
+                )
+                try:
+                    await self._persistent_session_manager.cleanup()
+                except Exception as cleanup_error:
+                    self.logger.debug("Cleanup after init timeout failed: %s", cleanup_error)
+                raise AgentInitializationError(
+                    f"MCP servers did not initialize within {self._init_timeout}s",
+                    agent_type=self.__class__.__name__,
+                ) from e
+
+        def _build_tool_cache(self) -> Optional[ToolCache]:
+            """Create the tool definition cache requested via ``mcp_tool_cache``.
+
+            The option accepts True (default location) or a database path.
+
+            Returns:
+                ToolCache instance, or None when caching is disabled
+            """
+            option = self.config.get("mcp_tool_cache")
+            if not option:
+                return None
+            if option is True:
+                return ToolCache()
+            return ToolCache(option)
+
         async def _load_tools(self) -> None:
             """Load tools from MCP servers."""
+            if self._initialized:
+                self.logger.debug("Tools already loaded, skipping")
+                return
+
             if not self._mcp_client:
                 self.logger.warning("No MCP client available, skipping tool loading")
                 return
@@ -398,28 +709,19 @@ try:
             try:
                 raw_tools = await self._get_tools_from_mcp()
                 wrapped_tools = self._wrap_tools_with_logging(raw_tools)
-                self._tools.extend(wrapped_tools)
-                self.logger.debug(f"Loaded {len(self._tools)} tools from MCP servers")
+                self._tools = self._tools + tuple(wrapped_tools)
+                self.logger.debug("Loaded %d tools from MCP servers", len(self._tools))
             except Exception as e:
-                self.logger.error(f"Failed to get tools from MCP client: {e}")
+                self.logger.error("Failed to get tools from MCP client: %s", e)
                 raise
 
         async def _get_tools_from_mcp(self) -> List[Any]:
             """Get tools from MCP client using persistent sessions."""
-            if (self._persistent_session_manager and 
-                self._persistent_session_manager.is_initialized):
-                self.logger.debug("Using persistent sessions to get tools")
-                return await self._persistent_session_manager.get_tools_persistent()
-
-            if not self._mcp_client:
-                return []
-
-            if hasattr(self._mcp_client, "get_tools"):
-                return await self._mcp_client.get_tools()
-            elif hasattr(self._mcp_client, "tools"):
-                return self._mcp_client.tools
-            else:
-                return []
+            if self._tools_fetch is None:
+                self._tools_fetch = _resolve_tools_fetcher(
+                    self._mcp_client, self._persistent_session_manager
+                )
+            return await self._tools_fetch()
 
         def _wrap_tools_with_logging(self, tools: List[Any]) -> List[Any]:
             """Wrap all tools with unified logging capabilities.
@@ -438,7 +740,7 @@ try:
                     wrapped_tools.append(wrapped_tool)
                 except Exception as e:
                     self.logger.warning(
-                        f"Failed to wrap tool {getattr(tool, 'name', 'unknown')}: {e}"
+                        "Failed to wrap tool %s: %s", getattr(tool, 'name', 'unknown'), e
                     )
                     # Include original tool if wrapping fails
                     wrapped_tools.append(tool)
@@ -463,7 +765,7 @@ try:
 
             if not original_func:
                 self.logger.warning(
-                    f"Could not find function for tool {getattr(tool, 'name', 'unknown')}"
+                    "Could not find function for tool %s", getattr(tool, 'name', 'unknown')
                 )
                 return tool
 
@@ -569,36 +871,39 @@ try:
             """Async version of query for direct async usage."""
             try:
                 if not self.is_initialized:
-                    await self._initialize()
+                    await self._initialize_on_loop_thread()
 
                 actual_query, memory_context = self._parse_memory_context(user_prompt)
 
                 if self.agent:
-                    from langchain_core.messages import HumanMessage, SystemMessage
+                    lc_messages = _lazy_module("langchain_core.messages")
+                    HumanMessage = lc_messages.HumanMessage
+                    SystemMessage = lc_messages.SystemMessage
                     
-                    system_prompt = self.prompt
-                    self.logger.debug(f"Using system prompt: {system_prompt[:100]}...")
+                    system_message = self._get_system_message()
+                    self.logger.debug("Using system prompt: %.100s...", self.prompt)
                     
                     messages = []
-                    if system_prompt:
-                        messages.append(SystemMessage(content=system_prompt))
+                    if system_message is not None:
+                        messages.append(system_message)
                     if memory_context:
                         messages.append(SystemMessage(content=f"MEMORY CONTEXT:\n{memory_context}"))
                     messages.append(HumanMessage(content=actual_query))
                     
-                    self.logger.debug(f"Sending {len(messages)} messages to agent")
-                    self.logger.debug(f"User query: {actual_query}")
+                    self.logger.debug("Sending %d messages to agent", len(messages))
+                    self.logger.debug("User query: %s", actual_query)
                     
                     self.logger.debug("About to call agent.ainvoke() - ENTRY POINT")
                     result = await self.agent.ainvoke({"messages": messages})
                     self.logger.debug("Successfully returned from agent.ainvoke() - EXIT POINT")
-                    self.logger.debug(f"Agent result type: {type(result)}")
-                    self.logger.debug(f"Agent result: {str(result)[:200]}...")
+                    if self.logger.isEnabledFor(logging.DEBUG):
+                        self.logger.debug("Agent result type: %s", type(result))
+                        self.logger.debug("Agent result: %.200s...", result)
 
                     if isinstance(result, dict) and "messages" in result:
                         last_message = result["messages"][-1]
                         msg = getattr(last_message, "content", str(last_message))
-                        self.logger.debug(f"Parsed msg {msg}")
+                        self.logger.debug("Parsed msg %s", msg)
                         return msg
 
                     else:
@@ -610,34 +915,53 @@ try:
             except AgentInitializationError:
                 raise
             except Exception as e:
-                self.logger.error(f"Error processing query: {e}")
+                self.logger.error("Error processing query: %s", e)
                 return f"Error processing query: {e}"
 
+        def _get_system_message(self) -> Optional[Any]:
+            """Get the static system message, built once per prompt.
+
+            The same message object is sent on every query, so the prompt is
+            not re-wrapped each call; it is rebuilt only if ``prompt`` changes.
+            With the ``prompt_cache`` config option the prompt is sent as a
+            content block marked with ``cache_control`` so providers that
+            support prompt caching (e.g. Anthropic) reuse the cached prefix
+            across queries instead of re-reading it each time.
+            """
+            if not self.prompt:
+                return None
+            message = self._system_message
+            if message is None or self._system_prompt is not self.prompt:
+                SystemMessage = _lazy_module("langchain_core.messages").SystemMessage
+                if self.config.get("prompt_cache"):
+                    content: Any = [{
+                        "type": "text",
+                        "text": self.prompt,
+                        "cache_control": {"type": "ephemeral"},
+                    }]
+                else:
+                    content = self.prompt
+                message = self._system_message = SystemMessage(content=content)
+                self._system_prompt = self.prompt
+            return message
+
         def _parse_memory_context(self, user_prompt: str) -> tuple[str, str]:
             """Parse memory context from formatted user prompt."""
-            if "User query: " in user_prompt and "Memory context: " in user_prompt:
-                try:
-                    parts = user_prompt.split("Memory context: ", 1)
-                    if len(parts) == 2:
-                        first_part = parts[0].strip()
-                        if first_part.startswith("User query: "):
-                            actual_query = first_part.replace("User query: ", "").strip()
-                        else:
-                            actual_query = first_part.strip()
-                        memory_context = parts[1].strip()
-                        return actual_query, memory_context
-                except Exception as e:
-                    self.logger.warning(f"Failed to parse memory context: {e}")
-                    return user_prompt, ""
-            return user_prompt, ""
+            head, sep, memory_context = user_prompt.partition(_MEMORY_MARKER)
+            if not sep:
+                return user_prompt, ""
+            prefix, sep, actual_query = head.partition(_QUERY_MARKER)
+            if not sep or prefix.strip():
+                return user_prompt, ""
+            return actual_query.strip(), memory_context.strip()
 
         def process(self, query: str) -> str:
             """Legacy method - calls primary query() interface."""
             return self.query(query)
 
         @property
-        def tools(self) -> List[Any]:
-            """Get the loaded and wrapped tools."""
+        def tools(self) -> Tuple[Any, ...]:
+            """Get the loaded and wrapped tools as an immutable tuple."""
             return self._tools
 
         @property
@@ -653,8 +977,7 @@ try:
                 if isinstance(state, dict) and "messages" in state:
                     messages = state.get("messages", [])
                     if not messages:
-                        from langchain_core.messages import AIMessage
-                        return {"messages": [AIMessage(content="No input provided")]}
+                        return self._format_langgraph_response("No input provided")
                     
                     user_input = self._extract_user_input(state)
                     response = self.query(user_input)  # Use primary interface
@@ -663,51 +986,41 @@ try:
                     response = self.query(str(state))
                     return self._format_langgraph_response(response)
             except Exception as e:
-                from langchain_core.messages import AIMessage
-                return {"messages": [AIMessage(content=f"Error processing request: {e}")]}
+                return self._format_langgraph_response(f"Error processing request: {e}")
         
         def _extract_user_input(self, state: Dict[str, Any]) -> str:
-            """Extract user input from LangGraph state format."""
+            """Extract user input from LangGraph state format.
+
+            Scans messages newest-first and returns the most recent user message,
+            skipping supervisor transfer messages. Falls back to the last
+            non-transfer message when no user message is present.
+            """
             messages = state.get("messages", [])
             if not messages:
                 return ""
-            
-            # Find user input from messages (skip transfer messages)
-            for message in messages:
+
+            fallback: Optional[str] = None
+            for message in reversed(messages):
+                role, content = _message_reader(type(message))(message)
+
+                is_user = isinstance(role, str) and role in _USER_ROLES
+                if not is_user and fallback is not None:
+                    # Only a user message can change the result now
+                    continue
+
                 # Skip transfer-related messages
-                if hasattr(message, "content") and "transferred to agent" in str(message.content).lower():
+                if _TRANSFER_MARKER in str(content).lower():
                     continue
-                
-                if hasattr(message, "content") and hasattr(message, "type"):
-                    if message.type in ("human", "user"):
-                        return message.content
-                elif isinstance(message, dict):
-                    content = message.get("content", "")
-                    # Skip transfer messages
-                    if "transferred to agent" in content.lower():
-                        continue
-                    role = message.get("role", "")
-                    if role in ("user", "human"):
-                        return content
-            
-            # Fallback to last non-transfer message
-            for message in reversed(messages):
-                if hasattr(message, "content"):
-                    content = message.content
-                elif isinstance(message, dict):
-                    content = message.get("content", "")
-                else:
-                    content = str(message)
-                
-                # Skip transfer messages
-                if "transferred to agent" not in content.lower():
+
+                if is_user:
                     return content
-            
-            return ""
+                fallback = content
+
+            return fallback if fallback is not None else ""
         
         def _format_langgraph_response(self, response: str) -> Dict[str, Any]:
             """Format response for LangGraph."""
-            from langchain_core.messages import AIMessage
+            AIMessage = _lazy_module("langchain_core.messages").AIMessage
             return {"messages": [AIMessage(content=response)]}
 
     class SubAgentWithMCP(SubAgent):
@@ -767,19 +1080,12 @@ try:
                 return config_path.resolve()
             
             # For relative paths, resolve relative to the agent's file location
-            try:
-                # Get the file where this agent class is defined
-                agent_file = inspect.getfile(self.__class__)
-                agent_dir = Path(agent_file).parent
-                
-                # Resolve the config path relative to agent directory
-                resolved_path = (agent_dir / config_path).resolve()
-                
-                return resolved_path
-                
-            except (OSError, TypeError):
-                # Fallback to resolving relative to current working directory
-                return config_path.resolve()
+            agent_dir = get_class_dir(type(self))
+            if agent_dir is not None:
+                return (agent_dir / config_path).resolve()
+
+            # Fallback to resolving relative to current working directory
+            return config_path.resolve()
     
     class SubAgentWithoutMCP(SubAgent):
         """SubAgent implementation without MCP."""
@@ -817,7 +1123,25 @@ try:
                 tools=tools or [],
                 **kwargs
             )
-        
+
+        async def _initialize(self) -> None:
+            """Create the LangGraph agent from the pre-supplied tools.
+
+            There is no MCP configuration to load, so the MCP client setup and
+            tool discovery steps of the base implementation are skipped.
+            """
+            if self._initialized:
+                return
+
+            try:
+                await self._create_langgraph_agent()
+                self._initialized = True
+            except Exception as e:
+                raise AgentInitializationError(
+                    f"Failed to initialize agent {self.__class__.__name__}: {e}",
+                    agent_type=self.__class__.__name__,
+                ) from e
+
         def _execute_with_llm(self, user_prompt: str, enhanced_input: Dict) -> str:
             """Execute with direct tools."""
             # Implementation depends on specific non-MCP agent logic
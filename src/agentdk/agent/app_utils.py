@@ -5,10 +5,22 @@ with AgentDK agents, including response extraction, workflow creation,
 and memory context formatting.
 """
 
-from typing import Any, Dict, List
+import asyncio
+from typing import Any, Dict, List, Sequence, Tuple
 from ..core.logging_config import get_logger
 
 
+_MISSING = object()
+
+
+def _message_content(message: Any) -> Any:
+    """Get a message's content from an object or dict, or _MISSING if absent."""
+    content = getattr(message, 'content', _MISSING)
+    if content is _MISSING and isinstance(message, dict):
+        content = message.get('content', _MISSING)
+    return content
+
+
 def extract_response(result: Any) -> str:
     """Extract response content from LangGraph result.
     
@@ -30,39 +42,30 @@ def extract_response(result: Any) -> str:
         result = {"messages": [{"content": "Hello", "role": "assistant"}]}
         response = extract_response(result)  # "Hello"
     """
-    logger = get_logger()
-    
     # Handle dict with messages (most common LangGraph format)
-    if isinstance(result, dict) and 'messages' in result:
-        messages = result['messages']
+    if isinstance(result, dict):
+        messages = result.get('messages')
         if messages:
             last_message = messages[-1]
-            
-            # Extract content from AIMessage or similar objects
-            if hasattr(last_message, 'content'):
-                return last_message.content
-            
-            # Extract content from dict format messages
-            elif isinstance(last_message, dict) and 'content' in last_message:
-                return last_message['content']
+            content = _message_content(last_message)
+            if content is not _MISSING:
+                return content
             
             # Log warning for unexpected message format
-            logger.warning(f"Unexpected message format: {type(last_message)}")
+            get_logger().warning(f"Unexpected message format: {type(last_message)}")
     
     # Handle direct string results
-    if isinstance(result, str):
+    elif isinstance(result, str):
         return result
     
     # Handle list of messages directly
-    if isinstance(result, list) and result:
-        last_item = result[-1]
-        if hasattr(last_item, 'content'):
-            return last_item.content
-        elif isinstance(last_item, dict) and 'content' in last_item:
-            return last_item['content']
+    elif isinstance(result, list) and result:
+        content = _message_content(result[-1])
+        if content is not _MISSING:
+            return content
     
     # Fallback: return string representation
-    logger.warning(f"Using fallback string conversion for result type: {type(result)}")
+    get_logger().warning(f"Using fallback string conversion for result type: {type(result)}")
     return str(result)
 
 
@@ -96,24 +99,21 @@ def format_memory_context(memory_context: Dict[str, Any]) -> str:
         recent = memory_context['recent_conversation']
         if recent:
             formatted_parts.append("Recent conversation:")
-            for item in recent:
-                formatted_parts.append(f"  - {item}")
+            formatted_parts.extend(f"  - {item}" for item in recent)
     
     # Format user preferences
     if 'user_preferences' in memory_context:
         prefs = memory_context['user_preferences']
         if prefs:
             formatted_parts.append("User preferences:")
-            for key, value in prefs.items():
-                formatted_parts.append(f"  - {key}: {value}")
+            formatted_parts.extend(f"  - {key}: {value}" for key, value in prefs.items())
     
     # Format relevant facts
     if 'relevant_facts' in memory_context:
         facts = memory_context['relevant_facts']
         if facts:
             formatted_parts.append("Relevant context:")
-            for fact in facts:
-                formatted_parts.append(f"  - {fact}")
+            formatted_parts.extend(f"  - {fact}" for fact in facts)
     
     # Format working memory
     if 'working_memory' in memory_context:
@@ -123,13 +123,14 @@ def format_memory_context(memory_context: Dict[str, Any]) -> str:
             if isinstance(working, str):
                 formatted_parts.append(f"  - {working}")
             elif isinstance(working, list):
-                for item in working:
-                    formatted_parts.append(f"  - {item}")
+                formatted_parts.extend(f"  - {item}" for item in working)
     
     return "\\n".join(formatted_parts)
 
 
-def create_supervisor_workflow(agents: List[Any], model: Any, prompt: str) -> Any:
+def create_supervisor_workflow(
+    agents: List[Any], model: Any, prompt: str, parallel: bool = False
+) -> Any:
     """Create a supervisor workflow with the given agents.
     
     This is a common pattern for creating multi-agent workflows using
@@ -139,6 +140,9 @@ def create_supervisor_workflow(agents: List[Any], model: Any, prompt: str) -> An
         agents: List of agent instances to supervise
         model: Language model instance for the supervisor
         prompt: System prompt for the supervisor
+        parallel: Let the supervisor hand off to several agents in one step.
+            Independent sub-questions then run concurrently, so wall-clock
+            time is the slowest agent rather than the sum of all agents.
         
     Returns:
         Compiled LangGraph workflow
@@ -158,10 +162,18 @@ def create_supervisor_workflow(agents: List[Any], model: Any, prompt: str) -> An
         from langgraph_supervisor import create_supervisor
         
         # Create supervisor workflow
-        workflow = create_supervisor(agents, model=model, prompt=prompt)
+        if parallel:
+            workflow = create_supervisor(
+                agents, model=model, prompt=prompt, parallel_tool_calls=True
+            )
+        else:
+            workflow = create_supervisor(agents, model=model, prompt=prompt)
         app = workflow.compile()
         
-        logger.info(f"Created supervisor workflow with {len(agents)} agents")
+        logger.info(
+            f"Created supervisor workflow with {len(agents)} agents"
+            f"{' (parallel handoffs)' if parallel else ''}"
+        )
         return app
         
     except ImportError as e:
@@ -175,6 +187,36 @@ def create_supervisor_workflow(agents: List[Any], model: Any, prompt: str) -> An
         raise
 
 
+async def scatter_gather(tasks: Sequence[Tuple[Any, str]]) -> List[str]:
+    """Run independent agent queries concurrently, bypassing supervisor routing.
+
+    A supervisor hands off to one agent per LLM turn, so a question made of
+    independent parts pays a routing round-trip for each part. When the
+    caller already knows which agent answers which part, the parts can be
+    sent directly and awaited together; wall-clock time is then the slowest
+    agent rather than the sum of all agents plus routing.
+
+    Args:
+        tasks: (agent, query) pairs to run concurrently
+
+    Returns:
+        Responses in the same order as ``tasks``
+
+    Examples:
+        sales, news = await scatter_gather([
+            (eda_agent, "Total sales by region in 2024"),
+            (research_agent, "Recent news about our competitors"),
+        ])
+    """
+    async def run(agent: Any, query: str) -> str:
+        query_async = getattr(agent, 'query_async', None)
+        if query_async is not None:
+            return await query_async(query)
+        return await asyncio.to_thread(agent.query, query)
+
+    return list(await asyncio.gather(*(run(agent, query) for agent, query in tasks)))
+
+
 def prepare_query_with_memory(query: str, memory_context: Dict[str, Any]) -> str:
     """Prepare a query string with memory context for agent processing.
     
@@ -4,57 +4,188 @@ This module provides session management capabilities for parent agents only.
 Child agents created through supervisor patterns do not manage sessions.
 """
 
+import asyncio
 import json
 import os
 from datetime import datetime
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 
-import click
 from agentdk.core.logging_config import get_logger
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 
 logger = get_logger(__name__)
 
+# Seconds to wait for further interactions before writing the session file
+DEFAULT_FLUSH_DELAY = 0.2
+
+# Write the session file at least every this many interactions
+FLUSH_EVERY_INTERACTIONS = 16
+
+# Suffix of the append-only log of interactions not yet in the session file
+WAL_SUFFIX = "_session.wal.jsonl"
+
+# Top-level session fields reported by get_session_info
+_SUMMARY_FIELDS = ("agent_name", "created_at", "last_updated", "format_version")
+
+# ijson events carrying a scalar value
+_SCALAR_EVENTS = frozenset(("string", "number", "boolean", "null"))
+
+
+def _echo(message: str, **styles: Any) -> None:
+    """Print a user-facing message, importing click on first use.
+    
+    Only interactive paths print, so programmatic users of SessionManager do
+    not pay for importing click.
+    """
+    import click
+    
+    if styles:
+        click.secho(message, **styles)
+    else:
+        click.echo(message)
+
+
+def _dumps(data: Any) -> bytes:
+    """Serialize session data compactly, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _loads(data: bytes) -> Any:
+    """Parse session data; orjson's decode error subclasses json.JSONDecodeError."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@lru_cache(maxsize=None)
+def _default_session_dir() -> Path:
+    """Resolve the default session directory once per process."""
+    return Path.home() / ".agentdk" / "sessions"
+
+
+def _summarize_session(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Extract the fields get_session_info reports from parsed session data."""
+    summary = {field: data[field] for field in _SUMMARY_FIELDS if field in data}
+    summary["interaction_count"] = len(data.get("interactions", []))
+    summary["has_memory_state"] = bool(data.get("memory_state"))
+    return summary
+
+
+def _stream_session_summary(path: Path) -> Dict[str, Any]:
+    """Summarize a session file with ijson, without building its interactions.
+    
+    Long sessions are mostly interaction history, which a status check only
+    needs to count.
+    
+    Raises:
+        ValueError: If the file is not a JSON object or is malformed
+    """
+    summary: Dict[str, Any] = {"interaction_count": 0, "has_memory_state": False}
+    with open(path, 'rb') as f:
+        events = ijson.parse(f)
+        if next(events, (None, None, None))[1] != "start_map":
+            raise ValueError("Session file is not a JSON object")
+        for prefix, event, value in events:
+            if prefix == "interactions.item":
+                # One value event or container start per item; keys/ends are not items
+                if event not in ("map_key", "end_map", "end_array"):
+                    summary["interaction_count"] += 1
+            elif prefix == "memory_state":
+                if event == "map_key" or (event in _SCALAR_EVENTS and value):
+                    summary["has_memory_state"] = True
+            elif prefix == "memory_state.item":
+                summary["has_memory_state"] = True
+            elif prefix in _SUMMARY_FIELDS and event in _SCALAR_EVENTS:
+                summary[prefix] = value
+    return summary
+
 
 class SessionManager:
     """Manages session persistence for parent agent interactions."""
     
-    def __init__(self, agent_name: str, session_dir: Optional[Path] = None):
+    __slots__ = (
+        "agent_name",
+        "session_dir",
+        "current_session",
+        "session_file",
+        "wal_file",
+        "format_version",
+        "flush_delay",
+        "_dirty",
+        "_flush_task",
+        "_parse_cache",
+    )
+    
+    def __init__(
+        self,
+        agent_name: str,
+        session_dir: Optional[Path] = None,
+        flush_delay: float = DEFAULT_FLUSH_DELAY,
+    ):
         """Initialize SessionManager.
         
         Args:
             agent_name: Name of the agent
             session_dir: Optional directory for session files
+            flush_delay: Seconds to coalesce interactions before writing the
+                session file when they could not be logged
         """
         self.agent_name = agent_name
-        self.session_dir = session_dir or Path.home() / ".agentdk" / "sessions"
+        self.session_dir = session_dir or _default_session_dir()
         self.current_session: Dict[str, Any] = {}
         
         # Always create session infrastructure when SessionManager is instantiated
         self.session_file = self.session_dir / f"{agent_name}_session.json"
+        self.wal_file = self.session_dir / f"{agent_name}{WAL_SUFFIX}"
         self.session_dir.mkdir(parents=True, exist_ok=True)
         
         # Format version for compatibility
         self.format_version = "1.0"
+
+        # Unsaved changes and the pending coalesced write, see save_interaction()
+        self.flush_delay = flush_delay
+        self._dirty = False
+        self._flush_task: Optional[asyncio.Task] = None
+
+        # Last parsed session file keyed on its (mtime_ns, size), see _read_parsed()
+        self._parse_cache: Optional[Tuple[Tuple[int, int], Dict[str, Any]]] = None
     
     async def start_new_session(self):
         """Start a new session, clearing any previous session data."""
         
+        self._cancel_pending_flush()
+        now = datetime.now().isoformat()
         self.current_session = {
             "agent_name": self.agent_name,
-            "created_at": datetime.now().isoformat(),
-            "last_updated": datetime.now().isoformat(),
+            "created_at": now,
+            "last_updated": now,
             "format_version": self.format_version,
             "interactions": [],
             "memory_state": {}
         }
         
-        # Remove old session file if it exists
-        if self.session_file.exists():
-            self.session_file.unlink()
+        # Replace any old session with the empty one, so the log always has a
+        # snapshot to be replayed onto
+        self.wal_file.unlink(missing_ok=True)
+        self._dirty = True
+        await self._save_session_to_file()
         
-        logger.debug(f"Started new session for {self.agent_name}")
+        logger.debug("Started new session for %s", self.agent_name)
     
     async def load_session(self) -> bool:
         """Load previous session if it exists.
@@ -63,93 +194,185 @@ class SessionManager:
             bool: True if session was loaded, False if no previous session exists
         """
         
-        if not self.session_file.exists():
-            click.echo(f"No previous session found for {self.agent_name}")
+        # Read, validate and migrate the session file in a single pass
+        try:
+            is_valid, data = self._read_validate_and_migrate()
+        except FileNotFoundError:
+            _echo(f"No previous session found for {self.agent_name}")
             await self.start_new_session()
             return False
         
-        # Validate session format first
-        if not self._validate_session_format():
-            click.secho("Session file format outdated or corrupted, starting fresh", fg="yellow")
+        if not is_valid:
+            _echo("Session file format outdated or corrupted, starting fresh", fg="yellow")
             await self._backup_corrupted_session()
             await self.start_new_session()
             return False
         
         try:
-            # Load and validate session data
-            self.current_session = self._load_and_validate_session()
+            # Replay interactions logged after the last snapshot
+            self.current_session = data
+            self._replay_wal()
             
             # Display previous interactions
             interactions = self.current_session.get("interactions", [])
             if interactions:
-                click.echo(f"\\nResuming session with {len(interactions)} previous interactions:\\n")
+                _echo(f"\\nResuming session with {len(interactions)} previous interactions:\\n")
                 
                 # Show last few interactions for context
-                recent_interactions = interactions[-5:] if len(interactions) > 5 else interactions
-                for interaction in recent_interactions:
-                    click.echo(f"[user]: {interaction['user_input']}")
-                    click.echo(f"[{self.agent_name}]: {interaction['agent_response']}")
+                for interaction in islice(interactions, max(len(interactions) - 5, 0), None):
+                    _echo(f"[user]: {interaction['user_input']}")
+                    _echo(f"[{self.agent_name}]: {interaction['agent_response']}")
                 
                 if len(interactions) > 5:
-                    click.echo(f"... ({len(interactions) - 5} earlier interactions)")
-                click.echo("")
+                    _echo(f"... ({len(interactions) - 5} earlier interactions)")
+                _echo("")
                 
                 # Show memory state info if available
                 memory_state = self.current_session.get("memory_state", {})
                 if memory_state:
-                    click.echo(f"Memory state restored (format: {self.current_session.get('format_version', 'unknown')})")
+                    _echo(f"Memory state restored (format: {self.current_session.get('format_version', 'unknown')})")
             
             return True
             
         except (json.JSONDecodeError, KeyError) as e:
-            click.secho(f"Session file corrupted: {e}, starting fresh", fg="yellow")
+            _echo(f"Session file corrupted: {e}, starting fresh", fg="yellow")
             await self._backup_corrupted_session()
             await self.start_new_session()
             return False
         except Exception as e:
-            click.secho(f"Error loading session: {e}", fg="yellow")
+            _echo(f"Error loading session: {e}", fg="yellow")
             await self.start_new_session()
             return False
     
     async def save_interaction(self, user_input: str, agent_response: str, memory_state: Optional[Dict] = None):
         """Save a single interaction to the current session."""
         
+        now = datetime.now().isoformat()
         interaction = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now,
             "user_input": user_input,
             "agent_response": agent_response
         }
         
-        self.current_session["interactions"].append(interaction)
-        self.current_session["last_updated"] = datetime.now().isoformat()
+        interactions = self.current_session["interactions"]
+        interactions.append(interaction)
+        self.current_session["last_updated"] = now
         
         # Update memory state if provided
         if memory_state:
             self.current_session["memory_state"] = memory_state
         
-        # Save to file immediately for persistence
+        # Rewriting the whole file per turn is quadratic over a long session.
+        # The interaction is appended to the log right away for durability, so
+        # the snapshot is only rewritten every N interactions and in close().
+        # If the log cannot be written, the snapshot is written shortly after
+        # the last interaction instead.
+        logged = self._append_to_wal(len(interactions) - 1, interaction, memory_state)
+        self._dirty = True
+        if len(self.current_session["interactions"]) % FLUSH_EVERY_INTERACTIONS == 0:
+            self._cancel_pending_flush()
+            await self._save_session_to_file()
+        elif not logged and self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._debounced_flush())
+    
+    async def _debounced_flush(self):
+        """Write the session file once no interaction arrived for flush_delay."""
+        await asyncio.sleep(self.flush_delay)
+        self._flush_task = None
         await self._save_session_to_file()
     
+    def _append_to_wal(self, index: int, interaction: Dict[str, Any], memory_state: Optional[Dict] = None) -> bool:
+        """Append one interaction, and the memory state saved with it, to the log.
+        
+        Returns:
+            bool: True if the entry was logged
+        """
+        entry = {"index": index, "interaction": interaction}
+        if memory_state:
+            entry["memory_state"] = memory_state
+        try:
+            with open(self.wal_file, 'ab') as f:
+                f.write(_dumps(entry) + b"\n")
+            return True
+        except Exception as e:
+            _echo(f"Warning: Could not log interaction: {e}", fg="yellow")
+            return False
+    
+    def _replay_wal(self):
+        """Apply logged interactions (and memory state) missing from the snapshot.
+        
+        Entries carry their position in the interaction list, so entries already
+        in the snapshot (e.g. after a crash between snapshot and log truncation)
+        are skipped, and replay stops at the first gap or unreadable line.
+        """
+        try:
+            f = open(self.wal_file, 'rb')
+        except FileNotFoundError:
+            return
+        
+        interactions = self.current_session.setdefault("interactions", [])
+        replayed = 0
+        with f:
+            for line in f:
+                try:
+                    entry = _loads(line)
+                    index = entry["index"]
+                    interaction = entry["interaction"]
+                    if index < len(interactions):
+                        continue
+                except (KeyError, TypeError, ValueError):
+                    # Torn or malformed entry (JSONDecodeError is a ValueError)
+                    break
+                if index > len(interactions):
+                    break
+                interactions.append(interaction)
+                if "memory_state" in entry:
+                    self.current_session["memory_state"] = entry["memory_state"]
+                replayed += 1
+        
+        if replayed:
+            self._dirty = True
+            logger.debug("Replayed %d logged interactions for %s", replayed, self.agent_name)
+    
+    def _cancel_pending_flush(self):
+        """Cancel a scheduled coalesced write, if any."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+    
     async def _save_session_to_file(self):
-        """Save current session data to file."""
+        """Save current session data to file if it has unsaved changes."""
         
+        if not self._dirty:
+            return
+        
+        # Write a temporary file and rename it over the session file, so a crash
+        # mid-write leaves the previous snapshot intact instead of a truncated one
+        tmp_file = self.session_file.with_suffix('.json.tmp')
         try:
-            with open(self.session_file, 'w', encoding='utf-8') as f:
-                json.dump(self.current_session, f, indent=2, ensure_ascii=False)
+            with open(tmp_file, 'wb') as f:
+                f.write(_dumps(self.current_session))
+                # The snapshot must be on disk before the log it supersedes is removed
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.session_file)
+            self.wal_file.unlink(missing_ok=True)
+            self._dirty = False
         except Exception as e:
-            click.secho(f"Warning: Could not save session: {e}", fg="yellow")
+            _echo(f"Warning: Could not save session: {e}", fg="yellow")
     
     async def close(self):
         """Close the session and perform final cleanup."""
         
-        # Final save
+        # Final save of anything not yet flushed
+        self._cancel_pending_flush()
         await self._save_session_to_file()
         
         # Display session summary
         interactions_count = len(self.current_session.get("interactions", []))
         if interactions_count > 0:
-            click.echo(f"Session saved with {interactions_count} interactions.")
-            click.echo(f"Resume with: agentdk run <agent_path> --resume")
+            _echo(f"Session saved with {interactions_count} interactions.")
+            _echo(f"Resume with: agentdk run <agent_path> --resume")
         
     def get_session_context(self) -> List[Dict[str, str]]:
         """Get session context for memory-aware agents.
@@ -163,8 +386,10 @@ class SessionManager:
     def clear_session(self):
         """Clear the current session and remove session file."""
         
-        if self.session_file.exists():
-            self.session_file.unlink()
+        self._cancel_pending_flush()
+        self._dirty = False
+        self.session_file.unlink(missing_ok=True)
+        self.wal_file.unlink(missing_ok=True)
         
         self.current_session = {
             "agent_name": self.agent_name,
@@ -172,7 +397,32 @@ class SessionManager:
             "interactions": []
         }
         
-        click.echo(f"Session cleared for {self.agent_name}")
+        _echo(f"Session cleared for {self.agent_name}")
+    
+    def _read_parsed(self) -> Dict[str, Any]:
+        """Read and parse the session file, reusing the last parse if unchanged.
+        
+        Startup and status commands check the same file several times
+        (has_previous_session, get_session_info, load_session); the parse is
+        reused until the file's modification time or size changes. Callers must
+        not mutate the result; loading a session takes ownership of it.
+        
+        Raises:
+            json.JSONDecodeError: If JSON is invalid
+            FileNotFoundError: If session file doesn't exist
+        """
+        key = self._file_key()
+        cached = self._parse_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        data = _loads(self.session_file.read_bytes())
+        self._parse_cache = (key, data)
+        return data
+    
+    def _file_key(self) -> Tuple[int, int]:
+        """Identify the current session file contents by (mtime_ns, size)."""
+        st = self.session_file.stat()
+        return st.st_mtime_ns, st.st_size
     
     def _validate_session_format(self) -> bool:
         """Validate session file format and version compatibility.
@@ -180,63 +430,73 @@ class SessionManager:
         Returns:
             bool: True if format is valid and compatible
         """
-        if not self.session_file.exists():
+        try:
+            return self._is_compatible_session(self._read_parsed())
+        except (json.JSONDecodeError, KeyError, FileNotFoundError):
             return False
+    
+    def _is_compatible_session(self, data: Dict[str, Any]) -> bool:
+        """Check parsed session data for required fields and a supported version.
         
-        try:
-            with open(self.session_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            # Check required fields
-            required_fields = ["agent_name", "created_at", "interactions"]
-            if not all(field in data for field in required_fields):
-                return False
-            
-            # Check format version (if present)
-            file_version = data.get("format_version", "0.9")  # Default to old version
-            if file_version != self.format_version:
-                # Could add version migration logic here
-                return file_version in ["0.9", "1.0"]  # Support old and new versions
-            
-            return True
+        Args:
+            data: Parsed session file contents
             
-        except (json.JSONDecodeError, KeyError, FileNotFoundError):
+        Returns:
+            bool: True if format is valid and compatible
+        """
+        # Check required fields
+        required_fields = ["agent_name", "created_at", "interactions"]
+        if not all(field in data for field in required_fields):
             return False
+        
+        # Check format version (if present)
+        file_version = data.get("format_version", "0.9")  # Default to old version
+        if file_version != self.format_version:
+            # Could add version migration logic here
+            return file_version in ["0.9", "1.0"]  # Support old and new versions
+        
+        return True
     
-    def _load_and_validate_session(self) -> Dict[str, Any]:
-        """Load and validate session data with error handling.
+    def _read_validate_and_migrate(self) -> Tuple[bool, Dict[str, Any]]:
+        """Read the session file once, validate it and migrate old formats.
         
         Returns:
-            Dict containing session data
+            Tuple of (is_valid, session data); data is empty when invalid
             
         Raises:
-            json.JSONDecodeError: If JSON is invalid
-            KeyError: If required fields are missing
             FileNotFoundError: If session file doesn't exist
         """
-        with open(self.session_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        # Migrate old format to new format if needed
+        try:
+            data = self._read_parsed()
+            if not self._is_compatible_session(data):
+                return False, {}
+        except (json.JSONDecodeError, KeyError):
+            return False, {}
+        
+        # The caller keeps and mutates this dict as the live session
+        self._parse_cache = None
+        return True, self._migrate_session(data)
+    
+    def _migrate_session(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Migrate old format session data to the current format in place."""
         if "format_version" not in data:
             data["format_version"] = "0.9"
-            data["last_updated"] = data.get("created_at", datetime.now().isoformat())
+            data["last_updated"] = data.get("created_at") or datetime.now().isoformat()
             data["memory_state"] = {}
         
         return data
     
     async def _backup_corrupted_session(self):
         """Backup a corrupted session file for debugging."""
-        if not self.session_file.exists():
-            return
-        
         backup_file = self.session_dir / f"{self.agent_name}_session_corrupted_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
         try:
-            import shutil
-            shutil.copy2(self.session_file, backup_file)
-            click.echo(f"Corrupted session backed up to: {backup_file}")
+            # The file is replaced by a fresh session next, so move it rather than copy
+            os.replace(self.session_file, backup_file)
+            _echo(f"Corrupted session backed up to: {backup_file}")
+        except FileNotFoundError:
+            return
         except Exception as e:
-            click.secho(f"Could not backup corrupted session: {e}", fg="yellow")
+            _echo(f"Could not backup corrupted session: {e}", fg="yellow")
     
     def get_memory_state(self) -> Dict[str, Any]:
         """Get memory state from current session for agent restoration.
@@ -256,6 +516,7 @@ class SessionManager:
         
         self.current_session["memory_state"] = memory_state
         self.current_session["last_updated"] = datetime.now().isoformat()
+        self._dirty = True
     
     def has_previous_session(self) -> bool:
         """Check if a previous session exists and is valid.
@@ -272,22 +533,25 @@ class SessionManager:
             Dictionary containing session info
         """
         
-        if not self.session_file.exists():
-            return {"exists": False, "agent_name": self.agent_name}
-        
         try:
-            with open(self.session_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            # Stream the file unless an up-to-date parse is already at hand
+            cached = self._parse_cache
+            if ijson is not None and (cached is None or cached[0] != self._file_key()):
+                summary = _stream_session_summary(self.session_file)
+            else:
+                summary = _summarize_session(self._read_parsed())
             
             return {
                 "exists": True,
-                "agent_name": data.get("agent_name", self.agent_name),
-                "created_at": data.get("created_at"),
-                "last_updated": data.get("last_updated"),
-                "format_version": data.get("format_version", "unknown"),
-                "interaction_count": len(data.get("interactions", [])),
-                "has_memory_state": bool(data.get("memory_state")),
+                "agent_name": summary.get("agent_name", self.agent_name),
+                "created_at": summary.get("created_at"),
+                "last_updated": summary.get("last_updated"),
+                "format_version": summary.get("format_version", "unknown"),
+                "interaction_count": summary["interaction_count"],
+                "has_memory_state": summary["has_memory_state"],
             }
+        except FileNotFoundError:
+            return {"exists": False, "agent_name": self.agent_name}
         except Exception as e:
             return {
                 "exists": True,
@@ -6,16 +6,30 @@ specifying prompts, LLMs, MCP configs, and tools through a fluent API.
 """
 
 from typing import Any, Dict, Optional, List, Union, Callable
+from functools import lru_cache
 from pathlib import Path
-import inspect
+import os
+import stat
 
 from ..agent.agent_interface import SubAgent, SubAgentWithMCP, SubAgentWithoutMCP, create_memory_session
 from ..core.logging_config import get_logger
 
 
+@lru_cache(maxsize=128)
+def _read_prompt_file(path: str, mtime_ns: int) -> str:
+    """Read a prompt file, cached per path and modification time.
+
+    Many agents are often built from the same prompt file; the file is read
+    once and re-read only after it changes (``mtime_ns`` is part of the key).
+    """
+    return Path(path).read_text(encoding='utf-8')
+
+
 class AgentBuilder:
     """Fluent API builder for creating agents without class definitions."""
 
+    __slots__ = ('_config', '_logger')
+
     def __init__(self) -> None:
         """Initialize the agent builder."""
         self._config: Dict[str, Any] = {}
@@ -126,12 +140,9 @@ class AgentBuilder:
         if 'llm' not in self._config or self._config['llm'] is None:
             raise ValueError("LLM is required. Use .with_llm(llm) to set it.")
 
-        # Resolve the prompt
-        resolved_prompt = self._resolve_prompt()
-        self._config['resolved_prompt'] = resolved_prompt
-
-        # Create and return concrete agent
-        return self._create_agent()
+        # Resolve the prompt and create the concrete agent; the resolved prompt
+        # is passed along rather than stored, so build() leaves the config as set
+        return self._create_agent(self._resolve_prompt())
 
     def _resolve_prompt(self) -> str:
         """Resolve prompt from various input types.
@@ -150,10 +161,21 @@ class AgentBuilder:
 
         # Handle string/Path
         if isinstance(prompt_input, (str, Path)):
-            path_obj = Path(prompt_input)
-            # Check if it's a file path that exists
-            if path_obj.exists() and path_obj.is_file():
-                return path_obj.read_text(encoding='utf-8')
+            # Multi-line strings are prompt literals, not paths; skip the stat
+            if isinstance(prompt_input, str) and '\n' in prompt_input:
+                return prompt_input
+
+            # Check if it's a file path that exists: a single os.stat both tests
+            # existence and yields the cache key, without building a Path for
+            # what is usually a literal (names the OS rejects, e.g. too long,
+            # are literals too)
+            path = os.fspath(prompt_input)
+            try:
+                st = os.stat(path)
+            except (OSError, ValueError):
+                st = None
+            if st is not None and stat.S_ISREG(st.st_mode):
+                return _read_prompt_file(path, st.st_mtime_ns)
             else:
                 # Regular string literal
                 return str(prompt_input)
@@ -161,9 +183,12 @@ class AgentBuilder:
         # Fallback: convert to string
         return str(prompt_input)
 
-    def _create_agent(self) -> SubAgent:
+    def _create_agent(self, resolved_prompt: str) -> SubAgent:
         """Create concrete agent instance with dependency injection.
         
+        Args:
+            resolved_prompt: System prompt resolved by _resolve_prompt()
+            
         Returns:
             SubAgentWithMCP or SubAgentWithoutMCP instance
         """
@@ -183,7 +208,7 @@ class AgentBuilder:
             'llm': self._config['llm'],
             'memory_session': memory_session,  # Dependency injection
             'name': self._config.get('name'),
-            'prompt': self._config.get('resolved_prompt')
+            'prompt': resolved_prompt
         }
         
         if has_mcp:
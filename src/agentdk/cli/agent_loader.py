@@ -10,6 +10,23 @@ import click
 # Don't import get_llm at module level to avoid circular imports and dependency issues
 
 
+class _MockLLM:
+    """Stand-in LLM used when no real provider is available."""
+
+    def invoke(self, input_data):
+        if isinstance(input_data, dict):
+            input_text = input_data.get('input', str(input_data))
+        else:
+            input_text = str(input_data)
+        return {"output": f"Mock response to: {input_text}"}
+
+    def __call__(self, input_text):
+        return f"Mock response to: {input_text}"
+
+    def bind(self, **kwargs):
+        return self
+
+
 class AgentLoader:
     """Loads agents from Python files and directories using various patterns."""
     
@@ -183,18 +200,4 @@ class AgentLoader:
     
     def _create_mock_llm(self):
         """Create a mock LLM for testing when no real LLM is available."""
-        class MockLLM:
-            def invoke(self, input_data):
-                if isinstance(input_data, dict):
-                    input_text = input_data.get('input', str(input_data))
-                else:
-                    input_text = str(input_data)
-                return {"output": f"Mock response to: {input_text}"}
-            
-            def __call__(self, input_text):
-                return f"Mock response to: {input_text}"
-            
-            def bind(self, **kwargs):
-                return self
-        
-        return MockLLM()
\ No newline at end of file
+        return _MockLLM()
\ No newline at end of file
@@ -1,21 +1,39 @@
 #!/usr/bin/env python3
 """AgentDK CLI - Command line interface for running agents."""
 
-import argparse
+import functools
 import os
 import sys
 import signal
-import asyncio
 from pathlib import Path
-from typing import Optional
+from types import SimpleNamespace
+from typing import Any, Dict, Optional, Tuple
 
 from agentdk.core.logging_config import get_logger, set_log_level
 
 
 logger = get_logger(__name__)
 
-# Global shutdown event for coordinating signal handling with async code
-shutdown_event = asyncio.Event()
+# Global shutdown event for coordinating signal handling with async code; created
+# on first use so that importing the CLI does not import asyncio
+_shutdown_event = None
+
+# Files or directories marking a project root for agent path setup
+_PROJECT_INDICATORS = frozenset({"pyproject.toml", "setup.py", "setup.cfg", ".git", "requirements.txt"})
+
+# Project root discovered for each agent directory
+_project_root_cache: Dict[Path, Path] = {}
+
+# Executed agent modules keyed by resolved file path, with the mtime_ns they were loaded at
+_agent_module_cache: Dict[Path, Tuple[int, Any]] = {}
+
+# Session file names are "<agent_name>_session.json"
+_SESSION_FILE_SUFFIX = "_session.json"
+
+# Shadow of sys.path for O(1) membership tests, with the list and length it mirrors
+_sys_path_set = set(sys.path)
+_sys_path_ref = sys.path
+_sys_path_len = len(sys.path)
 
 
 class GlobalCLIHistory:
@@ -134,9 +152,28 @@ class GlobalCLIHistory:
         self.save_commands()
 
 
+def _get_shutdown_event():
+    """Return the global shutdown event, creating it on first use."""
+    global _shutdown_event
+    if _shutdown_event is None:
+        import asyncio
+        _shutdown_event = asyncio.Event()
+    return _shutdown_event
+
+
+def __getattr__(name: str) -> Any:
+    """Create ``shutdown_event`` lazily for ``from agentdk.cli.main import shutdown_event``."""
+    if name == "shutdown_event":
+        return _get_shutdown_event()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def signal_handler(signum, frame):
     """Handle interrupt signals gracefully by setting shutdown event."""
+    import asyncio
+    
     logger.info("Received interrupt signal, initiating graceful shutdown...")
+    shutdown_event = _get_shutdown_event()
     # Use set_result on a future to signal from sync context to async context
     try:
         # Try to set the event if there's an active loop
@@ -147,19 +184,55 @@ def signal_handler(signum, frame):
         shutdown_event.set()
 
 
-def setup_dynamic_path(agent_file: Path):
-    """Dynamically set up Python path for agent loading."""
-    # Find the project root by looking for common project indicators
-    current_dir = agent_file.parent.resolve()
+def _has_project_indicator(directory: Path) -> bool:
+    """Check a directory for project indicators with a single listing."""
+    try:
+        with os.scandir(directory) as entries:
+            return any(entry.name in _PROJECT_INDICATORS for entry in entries)
+    except OSError:
+        return False
+
+
+def _find_project_root(current_dir: Path) -> Path:
+    """Find the project root for a directory, caching the result per directory."""
+    project_root = _project_root_cache.get(current_dir)
+    if project_root is not None:
+        return project_root
+
     project_root = current_dir
-    
     # Walk up the directory tree to find project root
     while project_root.parent != project_root:
-        # Check for common project indicators
-        indicators = ["pyproject.toml", "setup.py", "setup.cfg", ".git", "requirements.txt"]
-        if any((project_root / indicator).exists() for indicator in indicators):
+        if _has_project_indicator(project_root):
             break
         project_root = project_root.parent
+
+    _project_root_cache[current_dir] = project_root
+    return project_root
+
+
+def _add_to_sys_path(paths) -> None:
+    """Prepend paths missing from sys.path, using a set for membership tests."""
+    global _sys_path_set, _sys_path_ref, _sys_path_len
+
+    # Rebuild the shadow set if sys.path was replaced or resized elsewhere
+    if sys.path is not _sys_path_ref or len(sys.path) != _sys_path_len:
+        _sys_path_set = set(sys.path)
+        _sys_path_ref = sys.path
+
+    # Prepend all new paths with one slice assignment instead of shifting the
+    # list per path; reversed so the result matches inserting each at index 0
+    new_paths = [path for path in dict.fromkeys(paths) if path not in _sys_path_set]
+    if new_paths:
+        sys.path[:0] = new_paths[::-1]
+        _sys_path_set.update(new_paths)
+    _sys_path_len = len(sys.path)
+
+
+def setup_dynamic_path(agent_file: Path):
+    """Dynamically set up Python path for agent loading."""
+    # Find the project root by looking for common project indicators
+    current_dir = agent_file.parent.resolve()
+    project_root = _find_project_root(current_dir)
     
     # Add all necessary paths to sys.path
     paths_to_add = [
@@ -174,9 +247,7 @@ def setup_dynamic_path(agent_file: Path):
         paths_to_add.append(str(temp_dir))
     
     # Add paths if not already present
-    for path in paths_to_add:
-        if path not in sys.path:
-            sys.path.insert(0, path)
+    _add_to_sys_path(paths_to_add)
     
     logger.debug(f"Added paths to sys.path: {paths_to_add}")
     return project_root
@@ -185,57 +256,98 @@ def setup_dynamic_path(agent_file: Path):
 def load_agent_from_file(agent_file: Path):
     """Load an agent from a Python file with dynamic path resolution."""
     import importlib.util
-    import inspect
+    import types
     
-    # Resolve the file path
-    agent_file = agent_file.resolve()
-    if not agent_file.exists():
-        raise FileNotFoundError(f"Agent file not found: {agent_file}")
+    # Make the path absolute without resolving symlinks, which would lstat
+    # every component; setup_dynamic_path resolves the directory it needs
+    if not agent_file.is_absolute():
+        agent_file = agent_file.absolute()
+    try:
+        mtime_ns = agent_file.stat().st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Agent file not found: {agent_file}") from None
     
     # Set up dynamic Python path
     project_root = setup_dynamic_path(agent_file)
     logger.info(f"Loading agent from: {agent_file}")
     logger.debug(f"Project root detected: {project_root}")
     
-    try:
-        # Load the module from file
-        spec = importlib.util.spec_from_file_location("agent_module", agent_file)
-        if spec is None or spec.loader is None:
-            raise ImportError(f"Could not create module spec from {agent_file}")
-        
-        module = importlib.util.module_from_spec(spec)
-        
-        # Execute the module
-        spec.loader.exec_module(module)
+    # Reuse the module if this file was already executed and has not changed since
+    cached = _agent_module_cache.get(agent_file)
+    if cached is not None and cached[0] == mtime_ns:
+        module = cached[1]
+        logger.debug("Reusing loaded agent module: %s", agent_file)
+    else:
+        try:
+            # Load the module from file
+            spec = importlib.util.spec_from_file_location("agent_module", agent_file)
+            if spec is None or spec.loader is None:
+                raise ImportError(f"Could not create module spec from {agent_file}")
+            
+            module = importlib.util.module_from_spec(spec)
+            
+            # Execute the module
+            spec.loader.exec_module(module)
+            
+        except Exception as e:
+            logger.error("Failed to load module: %s", e)
+            raise ImportError(f"Could not load agent module from {agent_file}: {e}") from e
         
-    except Exception as e:
-        logger.error(f"Failed to load module: {e}")
-        raise ImportError(f"Could not load agent module from {agent_file}: {e}") from e
+        _agent_module_cache[agent_file] = (mtime_ns, module)
     
     # Look for agent classes or factory functions
     agent_candidates = []
     
-    for name, obj in inspect.getmembers(module):
-        if inspect.isclass(obj):
+    # Read the module namespace directly; inspect.getmembers would sort dir()
+    # and getattr every name. Private names (module dunders, imports bound as
+    # _x) are never candidates, so they are skipped before any other check.
+    for name, obj in vars(module).items():
+        if name.startswith('_'):
+            continue
+        if isinstance(obj, type):
             # Check if it's an agent class (has query method)
-            if hasattr(obj, 'query') and not name.startswith('_'):
+            if hasattr(obj, 'query'):
                 agent_candidates.append((name, obj))
-        elif inspect.isfunction(obj) and name.startswith('create_'):
+        elif isinstance(obj, types.FunctionType) and name.startswith('create_'):
             # Factory function
             agent_candidates.append((name, obj))
     
     if not agent_candidates:
         raise ValueError(f"No agent class or factory function found in {agent_file}")
     
-    # Prefer classes over functions, and shorter names
-    agent_candidates.sort(key=lambda x: (not inspect.isclass(x[1]), len(x[0])))
-    
-    name, agent_cls_or_func = agent_candidates[0]
+    # Prefer classes over functions, and shorter names (then by name, as before);
+    # only the best candidate is needed, so take the minimum instead of sorting
+    name, agent_cls_or_func = min(
+        agent_candidates, key=lambda x: (not isinstance(x[1], type), len(x[0]), x[0])
+    )
     logger.info(f"Found agent: {name}")
     
     return agent_cls_or_func
 
 
+@functools.lru_cache(maxsize=64)
+def _accepted_params(agent_cls_or_func) -> Optional[frozenset]:
+    """Return the keyword names a class or factory accepts, cached per callable.
+
+    Returns None when the callable takes **kwargs or its signature cannot be read,
+    meaning every keyword should be passed through.
+    """
+    import inspect
+
+    try:
+        parameters = inspect.signature(agent_cls_or_func).parameters.values()
+    except (TypeError, ValueError):
+        return None
+
+    accepted = set()
+    for param in parameters:
+        if param.kind is inspect.Parameter.VAR_KEYWORD:
+            return None
+        if param.kind is not inspect.Parameter.POSITIONAL_ONLY:
+            accepted.add(param.name)
+    return frozenset(accepted)
+
+
 def create_agent_instance(agent_cls_or_func, agent_file: Path, **kwargs):
     """Create an agent instance from class or factory function."""
     import inspect
@@ -250,6 +362,11 @@ def create_agent_instance(agent_cls_or_func, agent_file: Path, **kwargs):
             logger.warning(f"No LLM available: {e}")
             logger.warning("Set OPENAI_API_KEY or ANTHROPIC_API_KEY environment variable")
     
+    # Drop keywords the target does not accept instead of failing on them
+    accepted = _accepted_params(agent_cls_or_func)
+    if accepted is not None:
+        kwargs = {key: value for key, value in kwargs.items() if key in accepted}
+    
     if inspect.isclass(agent_cls_or_func):
         # Try to create instance
         try:
@@ -274,6 +391,7 @@ async def run_agent_interactive(agent, resume: bool = False):
     from ..agent.session_manager import SessionManager
     
     # Clear any previous shutdown state
+    shutdown_event = _get_shutdown_event()
     shutdown_event.clear()
     
     logger.info("Starting interactive mode (Ctrl+C to exit)")
@@ -380,11 +498,13 @@ async def get_user_input_with_history(history_manager: GlobalCLIHistory):
     Returns:
         User input string or None if shutdown requested
     """
+    import asyncio
     import sys
     import select
     import termios
     import tty
     
+    shutdown_event = _get_shutdown_event()
     try:
         if not sys.stdin.isatty():
             # Non-interactive mode (pipe/file input) - read all at once
@@ -496,9 +616,11 @@ async def get_user_input_with_history(history_manager: GlobalCLIHistory):
 
 async def get_user_input_basic():
     """Basic user input fallback for systems without termios."""
+    import asyncio
     import sys
     import select
     
+    shutdown_event = _get_shutdown_event()
     try:
         # Display prompt
         sys.stdout.write(">>> ")
@@ -562,9 +684,26 @@ async def cleanup_and_exit(session_manager, history_manager: GlobalCLIHistory =
     sys.exit(0)
 
 
+def _scan_session_files(session_dir: Path, suffix: str = _SESSION_FILE_SUFFIX) -> list:
+    """List (agent_name, path) for session files with a single scandir pass.
+    
+    Args:
+        session_dir: Directory holding the session files
+        suffix: File name suffix following the agent name
+    
+    Raises:
+        FileNotFoundError: If the session directory does not exist
+    """
+    with os.scandir(session_dir) as entries:
+        return [
+            (entry.name[:-len(suffix)], Path(entry.path)) for entry in entries
+            if entry.name.endswith(suffix) and entry.is_file()
+        ]
+
+
 async def handle_sessions_command(args):
     """Handle sessions subcommands."""
-    from ..agent.session_manager import SessionManager
+    from ..agent.session_manager import SessionManager, WAL_SUFFIX, _default_session_dir
     import click
     
     if args.sessions_command == "status":
@@ -589,20 +728,20 @@ async def handle_sessions_command(args):
         
     elif args.sessions_command == "list":
         # List all sessions
-        session_dir = Path.home() / ".agentdk" / "sessions"
-        if not session_dir.exists():
+        session_dir = _default_session_dir()
+        try:
+            session_files = _scan_session_files(session_dir)
+        except FileNotFoundError:
             click.echo("No sessions directory found")
             return
         
-        session_files = list(session_dir.glob("*_session.json"))
         if not session_files:
             click.echo("No sessions found")
             return
         
         click.echo("Available Sessions:")
-        for session_file in session_files:
-            agent_name = session_file.stem.replace("_session", "")
-            session_manager = SessionManager(agent_name)
+        for agent_name, _ in session_files:
+            session_manager = SessionManager(agent_name, session_dir=session_dir)
             session_info = session_manager.get_session_info()
             
             status = "✓" if not session_info.get("corrupted", False) else "✗"
@@ -615,18 +754,25 @@ async def handle_sessions_command(args):
         # Clear sessions
         if args.all:
             # Clear all sessions
-            session_dir = Path.home() / ".agentdk" / "sessions"
-            if session_dir.exists():
-                session_files = list(session_dir.glob("*_session.json"))
-                for session_file in session_files:
+            session_dir = _default_session_dir()
+            try:
+                session_files = _scan_session_files(session_dir)
+            except FileNotFoundError:
+                click.echo("No sessions directory found")
+            else:
+                for agent_name, session_file in session_files:
                     try:
                         session_file.unlink()
-                        click.echo(f"Cleared session: {session_file.stem.replace('_session', '')}")
+                        click.echo(f"Cleared session: {agent_name}")
                     except Exception as e:
                         click.secho(f"Failed to clear {session_file.name}: {e}", fg="red")
+                # Interaction logs would otherwise be replayed into the next session
+                for _, wal_file in _scan_session_files(session_dir, WAL_SUFFIX):
+                    try:
+                        wal_file.unlink()
+                    except Exception as e:
+                        click.secho(f"Failed to clear {wal_file.name}: {e}", fg="red")
                 click.echo(f"Cleared {len(session_files)} sessions")
-            else:
-                click.echo("No sessions directory found")
         elif args.agent_name:
             # Clear specific agent session
             session_manager = SessionManager(args.agent_name)
@@ -642,10 +788,51 @@ async def handle_sessions_command(args):
         click.echo("Invalid sessions command")
 
 
-def main():
-    """Main CLI entry point."""
-    # Note: Signal handlers are managed by the MCP system in persistent_mcp.py
-    # We coordinate with shutdown_event which gets set by the MCP signal handler
+def _add_run_arguments(run_parser) -> None:
+    """Add the ``run`` command's arguments."""
+    run_parser.add_argument(
+        "agent_file",
+        type=Path,
+        help="Path to Python file containing agent"
+    )
+    run_parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Resume from previous session (default: start with fresh memory)"
+    )
+
+
+def _add_sessions_arguments(sessions_parser) -> None:
+    """Add the ``sessions`` command's subcommands and their arguments."""
+    sessions_subparsers = sessions_parser.add_subparsers(dest="sessions_command", help="Session commands")
+    
+    # Status command
+    status_parser = sessions_subparsers.add_parser("status", help="Show session status")
+    status_parser.add_argument("agent_name", help="Agent name to check")
+    
+    # List command  
+    list_parser = sessions_subparsers.add_parser("list", help="List all sessions")
+    
+    # Clear command
+    clear_parser = sessions_subparsers.add_parser("clear", help="Clear sessions")
+    clear_parser.add_argument("agent_name", nargs="?", help="Agent name to clear")
+    clear_parser.add_argument("--all", action="store_true", help="Clear all sessions")
+
+
+# Subcommands with their help text and the function adding their arguments
+_SUBCOMMANDS = {
+    "run": ("Run an agent", _add_run_arguments),
+    "sessions": ("Manage agent sessions", _add_sessions_arguments),
+}
+
+
+def _build_parser(argv: list):
+    """Build the argparse parser, used for help, errors and uncommon forms.
+    
+    Every subcommand is registered so top-level help lists them, but only the
+    one named in ``argv`` gets its arguments and nested subparsers built.
+    """
+    import argparse
     
     parser = argparse.ArgumentParser(
         description="AgentDK CLI - Run intelligent agents",
@@ -672,40 +859,76 @@ Examples:
     
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
     
-    # Run command
-    run_parser = subparsers.add_parser("run", help="Run an agent")
-    run_parser.add_argument(
-        "agent_file",
-        type=Path,
-        help="Path to Python file containing agent"
-    )
-    run_parser.add_argument(
-        "--resume",
-        action="store_true",
-        help="Resume from previous session (default: start with fresh memory)"
-    )
-    
-    # Sessions command
-    sessions_parser = subparsers.add_parser("sessions", help="Manage agent sessions")
-    sessions_subparsers = sessions_parser.add_subparsers(dest="sessions_command", help="Session commands")
+    command = next((arg for arg in argv if arg in _SUBCOMMANDS), None)
+    for name, (help_text, add_arguments) in _SUBCOMMANDS.items():
+        subparser = subparsers.add_parser(name, help=help_text)
+        if name == command:
+            add_arguments(subparser)
     
-    # Status command
-    status_parser = sessions_subparsers.add_parser("status", help="Show session status")
-    status_parser.add_argument("agent_name", help="Agent name to check")
+    return parser
+
+
+def _fast_parse_args(argv: list) -> Optional[SimpleNamespace]:
+    """Parse the common command forms without building the argparse tree.
     
-    # List command  
-    list_parser = sessions_subparsers.add_parser("list", help="List all sessions")
+    Handles ``run FILE [--resume]``, ``sessions list``, ``sessions status NAME``
+    and ``sessions clear [NAME] [--all]``. Returns None for anything else
+    (help, --log-level, unknown or malformed arguments), which is left to
+    argparse so usage and error output stay unchanged.
+    """
+    if not argv:
+        return None
+    command, rest = argv[0], argv[1:]
     
-    # Clear command
-    clear_parser = sessions_subparsers.add_parser("clear", help="Clear sessions")
-    clear_parser.add_argument("agent_name", nargs="?", help="Agent name to clear")
-    clear_parser.add_argument("--all", action="store_true", help="Clear all sessions")
+    if command == "run":
+        flags = [arg for arg in rest if arg.startswith("-")]
+        positionals = [arg for arg in rest if not arg.startswith("-")]
+        if len(positionals) != 1 or any(flag != "--resume" for flag in flags):
+            return None
+        return SimpleNamespace(
+            log_level="INFO", command="run",
+            agent_file=Path(positionals[0]), resume=bool(flags),
+        )
+    
+    if command == "sessions" and rest:
+        sessions_command, rest = rest[0], rest[1:]
+        if sessions_command == "list" and not rest:
+            return SimpleNamespace(log_level="INFO", command="sessions", sessions_command="list")
+        if sessions_command == "status" and len(rest) == 1 and not rest[0].startswith("-"):
+            return SimpleNamespace(
+                log_level="INFO", command="sessions",
+                sessions_command="status", agent_name=rest[0],
+            )
+        if sessions_command == "clear":
+            flags = [arg for arg in rest if arg.startswith("-")]
+            positionals = [arg for arg in rest if not arg.startswith("-")]
+            if len(positionals) > 1 or any(flag != "--all" for flag in flags):
+                return None
+            return SimpleNamespace(
+                log_level="INFO", command="sessions", sessions_command="clear",
+                agent_name=positionals[0] if positionals else None, all=bool(flags),
+            )
+    
+    return None
+
+
+def main():
+    """Main CLI entry point."""
+    # Note: Signal handlers are managed by the MCP system in persistent_mcp.py
+    # We coordinate with shutdown_event which gets set by the MCP signal handler
     
-    args = parser.parse_args()
+    # Common invocations skip building the argparse tree entirely
+    args = _fast_parse_args(sys.argv[1:])
+    if args is None:
+        parser = _build_parser(sys.argv[1:])
+        args = parser.parse_args()
     
     # Set up logging
     set_log_level(args.log_level)
     
+    # asyncio is only needed once a command actually runs
+    import asyncio
+    
     if not args.command:
         parser.print_help()
         return
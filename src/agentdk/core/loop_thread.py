@@ -0,0 +1,170 @@
+"""Dedicated background event loop for AgentDK.
+
+Synchronous entry points (``SubAgent.query``/``invoke``) used to spin up a new
+event loop per call via ``asyncio.run`` and relied on ``nest_asyncio`` to survive
+nested loops. This module instead runs a single long-lived event loop in a daemon
+thread and lets sync code submit coroutines to it with
+``asyncio.run_coroutine_threadsafe``. Persistent MCP sessions opened on this loop
+stay bound to it for the lifetime of the process.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Coroutine, Optional, TypeVar
+
+from .logging_config import get_logger
+
+
+T = TypeVar("T")
+
+logger = get_logger()
+
+
+class AsyncLoopThread:
+    """Runs an asyncio event loop forever in a background daemon thread.
+
+    The loop is started lazily on first use, so importing AgentDK never spawns
+    a thread by itself.
+    """
+
+    def __init__(self, name: str = "agentdk-loop") -> None:
+        """Initialize the loop thread.
+
+        Args:
+            name: Name given to the background thread
+        """
+        self.name = name
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def start(self) -> asyncio.AbstractEventLoop:
+        """Start the background loop if it is not running yet.
+
+        Returns:
+            The running background event loop
+        """
+        with self._lock:
+            if self.is_running:
+                return self._loop
+
+            loop = asyncio.new_event_loop()
+            ready = threading.Event()
+            thread = threading.Thread(
+                target=self._run_forever, args=(loop, ready), name=self.name, daemon=True
+            )
+            thread.start()
+            ready.wait()
+
+            self._loop = loop
+            self._thread = thread
+            logger.debug("Started background event loop thread: %s", self.name)
+            return loop
+
+    @staticmethod
+    def _run_forever(loop: asyncio.AbstractEventLoop, ready: threading.Event) -> None:
+        """Thread target: run the loop until stop() is requested."""
+        asyncio.set_event_loop(loop)
+        loop.call_soon(ready.set)
+        try:
+            loop.run_forever()
+        finally:
+            loop.close()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """Get the background event loop, starting it on first access."""
+        return self.start()
+
+    @property
+    def is_running(self) -> bool:
+        """Check if the background loop thread is alive."""
+        return (
+            self._loop is not None
+            and self._thread is not None
+            and self._thread.is_alive()
+        )
+
+    def in_loop_thread(self) -> bool:
+        """Check if the caller is running on the background loop thread."""
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    def submit(self, coro: Coroutine[Any, Any, T]) -> "Future[T]":
+        """Schedule a coroutine on the background loop.
+
+        Args:
+            coro: Coroutine to execute
+
+        Returns:
+            concurrent.futures.Future resolving to the coroutine result
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro: Coroutine[Any, Any, T], timeout: Optional[float] = None) -> T:
+        """Run a coroutine on the background loop and block for its result.
+
+        When called from the loop thread itself (e.g. a sync callback invoked by a
+        coroutine already running on the loop) blocking would deadlock, so the
+        coroutine is driven re-entrantly on the same loop via nest_asyncio.
+
+        Args:
+            coro: Coroutine to execute
+            timeout: Optional timeout in seconds
+
+        Returns:
+            Result of the coroutine
+        """
+        if self.in_loop_thread():
+            import nest_asyncio
+
+            nest_asyncio.apply(self._loop)
+            return self._loop.run_until_complete(coro)
+
+        return self.submit(coro).result(timeout)
+
+    def stop(self) -> None:
+        """Stop the background loop and wait for the thread to exit."""
+        with self._lock:
+            if not self.is_running:
+                return
+            loop, thread = self._loop, self._thread
+            loop.call_soon_threadsafe(loop.stop)
+            if threading.current_thread() is not thread:
+                thread.join(timeout=5.0)
+            self._loop = None
+            self._thread = None
+            logger.debug("Stopped background event loop thread: %s", self.name)
+
+
+_loop_thread = AsyncLoopThread()
+
+
+def get_loop_thread() -> AsyncLoopThread:
+    """Get the process-wide AgentDK loop thread."""
+    return _loop_thread
+
+
+def submit(coro: Coroutine[Any, Any, T]) -> "Future[T]":
+    """Schedule a coroutine on the shared AgentDK event loop.
+
+    Args:
+        coro: Coroutine to execute
+
+    Returns:
+        concurrent.futures.Future resolving to the coroutine result
+    """
+    return _loop_thread.submit(coro)
+
+
+def run_sync(coro: Coroutine[Any, Any, T], timeout: Optional[float] = None) -> T:
+    """Run a coroutine on the shared AgentDK event loop and wait for the result.
+
+    Args:
+        coro: Coroutine to execute
+        timeout: Optional timeout in seconds
+
+    Returns:
+        Result of the coroutine
+    """
+    return _loop_thread.run(coro, timeout)
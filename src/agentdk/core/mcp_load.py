@@ -4,6 +4,7 @@ This module provides shared utilities for loading and validating MCP server conf
 Implements the agent-level config loading strategy with fallback paths.
 """
 
+import functools
 import json
 import os
 from pathlib import Path
@@ -14,6 +15,25 @@ from ..exceptions import MCPConfigError
 from .logging_config import get_logger
 
 
+@functools.lru_cache(maxsize=None)
+def get_class_dir(cls: type) -> Optional[Path]:
+    """Get the directory of the file that defines a class, cached per class.
+
+    ``inspect.getfile`` walks module metadata on every call; the answer only
+    depends on the class, so it is computed once per agent subclass.
+
+    Args:
+        cls: Class to locate
+
+    Returns:
+        Directory containing the class's source file, or None if unknown
+    """
+    try:
+        return Path(inspect.getfile(cls)).parent
+    except (OSError, TypeError):
+        return None
+
+
 def get_mcp_config(agent_instance: Any) -> Dict[str, Any]:
     """Load MCP configuration for an agent with fallback strategy.
     
@@ -68,13 +88,9 @@ def _get_config_search_paths(agent_instance: Any) -> List[Optional[Path]]:
         paths.append(Path(agent_instance._mcp_config_path))
     
     # 2. Agent location + mcp_config.json (primary default)
-    try:
-        agent_file = inspect.getfile(agent_instance.__class__)
-        agent_dir = Path(agent_file).parent
+    agent_dir = get_class_dir(agent_instance.__class__)
+    if agent_dir is not None:
         paths.append(agent_dir / "mcp_config.json")
-    except (OSError, TypeError):
-        # Fallback if agent file location can't be determined
-        pass
     
     # 3. Current working directory
     paths.append(Path.cwd() / "mcp_config.json")
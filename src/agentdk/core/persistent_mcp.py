@@ -9,7 +9,8 @@ import asyncio
 import atexit
 import signal
 import logging
-from typing import Any, Dict, List, Optional, TYPE_CHECKING
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Coroutine, Dict, List, Optional, Tuple, TYPE_CHECKING
 from pathlib import Path
 
 if TYPE_CHECKING:
@@ -18,10 +19,17 @@ if TYPE_CHECKING:
     from mcp import ClientSession
 
 from .logging_config import get_logger
+from .tool_cache import ToolCache, hash_server_config
 
 
 logger = get_logger()
 
+# Maximum number of concurrent sessions kept open per MCP server
+DEFAULT_SESSION_POOL_SIZE = 4
+
+# Seconds an extra pooled session may sit idle before it is closed
+DEFAULT_SESSION_IDLE_TIMEOUT = 300.0
+
 
 class _PersistentSessionContext:
     """Manages a single persistent session context for one MCP server.
@@ -41,43 +49,58 @@ class _PersistentSessionContext:
         self.server_name = server_name
         self.session: Optional["ClientSession"] = None
         self._context_manager: Optional[Any] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
         self._is_active = False
+        self.last_used = 0.0
+        # Result of the list_tools() call made while validating the session
+        self.listed_tools: Optional[Any] = None
 
-    async def enter(self) -> None:
+    async def enter(self, validate: bool = True) -> None:
         """Enter the async context manager and keep it alive.
 
         This method enters the async context manager provided by the MCP client
         and stores both the session and context manager for later cleanup.
 
+        Args:
+            validate: List the server's tools to check the session works. Skipped
+                when the tool definitions are already cached, saving the RPC.
+
         Raises:
             Exception: If session creation or initialization fails
         """
         try:
-            logger.debug(f"Creating persistent session for server: {self.server_name}")
+            logger.debug("Creating persistent session for server: %s", self.server_name)
 
             # Create the async context manager
             self._context_manager = self.mcp_client.session(self.server_name)
 
             # Enter the context and keep it alive
             self.session = await self._context_manager.__aenter__()
+            self._loop = asyncio.get_running_loop()
             
             # Validate session is working by trying to initialize it
-            try:
-                # Try to list tools as a basic connectivity test
-                await self.session.list_tools()
-                logger.debug(f"Session validation successful for {self.server_name}")
-            except Exception as validation_error:
-                logger.warning(
-                    f"Session created but validation failed for {self.server_name}: {validation_error}"
-                )
-                # Continue anyway - some servers might not support list_tools immediately
+            if validate:
+                try:
+                    # Try to list tools as a basic connectivity test; the result is
+                    # kept so tool discovery does not list them again
+                    self.listed_tools = await self.session.list_tools()
+                    logger.debug("Session validation successful for %s", self.server_name)
+                except Exception as validation_error:
+                    logger.warning(
+                        "Session created but validation failed for %s: %s",
+                        self.server_name,
+                        validation_error,
+                    )
+                    # Continue anyway - some servers might not support list_tools immediately
             
             self._is_active = True
-            logger.debug(f"Persistent session created for server: {self.server_name}")
+            logger.debug("Persistent session created for server: %s", self.server_name)
 
-        except Exception as e:
+        except BaseException as e:
+            # Cancellation (e.g. an init timeout) must close the half-open
+            # session too, not just ordinary failures
             logger.error(
-                f"Failed to create persistent session for {self.server_name}: {e}"
+                "Failed to create persistent session for %s: %r", self.server_name, e
             )
             await self._cleanup_on_error()
             raise
@@ -93,19 +116,21 @@ class _PersistentSessionContext:
 
         try:
             logger.debug(
-                f"Cleaning up persistent session for server: {self.server_name}"
+                "Cleaning up persistent session for server: %s", self.server_name
             )
 
             # Properly exit the async context manager
             await self._context_manager.__aexit__(None, None, None)
 
         except Exception as e:
-            logger.warning(f"Error during session cleanup for {self.server_name}: {e}")
+            logger.warning("Error during session cleanup for %s: %s", self.server_name, e)
         finally:
             self.session = None
             self._context_manager = None
+            self._loop = None
             self._is_active = False
-            logger.debug(f"Persistent session cleaned up for server: {self.server_name}")
+            self.listed_tools = None
+            logger.debug("Persistent session cleaned up for server: %s", self.server_name)
 
     async def _cleanup_on_error(self) -> None:
         """Clean up resources after an error during session creation."""
@@ -117,26 +142,182 @@ class _PersistentSessionContext:
             except Exception as cleanup_error:
                 cleanup_errors.append(str(cleanup_error))
                 logger.warning(
-                    f"Error during error cleanup for {self.server_name}: {cleanup_error}"
+                    "Error during error cleanup for %s: %s",
+                    self.server_name,
+                    cleanup_error,
                 )
 
         # Reset state regardless of cleanup success
         self.session = None
         self._context_manager = None
+        self._loop = None
         self._is_active = False
         
         # Log summary if there were cleanup errors
         if cleanup_errors:
             logger.warning(
-                f"Session cleanup completed with {len(cleanup_errors)} errors for {self.server_name}"
+                "Session cleanup completed with %d errors for %s",
+                len(cleanup_errors),
+                self.server_name,
             )
 
+    async def call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Any:
+        """Call a tool on the persistent session from any event loop.
+
+        The underlying MCP streams are bound to the loop that entered the session.
+        Calls made from a different loop are dispatched back to the owning loop
+        (normally the shared AgentDK loop thread) instead of touching the streams
+        from the wrong loop.
+
+        Args:
+            tool_name: Name of the MCP tool
+            arguments: Tool arguments
+
+        Returns:
+            The MCP tool call result
+        """
+        coro = self.session.call_tool(tool_name, arguments)
+        owner_loop = self._loop
+        if (
+            owner_loop is None
+            or not owner_loop.is_running()
+            or owner_loop is asyncio.get_running_loop()
+        ):
+            return await coro
+        return await asyncio.wrap_future(
+            asyncio.run_coroutine_threadsafe(coro, owner_loop)
+        )
+
     @property
     def is_active(self) -> bool:
         """Check if the persistent session is active."""
         return self._is_active and self.session is not None
 
 
+class _SessionPool:
+    """Bounded pool of persistent session contexts for one MCP server.
+
+    Sessions are opened lazily up to ``max_size`` when concurrent callers need
+    them, checked out with ``acquire()`` and returned with ``release()``. The
+    first session is never evicted so steady-state calls skip the handshake.
+    """
+
+    def __init__(
+        self, mcp_client: "MultiServerMCPClient", server_name: str, max_size: int
+    ) -> None:
+        """Initialize the session pool.
+
+        Args:
+            mcp_client: The MCP client instance
+            server_name: Name of the server the pool opens sessions for
+            max_size: Maximum number of open sessions
+        """
+        self.mcp_client = mcp_client
+        self.server_name = server_name
+        self.max_size = max(1, max_size)
+        self.contexts: List[_PersistentSessionContext] = []
+        # First session opened for the server; never closed by idle eviction
+        self.primary: Optional[_PersistentSessionContext] = None
+        self._idle: "asyncio.Queue[_PersistentSessionContext]" = asyncio.Queue()
+        self._opening = 0
+
+    def add(self, session_context: _PersistentSessionContext) -> None:
+        """Add an already entered session context to the pool."""
+        if self.primary is None:
+            self.primary = session_context
+        self.contexts.append(session_context)
+        self.release(session_context)
+
+    async def acquire(self) -> _PersistentSessionContext:
+        """Check out a session, opening a new one if the pool has room.
+
+        Returns:
+            An active session context reserved for the caller
+        """
+        while True:
+            try:
+                session_context = self._idle.get_nowait()
+            except asyncio.QueueEmpty:
+                if len(self.contexts) + self._opening < self.max_size:
+                    return await self._open()
+                session_context = await self._idle.get()
+
+            if session_context.is_active:
+                return session_context
+
+            # Drop sessions that died while idle and try again
+            self._discard(session_context)
+
+    def release(self, session_context: _PersistentSessionContext) -> None:
+        """Return a checked-out session to the pool."""
+        session_context.last_used = asyncio.get_running_loop().time()
+        self._idle.put_nowait(session_context)
+
+    async def _open(self) -> _PersistentSessionContext:
+        """Open an additional session for this server."""
+        self._opening += 1
+        try:
+            session_context = _PersistentSessionContext(
+                self.mcp_client, self.server_name
+            )
+            await session_context.enter()
+            if self.primary is None:
+                self.primary = session_context
+            self.contexts.append(session_context)
+            logger.debug(
+                "Opened pooled session %d/%d for server: %s",
+                len(self.contexts),
+                self.max_size,
+                self.server_name,
+            )
+            return session_context
+        finally:
+            self._opening -= 1
+
+    def _discard(self, session_context: _PersistentSessionContext) -> None:
+        """Forget a session context that is no longer usable."""
+        if session_context in self.contexts:
+            self.contexts.remove(session_context)
+        if session_context is self.primary:
+            self.primary = None
+
+    async def evict_idle(self, idle_timeout: float) -> None:
+        """Close extra sessions that have been idle longer than idle_timeout.
+
+        Args:
+            idle_timeout: Idle time in seconds after which a session is closed
+        """
+        now = asyncio.get_running_loop().time()
+        keep: List[_PersistentSessionContext] = []
+        expired: List[_PersistentSessionContext] = []
+
+        while not self._idle.empty():
+            session_context = self._idle.get_nowait()
+            # Checked-out sessions are not in the idle queue, so the primary
+            # has to be excluded by identity rather than by counting
+            if (
+                session_context is not self.primary
+                and now - session_context.last_used > idle_timeout
+            ):
+                expired.append(session_context)
+            else:
+                keep.append(session_context)
+
+        for session_context in keep:
+            self._idle.put_nowait(session_context)
+
+        for session_context in expired:
+            self._discard(session_context)
+            await session_context.exit()
+
+        if expired:
+            logger.debug(
+                "Evicted %d idle sessions for server: %s",
+                len(expired),
+                self.server_name,
+            )
+
+
 class PersistentSessionManager:
     """Manages persistent MCP sessions for an agent's lifetime.
 
@@ -145,14 +326,32 @@ class PersistentSessionManager:
     the performance overhead issue described in PERSISTENT_MCP_FIX.md.
     """
 
-    def __init__(self, mcp_client: "MultiServerMCPClient") -> None:
+    def __init__(
+        self,
+        mcp_client: "MultiServerMCPClient",
+        pool_size: int = DEFAULT_SESSION_POOL_SIZE,
+        idle_timeout: Optional[float] = None,
+        tool_cache: Optional[ToolCache] = None,
+    ) -> None:
         """Initialize the persistent session manager.
 
         Args:
             mcp_client: The MCP client to manage sessions for
+            pool_size: Maximum number of open sessions per server
+            idle_timeout: Seconds before idle extra sessions are closed
+                (None disables eviction)
+            tool_cache: Optional cache of tool definitions per server config
         """
         self.mcp_client = mcp_client
+        self.pool_size = pool_size
+        self.idle_timeout = idle_timeout
+        self.tool_cache = tool_cache
+        # (config hash, cached definitions) per server, looked up once at startup
+        self._tool_cache_entries: Dict[str, Tuple[str, Optional[List[Dict[str, Any]]]]] = {}
         self._session_contexts: Dict[str, _PersistentSessionContext] = {}
+        self._pools: Dict[str, _SessionPool] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._eviction_task: Optional["asyncio.Task[None]"] = None
         self._initialized = False
 
     async def initialize(self) -> None:
@@ -170,33 +369,96 @@ class PersistentSessionManager:
 
         logger.debug("Initializing persistent MCP sessions")
 
-        failed_servers = []
+        failed_servers: List[str] = []
 
-        for server_name in self.mcp_client.connections.keys():
-            try:
-                session_context = _PersistentSessionContext(
-                    self.mcp_client, server_name
-                )
-                await session_context.enter()
-                self._session_contexts[server_name] = session_context
+        # Each server's startup (process spawn and MCP handshake) is independent,
+        # so open them concurrently: startup takes the slowest server, not the sum
+        server_names = list(self.mcp_client.connections.keys())
+        try:
+            async with asyncio.TaskGroup() as task_group:
+                for server_name in server_names:
+                    task_group.create_task(
+                        self._open_session(server_name, failed_servers)
+                    )
+        except BaseException:
+            # Interrupted (e.g. by an init timeout): close what already opened
+            await self.cleanup()
+            raise
 
-            except Exception as e:
-                logger.error(f"Failed to initialize session for {server_name}: {e}")
-                failed_servers.append(server_name)
+        # Keep configuration order rather than the order servers finished opening
+        opened = {
+            server_name: self._session_contexts[server_name]
+            for server_name in server_names
+            if server_name not in failed_servers
+        }
+        self._session_contexts.clear()
+        self._session_contexts.update(opened)
 
+        for server_name, session_context in opened.items():
+            pool = _SessionPool(self.mcp_client, server_name, self.pool_size)
+            pool.add(session_context)
+            self._pools[server_name] = pool
+
+        failed_servers = [name for name in server_names if name in failed_servers]
         if failed_servers:
             error_msg = f"Failed to initialize MCP sessions for servers: {', '.join(failed_servers)}. Check server connectivity and configuration in MCP config file. Review error logs above for specific server failure details."
             logger.error(error_msg)
+            # Close the sessions that did open instead of leaking them
+            await self.cleanup()
             raise RuntimeError(error_msg)
 
+        self._loop = asyncio.get_running_loop()
+        if self.idle_timeout:
+            self._eviction_task = self._loop.create_task(self._evict_idle_sessions())
+
         self._initialized = True
         active_sessions = len(
             [ctx for ctx in self._session_contexts.values() if ctx.is_active]
         )
         logger.info(
-            f"Persistent session manager initialized with {active_sessions} active sessions"
+            "Persistent session manager initialized with %d active sessions",
+            active_sessions,
         )
 
+    async def _open_session(self, server_name: str, failed_servers: List[str]) -> None:
+        """Create and enter the primary persistent session for a server.
+
+        Args:
+            server_name: Name of the MCP server
+            failed_servers: List the server name is appended to if it fails
+        """
+        session_context = _PersistentSessionContext(self.mcp_client, server_name)
+        try:
+            # Cached tool definitions make the validation listing redundant
+            _, cached = self._lookup_tool_cache(server_name)
+            await session_context.enter(validate=cached is None)
+        except Exception as e:
+            logger.error("Failed to initialize session for %s: %s", server_name, e)
+            failed_servers.append(server_name)
+            return
+        # Track the session as soon as it is open so cleanup() can close it even
+        # if initialization is interrupted before it completes
+        self._session_contexts[server_name] = session_context
+
+    def _lookup_tool_cache(
+        self, server_name: str
+    ) -> Tuple[Optional[str], Optional[List[Dict[str, Any]]]]:
+        """Look up a server's cached tool definitions and remember the result.
+
+        Args:
+            server_name: Name of the MCP server
+
+        Returns:
+            Tuple of (config hash, cached definitions); both None when the tool
+            cache is disabled
+        """
+        if self.tool_cache is None:
+            return None, None
+        cfg_hash = hash_server_config(self.mcp_client.connections.get(server_name))
+        entry = (cfg_hash, self.tool_cache.get(server_name, cfg_hash))
+        self._tool_cache_entries[server_name] = entry
+        return entry
+
     async def get_tools_persistent(self) -> List["BaseTool"]:
         """Get tools using persistent sessions instead of ephemeral ones.
 
@@ -219,50 +481,165 @@ class PersistentSessionManager:
 
         all_tools: List["BaseTool"] = []
 
+        server_names = []
         for server_name, session_context in self._session_contexts.items():
             if not session_context.is_active:
-                logger.warning(f"Session for {server_name} is not active, skipping")
+                logger.warning("Session for %s is not active, skipping", server_name)
                 continue
+            server_names.append(server_name)
 
-            try:
-                # Get tool definitions from the session
-                tools_result = await session_context.session.list_tools()
-                mcp_tools = tools_result.tools if tools_result.tools else []
+        # List every server's tools concurrently; results keep server order
+        results = await asyncio.gather(
+            *(self._list_server_tools(server_name) for server_name in server_names),
+            return_exceptions=True,
+        )
 
+        for server_name, mcp_tools in zip(server_names, results):
+            if isinstance(mcp_tools, BaseException):
+                logger.error(
+                    "Failed to create persistent tools from %s: %s",
+                    server_name,
+                    mcp_tools,
+                )
+                # Continue with other servers
+                continue
+
+            try:
                 # Create custom tools that use our persistent sessions
                 for mcp_tool in mcp_tools:
-                    persistent_tool = self._create_persistent_tool(
-                        server_name, session_context, mcp_tool
-                    )
+                    persistent_tool = self._create_persistent_tool(server_name, mcp_tool)
                     all_tools.append(persistent_tool)
 
                 logger.debug(
-                    f"Created {len(mcp_tools)} persistent tools from server: {server_name}"
+                    "Created %d persistent tools from server: %s",
+                    len(mcp_tools),
+                    server_name,
                 )
 
             except Exception as e:
                 logger.error(
-                    f"Failed to create persistent tools from {server_name}: {e}"
+                    "Failed to create persistent tools from %s: %s", server_name, e
                 )
                 # Continue with other servers
 
-        logger.debug(f"Created total {len(all_tools)} persistent tools")
+        logger.debug("Created total %d persistent tools", len(all_tools))
         return all_tools
 
-    def _create_persistent_tool(
-        self,
-        server_name: str,
-        session_context: "_PersistentSessionContext",
-        mcp_tool: Any,
-    ) -> "BaseTool":
+    @asynccontextmanager
+    async def session(self, server_name: str) -> AsyncIterator[_PersistentSessionContext]:
+        """Check out a pooled persistent session for a server.
+
+        Usage:
+            async with manager.session("mysql") as session_context:
+                await session_context.call_tool("query", {...})
+
+        Args:
+            server_name: Name of the MCP server
+
+        Yields:
+            An active session context, returned to the pool on exit
+
+        Raises:
+            RuntimeError: If manager is not initialized or server is unknown
+        """
+        if not self._initialized:
+            raise RuntimeError(
+                "PersistentSessionManager must be initialized before checking out sessions"
+            )
+
+        pool = self._pools.get(server_name)
+        if pool is None:
+            raise RuntimeError(f"No persistent session pool for server: {server_name}")
+
+        session_context = await pool.acquire()
+        try:
+            yield session_context
+        finally:
+            pool.release(session_context)
+
+    async def _run_on_owner_loop(self, coro: Coroutine[Any, Any, Any]) -> Any:
+        """Await a coroutine on the loop that owns the pooled sessions."""
+        owner_loop = self._loop
+        if (
+            owner_loop is None
+            or not owner_loop.is_running()
+            or owner_loop is asyncio.get_running_loop()
+        ):
+            return await coro
+        return await asyncio.wrap_future(
+            asyncio.run_coroutine_threadsafe(coro, owner_loop)
+        )
+
+    async def _evict_idle_sessions(self) -> None:
+        """Background task closing extra sessions idle beyond idle_timeout."""
+        interval = max(self.idle_timeout / 2, 1.0)
+        while True:
+            await asyncio.sleep(interval)
+            for pool in list(self._pools.values()):
+                try:
+                    await pool.evict_idle(self.idle_timeout)
+                except Exception as e:
+                    logger.warning(
+                        "Idle session eviction failed for %s: %s", pool.server_name, e
+                    )
+
+    async def _list_server_tools(self, server_name: str) -> List[Any]:
+        """List a server's tool definitions, skipping the discovery RPC if possible.
+
+        A listing made while validating the primary session is fresher than the
+        cache, so it is preferred and written back to the cache.
+
+        Args:
+            server_name: Name of the MCP server
+
+        Returns:
+            List of MCP tool definitions
+        """
+        # Reuse the listing made when the primary session was validated, which
+        # saves a round trip per server
+        primary_context = self._session_contexts.get(server_name)
+        tools_result = primary_context.listed_tools if primary_context else None
+
+        cfg_hash, cached = (
+            self._tool_cache_entries.get(server_name)
+            or self._lookup_tool_cache(server_name)
+        )
+
+        if tools_result is None and cached is not None:
+            try:
+                from mcp.types import Tool
+
+                logger.debug("Using cached tool definitions for %s", server_name)
+                return [Tool.model_validate(data) for data in cached]
+            except Exception as e:
+                logger.debug("Ignoring unusable tool cache for %s: %s", server_name, e)
+
+        # Otherwise list on a pooled session
+        if tools_result is None:
+            async with self.session(server_name) as pooled_context:
+                tools_result = await pooled_context.session.list_tools()
+        mcp_tools = tools_result.tools if tools_result.tools else []
+
+        if self.tool_cache is not None:
+            try:
+                serialized = [tool.model_dump(mode="json") for tool in mcp_tools]
+            except Exception as e:
+                logger.debug("Tool definitions for %s not cacheable: %s", server_name, e)
+            else:
+                self.tool_cache.put(server_name, cfg_hash, serialized)
+                self._tool_cache_entries[server_name] = (cfg_hash, serialized)
+
+        return mcp_tools
+
+    def _create_persistent_tool(self, server_name: str, mcp_tool: Any) -> "BaseTool":
         """Create a tool that uses persistent sessions instead of ephemeral ones.
 
-        This method creates a LangChain tool that directly calls our persistent session,
-        avoiding the async context manager corruption from langchain-mcp-adapters.
+        This method creates a LangChain tool that checks out a pooled persistent
+        session for each call, avoiding the async context manager corruption from
+        langchain-mcp-adapters.
 
         Args:
             server_name: Name of the MCP server
-            session_context: Persistent session context
             mcp_tool: MCP tool definition
 
         Returns:
@@ -270,21 +647,22 @@ class PersistentSessionManager:
         """
         from langchain_core.tools import StructuredTool
 
-        async def persistent_tool_call(**kwargs: Any) -> str:
-            """Tool call that uses persistent session directly."""
-            try:
+        async def call_pooled(arguments: Dict[str, Any]) -> Any:
+            """Run the tool on a checked-out pooled session."""
+            async with self.session(server_name) as session_context:
                 if not session_context.is_active:
                     raise RuntimeError(
                         f"Persistent session for {server_name} is not active"
                     )
+                return await session_context.call_tool(mcp_tool.name, arguments)
 
-                if not session_context.session:
-                    raise RuntimeError(f"No session available for {server_name}")
-
-                # Call the tool using our persistent session
-                logger.debug(f"Calling tool {mcp_tool.name} with args: {kwargs}")
-                result = await session_context.session.call_tool(mcp_tool.name, kwargs)
-                logger.debug(f"Tool {mcp_tool.name} returned: {result}")
+        async def persistent_tool_call(**kwargs: Any) -> str:
+            """Tool call that uses a pooled persistent session."""
+            try:
+                # Call the tool using our persistent session pool
+                logger.debug("Calling tool %s with args: %s", mcp_tool.name, kwargs)
+                result = await self._run_on_owner_loop(call_pooled(kwargs))
+                logger.debug("Tool %s returned: %s", mcp_tool.name, result)
 
                 # Check for errors in the result
                 if hasattr(result, "isError") and result.isError:
@@ -314,7 +692,7 @@ class PersistentSessionManager:
                     elif text_parts:
                         text_to_return = "\n".join(text_parts)
 
-                    logger.debug(f"Tool calling result parsed:\n {text_to_return}")
+                    logger.debug("Tool calling result parsed:\n %s", text_to_return)
                     return text_to_return
 
 
@@ -323,7 +701,7 @@ class PersistentSessionManager:
             except Exception as e:
                 error_msg = str(e) if str(e) else "Unknown error occurred"
                 logger.error(
-                    f"Persistent tool call failed for {mcp_tool.name}: {error_msg}"
+                    "Persistent tool call failed for %s: %s", mcp_tool.name, error_msg
                 )
                 return f"Tool execution failed: {error_msg}"
 
@@ -346,24 +724,39 @@ class PersistentSessionManager:
         """Clean up all persistent session contexts.
 
         This method properly exits all async context managers and cleans up
-        resources. Should be called when the agent is being destroyed.
+        resources. Should be called when the agent is being destroyed. Sessions
+        opened by an initialization that failed or timed out are closed too.
         """
-        if not self._initialized:
+        if not self._initialized and not self._session_contexts:
             return
 
         logger.debug("Cleaning up persistent MCP sessions")
 
-        cleanup_tasks = []
-        for server_name, session_context in self._session_contexts.items():
-            cleanup_tasks.append(session_context.exit())
+        if self._eviction_task is not None:
+            self._eviction_task.cancel()
+            self._eviction_task = None
+
+        session_contexts = list(self._session_contexts.values())
+        for pool in self._pools.values():
+            session_contexts.extend(
+                ctx for ctx in pool.contexts if ctx not in session_contexts
+            )
+
+        cleanup_tasks = [ctx.exit() for ctx in session_contexts]
 
         # Wait for all cleanups to complete
         if cleanup_tasks:
             await asyncio.gather(*cleanup_tasks, return_exceptions=True)
 
         self._session_contexts.clear()
+        self._pools.clear()
+        self._tool_cache_entries.clear()
+        self._loop = None
         self._initialized = False
 
+        if self.tool_cache is not None:
+            self.tool_cache.close()
+
         logger.debug("All persistent MCP sessions cleaned up")
 
     @property
@@ -417,7 +810,7 @@ class CleanupManager:
             signal.signal(signal.SIGINT, self._signal_cleanup)
         except (OSError, ValueError) as e:
             # Signal registration might fail in some environments (like Windows)
-            logger.debug(f"Could not register signal handlers: {e}")
+            logger.debug("Could not register signal handlers: %s", e)
 
         # IPython/Jupyter cleanup
         self._register_ipython_cleanup()
@@ -438,7 +831,7 @@ class CleanupManager:
         except ImportError:
             logger.debug("IPython not available, skipping IPython cleanup registration")
         except Exception as e:
-            logger.debug(f"Could not register IPython cleanup: {e}")
+            logger.debug("Could not register IPython cleanup: %s", e)
 
     def _sync_cleanup(self) -> None:
         """Synchronous cleanup for atexit and signal handlers with timeout protection."""
@@ -461,6 +854,10 @@ class CleanupManager:
             signal.alarm(5)
             
             try:
+                # Sessions are bound to the loop that opened them, so exit them there
+                if self._cleanup_on_owner_loop(timeout=4.0):
+                    return
+
                 # Try to run async cleanup
                 try:
                     # Check if there's already an event loop running
@@ -491,13 +888,43 @@ class CleanupManager:
                 signal.signal(signal.SIGALRM, old_handler)
 
         except (TimeoutError, asyncio.TimeoutError) as e:
-            logger.warning(f"MCP session cleanup timed out: {e}")
+            logger.warning("MCP session cleanup timed out: %s", e)
             logger.warning("Forcing cleanup completion to prevent hanging")
         except Exception as e:
-            logger.warning(f"Warning: MCP session cleanup failed: {e}")
+            logger.warning("Warning: MCP session cleanup failed: %s", e)
         finally:
             self._cleanup_in_progress = False
 
+    def _cleanup_on_owner_loop(self, timeout: float) -> bool:
+        """Run the session cleanup on the loop that owns the sessions.
+
+        Args:
+            timeout: Seconds to wait for the cleanup to finish
+
+        Returns:
+            True if the cleanup ran (or was scheduled) on the owner loop, False
+            if there is no running owner loop to dispatch to
+        """
+        owner_loop = self.session_manager._loop
+        if owner_loop is None or not owner_loop.is_running():
+            return False
+
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+
+        if running_loop is owner_loop:
+            # Blocking on the owner loop from inside it would deadlock
+            owner_loop.create_task(self.session_manager.cleanup())
+            logger.debug("Cleanup task created on the session owner loop")
+            return True
+
+        asyncio.run_coroutine_threadsafe(
+            self.session_manager.cleanup(), owner_loop
+        ).result(timeout)
+        return True
+
     def _signal_cleanup(self, signum: int, frame: Any) -> None:
         """Signal handler cleanup with enhanced rapid signal protection.
 
@@ -507,10 +934,10 @@ class CleanupManager:
         """
         # Enhanced re-entrancy protection for rapid signals
         if self._cleanup_in_progress:
-            logger.debug(f"Signal {signum} received, but cleanup already in progress - ignoring")
+            logger.debug("Signal %s received, but cleanup already in progress - ignoring", signum)
             return
             
-        logger.info(f"Received signal {signum}, cleaning up MCP sessions")
+        logger.info("Received signal %s, cleaning up MCP sessions", signum)
         
         # Set shutdown event to coordinate with CLI interactive loop
         try:
@@ -531,9 +958,11 @@ class CleanupManager:
         """IPython-specific cleanup handler."""
         logger.debug("Running IPython cleanup")
         try:
+            if self._cleanup_on_owner_loop(timeout=4.0):
+                return
             # In IPython, we can use asyncio.create_task if loop is running
             asyncio.create_task(self.session_manager.cleanup())
         except Exception as e:
-            logger.warning(f"IPython cleanup failed: {e}")
+            logger.warning("IPython cleanup failed: %s", e)
             # Fallback to sync cleanup
             self._sync_cleanup()
@@ -0,0 +1,137 @@
+"""Response cache for repeated queries in AgentDK applications.
+
+Applications often see the same or near-identical questions several times in a
+session. This module caches final responses so a repeat can be answered without
+another workflow run and LLM round-trip. Without an embedding function queries
+match after whitespace/case normalization; with one, a cached response is reused
+when the cosine similarity of the query embeddings reaches a threshold.
+"""
+
+import math
+import threading
+from collections import OrderedDict
+from typing import Callable, List, Optional, Sequence, Tuple
+
+from .logging_config import get_logger
+
+
+logger = get_logger()
+
+# Default number of responses kept per cache
+DEFAULT_RESPONSE_CACHE_SIZE = 128
+
+# Default cosine similarity needed for a semantic cache hit
+DEFAULT_SIMILARITY_THRESHOLD = 0.92
+
+
+def _normalize_query(query: str) -> str:
+    """Collapse whitespace and case so trivially different queries match."""
+    return " ".join(query.split()).casefold()
+
+
+def _cosine_similarity(a: Sequence[float], b: Sequence[float]) -> float:
+    """Compute the cosine similarity of two vectors."""
+    dot = sum(x * y for x, y in zip(a, b))
+    norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+    return dot / norm if norm else 0.0
+
+
+class ResponseCache:
+    """LRU cache of final responses keyed on the user query.
+
+    The cache is thread-safe and bounded; the least recently used entry is
+    evicted once ``capacity`` is exceeded.
+    """
+
+    def __init__(
+        self,
+        capacity: int = DEFAULT_RESPONSE_CACHE_SIZE,
+        embed: Optional[Callable[[str], Sequence[float]]] = None,
+        threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+    ) -> None:
+        """Initialize the response cache.
+
+        Args:
+            capacity: Maximum number of cached responses
+            embed: Optional function mapping a query to an embedding vector;
+                enables similarity matching instead of normalized exact matching
+            threshold: Minimum cosine similarity for a semantic hit
+        """
+        self.capacity = capacity
+        self.embed = embed
+        self.threshold = threshold
+        self._entries: "OrderedDict[str, Tuple[Optional[List[float]], str]]" = OrderedDict()
+        # Embeddings of queries that missed, reused when put() stores their response
+        self._miss_vectors: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, query: str) -> Optional[str]:
+        """Look up a cached response for a query.
+
+        Args:
+            query: The user query
+
+        Returns:
+            The cached response, or None on a miss
+        """
+        key = _normalize_query(query)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry[1]
+
+        if self.embed is None:
+            return None
+
+        vector = list(self.embed(query))
+        with self._lock:
+            best_key, best_score = None, self.threshold
+            for entry_key, (entry_vector, _) in self._entries.items():
+                if entry_vector is None:
+                    continue
+                score = _cosine_similarity(vector, entry_vector)
+                if score >= best_score:
+                    best_key, best_score = entry_key, score
+            if best_key is None:
+                self._miss_vectors[key] = vector
+                self._miss_vectors.move_to_end(key)
+                while len(self._miss_vectors) > self.capacity:
+                    self._miss_vectors.popitem(last=False)
+                return None
+            self._entries.move_to_end(best_key)
+            logger.debug("Semantic response cache hit (similarity %.3f)", best_score)
+            return self._entries[best_key][1]
+
+    def put(self, query: str, response: str) -> None:
+        """Store the response for a query.
+
+        The query is embedded only if the preceding get() miss did not already
+        embed it.
+
+        Args:
+            query: The user query
+            response: The final response to reuse for matching queries
+        """
+        key = _normalize_query(query)
+        vector = None
+        if self.embed is not None:
+            with self._lock:
+                vector = self._miss_vectors.pop(key, None)
+            if vector is None:
+                vector = list(self.embed(query))
+        with self._lock:
+            self._entries[key] = (vector, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        with self._lock:
+            self._entries.clear()
+            self._miss_vectors.clear()
+
+    def __len__(self) -> int:
+        """Return the number of cached responses."""
+        return len(self._entries)
@@ -0,0 +1,138 @@
+"""Persistent cache of MCP tool definitions for AgentDK.
+
+Listing tools is a round trip to every configured MCP server on each agent start.
+Tool definitions rarely change between runs, so this module keeps them in a small
+SQLite database keyed on the server name and a hash of its connection config.
+Changing the config (command, args, env, ...) therefore invalidates the entry.
+``sqlite3`` is imported on first use since most agents never enable the cache.
+"""
+
+import hashlib
+import json
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    import sqlite3
+
+from .logging_config import get_logger
+
+
+logger = get_logger()
+
+# Default location of the tool cache database
+DEFAULT_TOOL_CACHE_PATH = Path.home() / ".agentdk" / "tool_cache.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tool_cache (
+    server_name TEXT NOT NULL,
+    cfg_hash TEXT NOT NULL,
+    serialized BLOB NOT NULL,
+    PRIMARY KEY (server_name, cfg_hash)
+)
+"""
+
+
+def hash_server_config(server_config: Any) -> str:
+    """Compute a stable hash of one server's connection configuration.
+
+    Args:
+        server_config: Connection configuration for a single MCP server
+
+    Returns:
+        Hex digest identifying the configuration
+    """
+    canonical = json.dumps(server_config, sort_keys=True, default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class ToolCache:
+    """SQLite-backed store of serialized MCP tool definitions.
+
+    Entries are stored as JSON so loading a cache file never executes code.
+    All failures are logged and treated as cache misses; the cache must never
+    prevent an agent from loading its tools live.
+    """
+
+    def __init__(self, path: Union[str, Path, None] = None) -> None:
+        """Initialize the tool cache.
+
+        Args:
+            path: Database file location (defaults to ~/.agentdk/tool_cache.db)
+        """
+        self.path = Path(path) if path is not None else DEFAULT_TOOL_CACHE_PATH
+        self._conn: Optional["sqlite3.Connection"] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> "sqlite3.Connection":
+        """Open the database on first use and ensure the schema exists."""
+        if self._conn is None:
+            import sqlite3
+
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(_SCHEMA)
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def get(self, server_name: str, cfg_hash: str) -> Optional[List[Dict[str, Any]]]:
+        """Look up cached tool definitions for a server.
+
+        Args:
+            server_name: Name of the MCP server
+            cfg_hash: Hash of the server's connection configuration
+
+        Returns:
+            List of tool definition dicts, or None on a cache miss
+        """
+        import sqlite3
+
+        try:
+            with self._lock:
+                row = self._connect().execute(
+                    "SELECT serialized FROM tool_cache WHERE server_name = ? AND cfg_hash = ?",
+                    (server_name, cfg_hash),
+                ).fetchone()
+            if row is None:
+                return None
+            return json.loads(row[0])
+        except (sqlite3.Error, OSError, ValueError) as e:
+            logger.warning("Tool cache lookup failed for %s: %s", server_name, e)
+            return None
+
+    def put(
+        self, server_name: str, cfg_hash: str, tools: List[Dict[str, Any]]
+    ) -> None:
+        """Store tool definitions for a server, replacing any stale entry.
+
+        Args:
+            server_name: Name of the MCP server
+            cfg_hash: Hash of the server's connection configuration
+            tools: JSON-serializable tool definition dicts
+        """
+        import sqlite3
+
+        try:
+            serialized = json.dumps(tools, default=str)
+            with self._lock:
+                conn = self._connect()
+                with conn:
+                    conn.execute(
+                        "DELETE FROM tool_cache WHERE server_name = ?", (server_name,)
+                    )
+                    conn.execute(
+                        "INSERT INTO tool_cache (server_name, cfg_hash, serialized) VALUES (?, ?, ?)",
+                        (server_name, cfg_hash, serialized),
+                    )
+        except (sqlite3.Error, OSError, TypeError, ValueError) as e:
+            logger.warning("Tool cache store failed for %s: %s", server_name, e)
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -27,12 +27,26 @@ Example:
     >>> context = memory.get_llm_context("What are my preferences?")
 """
 
-from .memory_manager import MemoryManager
-from .memory_tools import MemoryTools
-from .working_memory import WorkingMemory
-from .episodic_memory import EpisodicMemory
-from .factual_memory import FactualMemory
-from .memory_aware_agent import MemoryAwareSession
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .memory_manager import MemoryManager
+    from .memory_tools import MemoryTools
+    from .working_memory import WorkingMemory
+    from .episodic_memory import EpisodicMemory
+    from .factual_memory import FactualMemory
+    from .memory_aware_agent import MemoryAwareSession
+
+# Public names and the submodule defining each; imported on first access
+_LAZY_EXPORTS = {
+    'MemoryManager': '.memory_manager',
+    'MemoryTools': '.memory_tools',
+    'WorkingMemory': '.working_memory',
+    'EpisodicMemory': '.episodic_memory',
+    'FactualMemory': '.factual_memory',
+    'MemoryAwareSession': '.memory_aware_agent',
+}
 
 __version__ = "0.1.0"
 __all__ = [
@@ -43,3 +57,13 @@ __all__ = [
     'FactualMemory',
     'MemoryAwareSession'
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import public memory classes on first access (PEP 562)."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -10,6 +10,7 @@ import logging
 from typing import Dict, Any, Optional, List, Union
 from pathlib import Path
 
+from ..core.loop_thread import run_sync
 from .working_memory import WorkingMemory
 from .episodic_memory import EpisodicMemory
 from .factual_memory import FactualMemory
@@ -66,9 +67,8 @@ class MemoryManager:
         )
         
         # Initialize async components
-        import asyncio
-        asyncio.run(self.working.initialize())
-        asyncio.run(self.factual.initialize())
+        run_sync(self.working.initialize())
+        run_sync(self.factual.initialize())
         
         logger.debug(f"MemoryManager initialized for user {user_id}, session {self.session_id}")
     
@@ -121,11 +121,10 @@ class MemoryManager:
         }
         
         # Store in working memory (session context)
-        import asyncio
         user_metadata = {'role': 'user', **(metadata or {})}
         assistant_metadata = {'role': 'assistant', **(metadata or {})}
-        asyncio.run(self.working.store(f"User: {user_query}", user_metadata))
-        asyncio.run(self.working.store(f"Assistant: {agent_response}", assistant_metadata))
+        run_sync(self.working.store(f"User: {user_query}", user_metadata))
+        run_sync(self.working.store(f"Assistant: {agent_response}", assistant_metadata))
         
         # Store in episodic memory (conversation history)
         self.episodic.store_conversation(user_query, agent_response, metadata)
@@ -171,9 +170,8 @@ class MemoryManager:
         Returns:
             Dictionary with relevant memory from all types
         """
-        import asyncio
         return {
-            'factual': asyncio.run(self.factual.retrieve(user_query, limit=5)),
+            'factual': run_sync(self.factual.retrieve(user_query, limit=5)),
             'working': self.working.get_recent_conversation(),
             'episodic': self.episodic.search_conversations(user_query, limit=5)
         }
@@ -268,8 +266,7 @@ class MemoryManager:
             key: Preference key
             value: Preference value
         """
-        import asyncio
-        asyncio.run(self.factual.set_preference(category, key, value))
+        run_sync(self.factual.set_preference(category, key, value))
     
     def get_preference(self, category: str, key: str, default: Any = None) -> Any:
         """Get a user preference.
@@ -282,8 +279,7 @@ class MemoryManager:
         Returns:
             Preference value or default
         """
-        import asyncio
-        return asyncio.run(self.factual.get_preference(category, key, default))
+        return run_sync(self.factual.get_preference(category, key, default))
     
     def update_preference(self, category: str, key: str, value: Any) -> None:
         """Update an existing user preference.
@@ -293,8 +289,7 @@ class MemoryManager:
             key: Preference key
             value: New preference value
         """
-        import asyncio
-        asyncio.run(self.factual.set_preference(category, key, value))
+        run_sync(self.factual.set_preference(category, key, value))
     
     def delete_preference(self, category: str, key: str) -> bool:
         """Delete a user preference.
@@ -306,8 +301,7 @@ class MemoryManager:
         Returns:
             True if deleted, False if not found
         """
-        import asyncio
-        return asyncio.run(self.factual.delete_preference(category, key))
+        return run_sync(self.factual.delete_preference(category, key))
     
     # Memory Statistics and Health
     def get_memory_stats(self) -> Dict[str, Any]:
@@ -316,11 +310,10 @@ class MemoryManager:
         Returns:
             Dictionary with statistics from all memory types
         """
-        import asyncio
         return {
-            'working': asyncio.run(self.working.get_stats()),
+            'working': run_sync(self.working.get_stats()),
             'episodic': self.episodic.get_stats(),
-            'factual': asyncio.run(self.factual.get_stats()),
+            'factual': run_sync(self.factual.get_stats()),
             'config': {
                 'max_context_tokens': self.config['memory_max_context_tokens'],
                 'summarization_enabled': self.config['memory_enable_summarization'],
@@ -337,18 +330,17 @@ class MemoryManager:
         Returns:
             True if successful
         """
-        import asyncio
         if memory_type == "working":
-            return asyncio.run(self.working.clear(confirm=True))
+            return run_sync(self.working.clear(confirm=True))
         elif memory_type == "episodic":
             return self.episodic.clear()
         elif memory_type == "factual":
-            return asyncio.run(self.factual.clear(confirm=True))
+            return run_sync(self.factual.clear(confirm=True))
         elif memory_type == "all":
             return (
-                asyncio.run(self.working.clear(confirm=True)) and
+                run_sync(self.working.clear(confirm=True)) and
                 self.episodic.clear() and
-                asyncio.run(self.factual.clear(confirm=True))
+                run_sync(self.factual.clear(confirm=True))
             )
         else:
             logger.error(f"Unknown memory type: {memory_type}")
@@ -9,9 +9,8 @@ import json
 import logging
 from typing import Dict, Any, Optional, List, Union
 from datetime import datetime, timedelta
-import argparse
-import io
-import sys
+
+from ..core.loop_thread import run_sync
 
 logger = logging.getLogger(__name__)
 
@@ -151,8 +150,7 @@ class MemoryTools:
             }
         
         elif search_type == 'factual':
-            import asyncio
-            facts = asyncio.run(self.memory.factual.retrieve(query, limit=limit))
+            facts = run_sync(self.memory.factual.retrieve(query, limit=limit))
             results['factual_search'] = {
                 'query': query,
                 'results': facts,
@@ -267,8 +265,7 @@ class MemoryTools:
         Usage: preferences [--list] [--set category key value] [--get category key]
         """
         if '--list' in args:
-            import asyncio
-            prefs = asyncio.run(self.memory.factual.list_preferences())
+            prefs = run_sync(self.memory.factual.list_preferences())
             return self._format_preferences(prefs)
         
         # Handle --set
@@ -351,10 +348,9 @@ Examples:
     def _get_working_memory_data(self) -> Dict[str, Any]:
         """Get working memory data."""
         try:
-            import asyncio
             return {
                 'recent_context': self.memory.working.get_recent_conversation(),
-                'stats': asyncio.run(self.memory.working.get_stats())
+                'stats': run_sync(self.memory.working.get_stats())
             }
         except Exception as e:
             logger.error(f"Error getting working memory data: {e}")
@@ -376,10 +372,9 @@ Examples:
     def _get_factual_memory_data(self) -> Dict[str, Any]:
         """Get factual memory data."""
         try:
-            import asyncio
             return {
-                'preferences': asyncio.run(self.memory.factual.list_preferences()),
-                'stats': asyncio.run(self.memory.factual.get_stats())
+                'preferences': run_sync(self.memory.factual.list_preferences()),
+                'stats': run_sync(self.memory.factual.get_stats())
             }
         except Exception as e:
             logger.error(f"Error getting factual memory data: {e}")
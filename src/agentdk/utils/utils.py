@@ -1,8 +1,20 @@
 import os
+from functools import lru_cache
 
-def get_llm():    
+def get_llm():
+    """Return an LLM for the first provider whose API key is set.
+
+    The client is built once per set of API keys and reused by later calls
+    (e.g. every CLI-loaded agent), so the provider import and client setup are
+    only paid again when the keys change.
+    """
+    return _build_llm(os.getenv('OPENAI_API_KEY'), os.getenv('ANTHROPIC_API_KEY'))
+
+
+@lru_cache(maxsize=4)
+def _build_llm(openai_api_key, anthropic_api_key):
     # Try OpenAI
-    if os.getenv('OPENAI_API_KEY'):
+    if openai_api_key:
         try:
             from langchain_openai import ChatOpenAI
             model = "gpt-4o-mini"
@@ -13,9 +25,9 @@ def get_llm():
             print("❌ langchain_openai not available")
         except Exception as e:
             print(f"❌ OpenAI setup failed: {e}")
-    
+
     # Try Anthropic
-    if os.getenv('ANTHROPIC_API_KEY'):
+    if anthropic_api_key:
         try:
             from langchain_anthropic import ChatAnthropic
             llm = ChatAnthropic(model="claude-3-haiku-20240307", temperature=0)
@@ -31,4 +43,3 @@ def get_llm():
 
 # Lazy LLM initialization - call get_llm() when needed
 llm = None
-
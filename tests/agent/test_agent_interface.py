@@ -7,7 +7,9 @@ from unittest.mock import Mock, AsyncMock, MagicMock, patch
 from pathlib import Path
 from typing import Dict, Any
 
+from agentdk.agent import agent_interface as agent_interface_module
 from agentdk.agent.agent_interface import AgentInterface, SubAgent
+from agentdk.core.persistent_mcp import DEFAULT_SESSION_IDLE_TIMEOUT, DEFAULT_SESSION_POOL_SIZE
 from agentdk.exceptions import AgentInitializationError, MCPConfigError
 
 
@@ -94,7 +96,7 @@ class TestSubAgent:
         assert agent.agent is None
         assert agent.name == 'concretesub'  # Auto-generated from class name
         assert agent._mcp_config_path is None
-        assert agent._tools == []
+        assert agent._tools == ()
         assert not agent._initialized
         assert not agent._mcp_config_loaded
         assert agent.logger is not None
@@ -130,7 +132,7 @@ class TestSubAgent:
         """Test initialization with tools."""
         tools = [Mock(), Mock()]
         agent = ConcreteSubAgent(tools=tools)
-        assert agent._tools == tools
+        assert agent._tools == tuple(tools)
     
     def test_init_config_merging(self, mock_llm):
         """Test that configuration is properly merged from different sources."""
@@ -149,11 +151,27 @@ class TestSubAgent:
         assert agent.llm == mock_llm
         assert agent.name == "test_agent"
     
+    def test_slotted_subclass_has_no_instance_dict(self):
+        """Test SubAgent state fits in slots when subclasses opt in."""
+
+        class SlottedSubAgent(SubAgent):
+            __slots__ = ()
+
+            def _execute_with_llm(self, user_prompt: str, enhanced_input: Dict) -> str:
+                return user_prompt
+
+        agent = SlottedSubAgent(llm=Mock(), prompt="You are a test agent.", config={"a": 1})
+
+        assert not hasattr(agent, "__dict__")
+        assert agent.config == {"a": 1}
+        assert agent.prompt == "You are a test agent."
+        assert agent.tools == ()
+
     def test_tools_property(self):
         """Test tools property."""
         tools = [Mock(), Mock()]
         agent = ConcreteSubAgent(tools=tools)
-        assert agent.tools == tools
+        assert agent.tools == tuple(tools)
     
     def test_is_initialized_property(self):
         """Test is_initialized property."""
@@ -186,6 +204,29 @@ class TestSubAgent:
             
             assert "Query execution failed: Test error" in result
 
+    def test_system_message_built_once_per_prompt(self):
+        """Test the static system message is reused until the prompt changes."""
+        agent = ConcreteSubAgent(prompt="You are a test agent.")
+
+        first = agent._get_system_message()
+        assert agent._get_system_message() is first
+        assert first.content == "You are a test agent."
+
+        agent.prompt = "You are a different agent."
+        assert agent._get_system_message().content == "You are a different agent."
+
+    def test_system_message_marked_for_prompt_cache(self):
+        """Test the prompt_cache option sends the prompt as a cacheable block."""
+        agent = ConcreteSubAgent(config={"prompt_cache": True})
+
+        message = agent._get_system_message()
+        assert message.content == [{
+            "type": "text",
+            "text": "You are a test agent.",
+            "cache_control": {"type": "ephemeral"},
+        }]
+        assert agent._get_system_message() is message
+
     @pytest.mark.asyncio
     async def test_query_async_uninitialized_agent(self, mock_llm):
         """Test query_async initializes agent if not initialized."""
@@ -198,6 +239,22 @@ class TestSubAgent:
             # Should return fallback response since no agent created in this test
             assert "Analysis (without tools)" in result
 
+    @pytest.mark.asyncio
+    async def test_query_async_initializes_on_loop_thread(self, mock_llm):
+        """Test query_async opens MCP sessions on the shared loop thread."""
+        from agentdk.core.loop_thread import get_loop_thread
+
+        agent = ConcreteSubAgent(llm=mock_llm)
+        init_threads = []
+
+        async def record_initialize():
+            init_threads.append(get_loop_thread().in_loop_thread())
+
+        with patch.object(agent, '_initialize', side_effect=record_initialize):
+            await agent.query_async("test prompt")
+
+        assert init_threads == [True]
+
     @pytest.mark.asyncio
     async def test_query_async_with_langgraph_agent(self, mock_llm):
         """Test query_async with LangGraph agent."""
@@ -289,6 +346,16 @@ class TestSubAgent:
         assert actual_query == "What is the weather?"
         assert memory_context == ""
 
+    def test_parse_memory_context_multiline_context(self):
+        """Test parsing keeps multi-line memory context intact."""
+        agent = ConcreteSubAgent()
+
+        prompt = "User query: Show tables\nMemory context: Recent conversation:\n  - asked about customers\n"
+        actual_query, memory_context = agent._parse_memory_context(prompt)
+
+        assert actual_query == "Show tables"
+        assert memory_context == "Recent conversation:\n  - asked about customers"
+
     def test_parse_memory_context_malformed(self):
         """Test parsing with malformed memory context."""
         agent = ConcreteSubAgent()
@@ -371,6 +438,43 @@ class TestSubAgent:
             
             mock_query.assert_called_once_with("real user question")
 
+    def test_extract_user_input_prefers_most_recent_user_message(self):
+        """Test user input extraction returns the newest user message."""
+        agent = ConcreteSubAgent()
+
+        first = Mock(type="human", content="first question")
+        ai_reply = Mock(type="ai", content="answer")
+        latest = {"role": "user", "content": "follow-up question"}
+        transfer = Mock(type="tool", content="Successfully transferred to agent")
+
+        state = {"messages": [first, ai_reply, latest, transfer]}
+
+        assert agent._extract_user_input(state) == "follow-up question"
+
+    def test_extract_user_input_falls_back_to_last_non_transfer(self):
+        """Test extraction without user messages returns the newest non-transfer content."""
+        agent = ConcreteSubAgent()
+
+        state = {"messages": [
+            {"role": "assistant", "content": "older reply"},
+            {"role": "assistant", "content": "newest reply"},
+            {"role": "tool", "content": "Successfully transferred to agent"},
+        ]}
+
+        assert agent._extract_user_input(state) == "newest reply"
+
+    def test_message_reader_resolved_once_per_type(self):
+        """Test message readers are chosen by type and cached for reuse."""
+        class UserDict(dict):
+            pass
+
+        reader = agent_interface_module._message_reader(UserDict)
+        assert agent_interface_module._message_reader(UserDict) is reader
+        assert reader(UserDict(role="user", content="hi")) == ("user", "hi")
+
+        object_reader = agent_interface_module._message_reader(Mock)
+        assert object_reader(Mock(type="human", content="hello")) == ("human", "hello")
+
     def test_invoke_method_error_handling(self, mock_llm):
         """Test invoke method error handling."""
         agent = ConcreteSubAgent(llm=mock_llm)
@@ -411,6 +515,21 @@ class TestSubAgent:
             mock_create_agent.assert_called_once()
             assert agent._initialized
 
+    @pytest.mark.asyncio
+    async def test_initialize_prepares_langgraph_alongside_tool_loading(self, mock_llm):
+        """Test LangGraph preparation runs during tool loading, before agent creation."""
+        agent = ConcreteSubAgent(llm=mock_llm)
+        calls = []
+
+        with patch.object(agent, '_setup_and_load_tools', side_effect=lambda: calls.append("tools")), \
+             patch.object(agent, '_prepare_langgraph', side_effect=lambda: calls.append("prepare")), \
+             patch.object(agent, '_create_langgraph_agent', side_effect=lambda: calls.append("create")):
+
+            await agent._initialize()
+
+        assert sorted(calls[:2]) == ["prepare", "tools"]
+        assert calls[2] == "create"
+
     @pytest.mark.asyncio
     async def test_initialize_with_mcp_config_but_no_tools(self, mock_llm):
         """Test initialization fails when MCP config provided but no tools loaded."""
@@ -421,7 +540,7 @@ class TestSubAgent:
              patch.object(agent, '_create_langgraph_agent', new_callable=AsyncMock):
             
             # No tools loaded
-            agent._tools = []
+            agent._tools = ()
             
             with pytest.raises(AgentInitializationError) as exc_info:
                 await agent._initialize()
@@ -477,13 +596,83 @@ class TestSubAgent:
             mock_get_config.assert_called_once_with(agent)
             mock_transform.assert_called_once_with(mock_config)
             MockClient.assert_called_once_with(mock_client_config)
-            MockSessionManager.assert_called_once_with(mock_client)
+            MockSessionManager.assert_called_once_with(
+                mock_client,
+                pool_size=DEFAULT_SESSION_POOL_SIZE,
+                idle_timeout=DEFAULT_SESSION_IDLE_TIMEOUT,
+                tool_cache=None,
+            )
             mock_session_manager.initialize.assert_called_once()
             mock_cleanup_manager.register_cleanup.assert_called_once()
             
             assert agent._mcp_client == mock_client
             assert agent._mcp_config_loaded
 
+    def test_build_tool_cache_from_config(self, tmp_path):
+        """Test the mcp_tool_cache option enables the tool definition cache."""
+        from agentdk.core.tool_cache import ToolCache
+
+        assert ConcreteSubAgent()._build_tool_cache() is None
+
+        db_path = tmp_path / "tools.db"
+        cache = ConcreteSubAgent(config={"mcp_tool_cache": str(db_path)})._build_tool_cache()
+        assert isinstance(cache, ToolCache)
+        assert cache.path == db_path
+
+    @pytest.mark.asyncio
+    async def test_setup_mcp_client_init_timeout(self):
+        """Test a hung MCP server fails initialization after init_timeout."""
+        agent = ConcreteSubAgent(mcp_config_path="/test/config.json", init_timeout=0.01)
+        mock_session_manager = Mock()
+
+        async def hang():
+            await asyncio.sleep(10)
+
+        mock_session_manager.initialize = hang
+        mock_session_manager.cleanup = AsyncMock()
+
+        with patch('agentdk.agent.agent_interface.get_mcp_config', return_value={}), \
+             patch('agentdk.agent.agent_interface.transform_config_for_mcp_client', return_value={}), \
+             patch('langchain_mcp_adapters.client.MultiServerMCPClient'), \
+             patch('agentdk.agent.agent_interface.PersistentSessionManager', return_value=mock_session_manager):
+            with pytest.raises(AgentInitializationError, match="did not initialize within"):
+                await agent._setup_mcp_client()
+
+        mock_session_manager.cleanup.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_setup_mcp_client_init_timeout_closes_open_sessions(self):
+        """Test sessions that opened before an init timeout are exited."""
+        agent = ConcreteSubAgent(mcp_config_path="/test/config.json", init_timeout=0.05)
+        exited = []
+
+        class FakeSession:
+            def __init__(self, server_name):
+                self.server_name = server_name
+
+            async def __aenter__(self):
+                if self.server_name == "slow":
+                    await asyncio.sleep(10)
+                session = AsyncMock()
+                session.list_tools.return_value = Mock(tools=[])
+                return session
+
+            async def __aexit__(self, *exc_info):
+                exited.append(self.server_name)
+
+        mock_client = Mock()
+        mock_client.connections = {"fast": {}, "slow": {}}
+        mock_client.session.side_effect = FakeSession
+
+        with patch('agentdk.agent.agent_interface.get_mcp_config', return_value={}), \
+             patch('agentdk.agent.agent_interface.transform_config_for_mcp_client', return_value={}), \
+             patch('langchain_mcp_adapters.client.MultiServerMCPClient', return_value=mock_client):
+            with pytest.raises(AgentInitializationError, match="did not initialize within"):
+                await agent._setup_mcp_client()
+
+        assert "fast" in exited
+        assert agent._persistent_session_manager.active_session_count == 0
+
     @pytest.mark.asyncio
     async def test_setup_mcp_client_error_handling(self):
         """Test MCP client setup error handling."""
@@ -501,7 +690,7 @@ class TestSubAgent:
         
         await agent._load_tools()
         
-        assert agent._tools == []
+        assert agent._tools == ()
 
     @pytest.mark.asyncio
     async def test_load_tools_success(self):
@@ -519,7 +708,20 @@ class TestSubAgent:
             
             mock_get_tools.assert_called_once()
             mock_wrap.assert_called_once_with(mock_tools)
-            assert agent._tools == wrapped_tools
+            assert agent._tools == tuple(wrapped_tools)
+
+    @pytest.mark.asyncio
+    async def test_load_tools_skips_when_initialized(self):
+        """Test _load_tools does not append duplicate tools after initialization."""
+        agent = ConcreteSubAgent(tools=[Mock()])
+        agent._mcp_client = Mock()
+        agent._initialized = True
+
+        with patch.object(agent, '_get_tools_from_mcp', new_callable=AsyncMock) as mock_get_tools:
+            await agent._load_tools()
+
+        mock_get_tools.assert_not_called()
+        assert len(agent.tools) == 1
 
     @pytest.mark.asyncio
     async def test_load_tools_error_propagation(self):
@@ -584,6 +786,22 @@ class TestSubAgent:
         
         assert tools == []
 
+    @pytest.mark.asyncio
+    async def test_get_tools_from_mcp_resolves_fetcher_once(self):
+        """Test the tool fetch strategy is chosen once and then reused."""
+        agent = ConcreteSubAgent()
+        agent._mcp_client = Mock()
+        agent._mcp_client.get_tools = AsyncMock(return_value=[Mock()])
+        agent._persistent_session_manager = None
+
+        with patch('agentdk.agent.agent_interface._resolve_tools_fetcher',
+                   wraps=agent_interface_module._resolve_tools_fetcher) as mock_resolve:
+            await agent._get_tools_from_mcp()
+            await agent._get_tools_from_mcp()
+
+        mock_resolve.assert_called_once()
+        assert agent._mcp_client.get_tools.await_count == 2
+
     def test_wrap_tools_with_logging_success(self):
         """Test simplified tool wrapping (no logging wrapper in current implementation)."""
         agent = ConcreteSubAgent()
@@ -680,4 +898,36 @@ class TestSubAgent:
         
         # Current implementation doesn't have complex logging wrapper
         # This test is no longer applicable with simplified implementation
-        assert hasattr(agent, '_wrap_tools_with_logging')
\ No newline at end of file
+        assert hasattr(agent, '_wrap_tools_with_logging')
+
+def test_lazy_module_imports_once():
+    """Test _lazy_module caches the imported module across calls."""
+    from agentdk.agent import agent_interface
+
+    with patch.dict(agent_interface._lazy_modules, clear=True), \
+         patch('agentdk.agent.agent_interface.importlib.import_module', return_value=Mock()) as mock_import:
+        first = agent_interface._lazy_module("langchain_core.messages")
+        second = agent_interface._lazy_module("langchain_core.messages")
+
+    assert first is second
+    mock_import.assert_called_once_with("langchain_core.messages")
+
+
+@pytest.mark.asyncio
+async def test_subagent_without_mcp_initialize_skips_mcp(mock_llm):
+    """Test SubAgentWithoutMCP builds its agent without touching the MCP path."""
+    from agentdk.agent.agent_interface import SubAgentWithoutMCP
+
+    agent = SubAgentWithoutMCP(llm=mock_llm, tools=[Mock()])
+
+    with patch.object(agent, '_setup_mcp_client', new_callable=AsyncMock) as mock_setup, \
+         patch.object(agent, '_load_tools', new_callable=AsyncMock) as mock_load, \
+         patch.object(agent, '_create_langgraph_agent', new_callable=AsyncMock) as mock_create:
+        await agent._initialize()
+        await agent._initialize()
+
+    mock_setup.assert_not_called()
+    mock_load.assert_not_called()
+    mock_create.assert_awaited_once()
+    assert agent.is_initialized
+    assert agent._persistent_session_manager is None
@@ -1,5 +1,6 @@
 """Tests for agentdk.agent.app_utils module."""
 
+import asyncio
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 
@@ -8,7 +9,8 @@ from agentdk.agent.app_utils import (
     format_memory_context,
     create_supervisor_workflow,
     prepare_query_with_memory,
-    create_workflow_messages
+    create_workflow_messages,
+    scatter_gather,
 )
 
 
@@ -285,6 +287,18 @@ class TestCreateSupervisorWorkflow:
             
             assert result == mock_app
     
+    def test_create_supervisor_parallel_handoffs(self):
+        """Test parallel mode enables concurrent handoffs to several agents."""
+        mock_agents = [Mock(), Mock()]
+        mock_model = Mock()
+
+        with patch('langgraph_supervisor.create_supervisor') as mock_create:
+            create_supervisor_workflow(mock_agents, mock_model, "prompt", parallel=True)
+
+        mock_create.assert_called_once_with(
+            mock_agents, model=mock_model, prompt="prompt", parallel_tool_calls=True
+        )
+
     def test_create_supervisor_import_error(self):
         """Test supervisor workflow creation with import error."""
         mock_agents = [Mock()]
@@ -333,6 +347,43 @@ class TestCreateSupervisorWorkflow:
             assert "Failed to create supervisor workflow" in error_msg
 
 
+class TestScatterGather:
+    """Test the scatter_gather function."""
+
+    @pytest.mark.asyncio
+    async def test_runs_queries_concurrently_in_order(self):
+        """Test all agents are queried at once and responses keep task order."""
+        started = []
+        release = asyncio.Event()
+
+        class AsyncAgent:
+            def __init__(self, name):
+                self.name = name
+
+            async def query_async(self, query):
+                started.append(self.name)
+                if len(started) == 2:
+                    release.set()
+                await release.wait()
+                return f"{self.name}: {query}"
+
+        responses = await asyncio.wait_for(
+            scatter_gather([(AsyncAgent("eda"), "sales"), (AsyncAgent("research"), "news")]),
+            timeout=1,
+        )
+
+        assert responses == ["eda: sales", "research: news"]
+
+    @pytest.mark.asyncio
+    async def test_sync_agents_run_in_threads(self):
+        """Test agents without query_async fall back to query in a worker thread."""
+        sync_agent = Mock(spec=["query"])
+        sync_agent.query.return_value = "sync answer"
+
+        assert await scatter_gather([(sync_agent, "question")]) == ["sync answer"]
+        sync_agent.query.assert_called_once_with("question")
+
+
 class TestPrepareQueryWithMemory:
     """Test the prepare_query_with_memory function."""
     
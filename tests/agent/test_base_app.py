@@ -199,6 +199,87 @@ class TestRootAgent:
             mock_query.assert_called_once_with("test prompt")
             assert result == "Query result"
     
+    @pytest.mark.asyncio
+    async def test_root_agent_query_async_without_memory(self):
+        """Test query_async runs the sync processing hook off the event loop."""
+        agent = ConcreteRootAgent(llm=self.mock_llm)
+
+        result = await agent.query_async("test prompt")
+
+        assert "Workflow response" in result
+
+    @pytest.mark.asyncio
+    async def test_root_agent_query_async_with_memory(self):
+        """Test query_async wraps the async hook with memory processing."""
+        memory_session = Mock()
+        memory_session.process_with_memory.return_value = {"enhanced": "data"}
+        memory_session.finalize_with_memory.return_value = "Final response"
+        agent = ConcreteRootAgent(llm=self.mock_llm, memory_session=memory_session)
+
+        async def aprocess(user_prompt, enhanced_input):
+            return f"async: {user_prompt}"
+
+        with patch.object(agent, '_aprocess_query', side_effect=aprocess):
+            result = await agent.query_async("test prompt")
+
+        memory_session.finalize_with_memory.assert_called_once_with("test prompt", "async: test prompt")
+        assert result == "Final response"
+
+    def test_root_agent_response_cache_skips_workflow(self):
+        """Test a cached response is returned without running the workflow again."""
+        agent = ConcreteRootAgent(llm=self.mock_llm, config={"response_cache": True})
+
+        first = agent.query("test prompt")
+        second = agent.query("  Test Prompt ")
+
+        assert first == second
+        agent.workflow.invoke.assert_called_once()
+
+    def test_root_agent_response_cache_hit_skips_memory_retrieval(self):
+        """Test a cache hit goes straight to finalize_with_memory."""
+        memory_session = Mock()
+        memory_session.process_with_memory.return_value = {"enhanced": "data"}
+        memory_session.finalize_with_memory.side_effect = lambda prompt, response: response
+        agent = ConcreteRootAgent(
+            llm=self.mock_llm, memory_session=memory_session, config={"response_cache": True}
+        )
+
+        first = agent.query("test prompt")
+        second = agent.query("test prompt")
+
+        assert first == second
+        memory_session.process_with_memory.assert_called_once_with("test prompt")
+        assert memory_session.finalize_with_memory.call_count == 2
+
+    def test_root_agent_response_cache_disabled_by_default(self):
+        """Test every query reaches the workflow when caching is not configured."""
+        agent = ConcreteRootAgent(llm=self.mock_llm)
+
+        agent.query("test prompt")
+        agent.query("test prompt")
+
+        assert agent.workflow.invoke.call_count == 2
+
+    def test_root_agent_background_memory_writes(self):
+        """Test memory finalization runs off the response path when configured."""
+        import threading
+
+        written = threading.Event()
+        memory_session = Mock()
+        memory_session.process_with_memory.return_value = {}
+        memory_session.finalize_with_memory.side_effect = lambda *args: written.set()
+        agent = ConcreteRootAgent(
+            llm=self.mock_llm,
+            memory_session=memory_session,
+            config={"background_memory_writes": True},
+        )
+
+        result = agent.query("test prompt")
+
+        assert result == "Workflow response"
+        assert written.wait(timeout=5)
+        memory_session.finalize_with_memory.assert_called_once_with("test prompt", "Workflow response")
+
     def test_root_agent_memory_utilities(self):
         """Test memory utility methods."""
         memory_session = Mock()
@@ -220,7 +301,7 @@ class TestRootAgent:
         
         # Test get_memory_aware_prompt
         enhanced_prompt = agent.get_memory_aware_prompt("base prompt")
-        assert enhanced_prompt == "Memory context\n\nbase prompt"
+        assert enhanced_prompt == "base prompt\n\nMEMORY CONTEXT:\nMemory context"
     
     def test_root_agent_memory_utilities_without_session(self):
         """Test memory utility methods without memory session."""
@@ -199,7 +199,7 @@ class TestFactoryIntegration:
             # Should be actual SubAgentWithoutMCP instance
             assert isinstance(agent, SubAgentWithoutMCP)
             assert agent.llm == self.mock_llm
-            assert agent._tools == test_tools
+            assert agent._tools == tuple(test_tools)
 
 
 class TestFactoryLogging:
@@ -143,6 +143,50 @@ class TestPromptResolution:
         finally:
             temp_path.unlink()
 
+    def test_resolve_file_prompt_cached_until_modified(self, tmp_path):
+        """Test a prompt file is read once per modification time."""
+        import os
+        from agentdk.builder.agent_builder import _read_prompt_file
+
+        prompt_file = tmp_path / "prompt.txt"
+        prompt_file.write_text("First version")
+        _read_prompt_file.cache_clear()
+
+        builder = AgentBuilder()
+        builder._config['prompt'] = str(prompt_file)
+        with patch.object(Path, 'read_text', wraps=prompt_file.read_text) as mock_read:
+            assert builder._resolve_prompt() == "First version"
+            assert AgentBuilder().with_prompt(prompt_file)._resolve_prompt() == "First version"
+            assert mock_read.call_count == 1
+
+        prompt_file.write_text("Second version")
+        st = prompt_file.stat()
+        os.utime(prompt_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        assert builder._resolve_prompt() == "Second version"
+
+    def test_resolve_file_prompt_normalizes_newlines(self, tmp_path):
+        """Test Windows line endings in a prompt file are read as newlines."""
+        prompt_file = tmp_path / "prompt.txt"
+        prompt_file.write_bytes(b"Line one\r\nLine two\r\n")
+
+        builder = AgentBuilder()
+        builder._config['prompt'] = str(prompt_file)
+
+        assert builder._resolve_prompt() == "Line one\nLine two\n"
+
+    def test_resolve_literal_prompt_without_stat(self):
+        """Test multi-line and overlong prompts resolve as literals."""
+        builder = AgentBuilder()
+        builder._config['prompt'] = "You are helpful.\nSee notes.md"
+
+        with patch('agentdk.builder.agent_builder.os.stat') as mock_stat:
+            assert builder._resolve_prompt() == "You are helpful.\nSee notes.md"
+        mock_stat.assert_not_called()
+
+        long_prompt = "x" * 5000
+        builder._config['prompt'] = long_prompt
+        assert builder._resolve_prompt() == long_prompt
+
     def test_resolve_default_prompt(self):
         """Test default prompt when none provided."""
         builder = AgentBuilder()
@@ -211,6 +255,16 @@ class TestAgentBuilding:
             assert call_kwargs['llm'] is mock_llm
             assert call_kwargs['prompt'] == "Test prompt"
 
+    def test_build_leaves_config_unchanged(self):
+        """Test that build() passes the resolved prompt without storing it."""
+        with patch('agentdk.builder.agent_builder.SubAgentWithoutMCP'):
+            builder = AgentBuilder().with_llm(Mock()).with_prompt(lambda: "Resolved")
+            before = dict(builder._config)
+
+            builder.build()
+
+            assert builder._config == before
+
 
 class TestErrorHandling:
     """Test error handling scenarios."""
@@ -220,4 +274,12 @@ class TestErrorHandling:
         builder = AgentBuilder().with_prompt("Test prompt")
         
         with pytest.raises(ValueError, match="LLM is required"):
-            builder.build()
\ No newline at end of file
+            builder.build()
+
+def test_agent_builder_uses_slots():
+    """Test AgentBuilder keeps its state in slots rather than an instance dict."""
+    builder = AgentBuilder()
+
+    assert not hasattr(builder, '__dict__')
+    with pytest.raises(AttributeError):
+        builder.unexpected = True
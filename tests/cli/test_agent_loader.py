@@ -41,6 +41,14 @@ class TestAgentLoader:
         bound_llm = mock_llm.bind(temperature=0.5)
         assert bound_llm is mock_llm
     
+    def test_create_mock_llm_reuses_class(self):
+        """Test mock LLMs share one class instead of defining a new one per call."""
+        first = self.loader._create_mock_llm()
+        second = self.loader._create_mock_llm()
+
+        assert first is not second
+        assert type(first) is type(second)
+
     def test_load_agent_invalid_path(self):
         """Test loading agent with invalid path."""
         with pytest.raises(ValueError, match="Invalid agent path"):
@@ -72,26 +72,49 @@ class TestSessionsCommands:
                     main()
                     mock_echo.assert_called_with("No session found for agent: test_agent")
     
-    def test_sessions_list_command_no_sessions(self):
+    def test_sessions_list_command_no_sessions(self, tmp_path):
         """Test sessions list command when no sessions exist.""" 
         with patch('sys.argv', ['agentdk', 'sessions', 'list']):
-            # Mock the Path.home() and glob to return no sessions
-            with patch('pathlib.Path.home') as mock_home:
-                mock_sessions_dir = Mock()
-                mock_sessions_dir.exists.return_value = True
-                mock_sessions_dir.glob.return_value = []
-                
-                # Create a proper Path mock chain  
-                mock_home_path = MagicMock()
-                mock_agentdk_path = MagicMock()
-                mock_home_path.__truediv__.return_value = mock_agentdk_path
-                mock_agentdk_path.__truediv__.return_value = mock_sessions_dir
-                mock_home.return_value = mock_home_path
-                
+            # Point the sessions directory at an empty one; other files are ignored
+            (tmp_path / "agent_session.wal.jsonl").write_text("")
+            with patch('agentdk.agent.session_manager._default_session_dir', return_value=tmp_path):
                 with patch('click.echo') as mock_echo:
                     main()
                     mock_echo.assert_called_with("No sessions found")
     
+    def test_sessions_list_command_no_directory(self, tmp_path):
+        """Test sessions list command when the sessions directory is missing."""
+        with patch('sys.argv', ['agentdk', 'sessions', 'list']):
+            with patch('agentdk.agent.session_manager._default_session_dir', return_value=tmp_path / "missing"):
+                with patch('click.echo') as mock_echo:
+                    main()
+                    mock_echo.assert_called_with("No sessions directory found")
+    
+    def test_scan_session_files_strips_only_the_suffix(self, tmp_path):
+        """Test agent names keep any inner "_session" text."""
+        from agentdk.cli import main as cli_main
+
+        (tmp_path / "my_session_bot_session.json").write_text("{}")
+        (tmp_path / "my_session_bot_session.wal.jsonl").write_text("")
+
+        assert cli_main._scan_session_files(tmp_path) == [
+            ("my_session_bot", tmp_path / "my_session_bot_session.json")
+        ]
+    
+    def test_sessions_clear_all_removes_interaction_logs(self, tmp_path):
+        """Test clear --all deletes session snapshots and their interaction logs."""
+        (tmp_path / "agent_session.json").write_text("{}")
+        (tmp_path / "agent_session.wal.jsonl").write_text("")
+        (tmp_path / "orphan_session.wal.jsonl").write_text("")
+
+        with patch('sys.argv', ['agentdk', 'sessions', 'clear', '--all']):
+            with patch('agentdk.agent.session_manager._default_session_dir', return_value=tmp_path):
+                with patch('click.echo') as mock_echo:
+                    main()
+                    mock_echo.assert_called_with("Cleared 1 sessions")
+
+        assert list(tmp_path.iterdir()) == []
+    
     def test_sessions_clear_command(self):
         """Test sessions clear command."""
         with patch('sys.argv', ['agentdk', 'sessions', 'clear', 'test_agent']):
@@ -263,4 +286,194 @@ class TestGlobalCLIHistory:
                 
                 # Verify file write was called
                 mock_open.assert_called()
-                mock_write_file.write.assert_called()
\ No newline at end of file
+                mock_write_file.write.assert_called()
+
+class TestDynamicPath:
+    """Test project root discovery for agent files."""
+
+    def test_project_root_found_and_cached(self, tmp_path, monkeypatch):
+        """Test the project root is detected once per agent directory."""
+        from agentdk.cli import main as cli_main
+
+        (tmp_path / "pyproject.toml").write_text("")
+        agent_dir = tmp_path / "agents" / "nested"
+        agent_dir.mkdir(parents=True)
+        agent_file = agent_dir / "agent.py"
+
+        monkeypatch.setattr(sys, 'path', list(sys.path))
+        monkeypatch.setattr(cli_main, '_project_root_cache', {})
+
+        with patch('agentdk.cli.main.os.scandir', wraps=os.scandir) as mock_scandir:
+            assert cli_main.setup_dynamic_path(agent_file) == tmp_path.resolve()
+            assert mock_scandir.call_count == 3
+            assert cli_main.setup_dynamic_path(agent_file) == tmp_path.resolve()
+            assert mock_scandir.call_count == 3
+
+        assert str(agent_dir.resolve()) in sys.path
+        assert str(tmp_path.resolve()) in sys.path
+
+
+class TestLoadAgentFromFile:
+    """Test agent discovery in agent files."""
+
+    def test_prefers_shortest_agent_class(self, tmp_path, monkeypatch):
+        """Test classes win over factories, then shorter and alphabetical names."""
+        from agentdk.cli import main as cli_main
+
+        agent_file = tmp_path / "agent.py"
+        agent_file.write_text(
+            "class ZetaAgent:\n"
+            "    def query(self, q): return q\n"
+            "class BetaAgent:\n"
+            "    def query(self, q): return q\n"
+            "class _Hidden:\n"
+            "    def query(self, q): return q\n"
+            "class Helper:\n"
+            "    pass\n"
+            "def create_agent(**kwargs): return None\n"
+        )
+        monkeypatch.setattr(sys, 'path', list(sys.path))
+
+        assert cli_main.load_agent_from_file(agent_file).__name__ == "BetaAgent"
+
+    def test_factory_function_found(self, tmp_path, monkeypatch):
+        """Test a create_* factory is used when no agent class exists."""
+        from agentdk.cli import main as cli_main
+
+        agent_file = tmp_path / "agent.py"
+        agent_file.write_text("def create_agent(**kwargs): return None\n")
+        monkeypatch.setattr(sys, 'path', list(sys.path))
+
+        assert cli_main.load_agent_from_file(agent_file).__name__ == "create_agent"
+
+    def test_module_reused_until_file_changes(self, tmp_path, monkeypatch):
+        """Test an unchanged agent file is executed only once."""
+        import importlib.util
+        from agentdk.cli import main as cli_main
+
+        agent_file = tmp_path / "agent.py"
+        agent_file.write_text("def create_agent(**kwargs): return None\n")
+        monkeypatch.setattr(sys, 'path', list(sys.path))
+        monkeypatch.setattr(cli_main, '_agent_module_cache', {})
+
+        with patch('importlib.util.module_from_spec', wraps=importlib.util.module_from_spec) as mock_load:
+            first = cli_main.load_agent_from_file(agent_file)
+            assert cli_main.load_agent_from_file(agent_file) is first
+            assert mock_load.call_count == 1
+
+            mtime_ns = agent_file.stat().st_mtime_ns + 1_000_000_000
+            os.utime(agent_file, ns=(mtime_ns, mtime_ns))
+            assert cli_main.load_agent_from_file(agent_file) is not first
+            assert mock_load.call_count == 2
+
+
+def test_add_to_sys_path_tracks_external_changes(monkeypatch):
+    """Test sys.path additions skip duplicates and notice outside edits."""
+    from agentdk.cli import main as cli_main
+
+    monkeypatch.setattr(sys, 'path', ['/base'])
+    cli_main._add_to_sys_path(['/a', '/base', '/a'])
+    assert sys.path == ['/a', '/base']
+
+    sys.path.remove('/a')
+    cli_main._add_to_sys_path(['/a'])
+    assert sys.path == ['/a', '/base']
+
+
+def test_add_to_sys_path_keeps_insertion_order(monkeypatch):
+    """Test batched additions end up in the same order as per-path inserts."""
+    from agentdk.cli import main as cli_main
+
+    monkeypatch.setattr(sys, 'path', ['/base'])
+    cli_main._add_to_sys_path(['/root', '/root/agents', '/base', '/root/agents/nested'])
+    assert sys.path == ['/root/agents/nested', '/root/agents', '/root', '/base']
+
+
+class TestCreateAgentInstance:
+    """Test agent construction from classes and factories."""
+
+    def test_unsupported_kwargs_are_dropped(self):
+        """Test keywords the target does not accept are filtered out."""
+        from agentdk.cli import main as cli_main
+
+        def create_agent(llm=None, resume_session=False):
+            return (llm, resume_session)
+
+        agent = cli_main.create_agent_instance(
+            create_agent, Path("agent.py"), llm="llm", memory=True, resume_session=True
+        )
+        assert agent == ("llm", True)
+
+    def test_var_kwargs_receive_everything(self):
+        """Test targets taking **kwargs still get every keyword."""
+        from agentdk.cli import main as cli_main
+
+        class Agent:
+            def __init__(self, **kwargs):
+                self.kwargs = kwargs
+
+        agent = cli_main.create_agent_instance(Agent, Path("agent.py"), llm="llm", memory=True)
+        assert agent.kwargs == {"llm": "llm", "memory": True}
+
+
+class TestFastParseArgs:
+    """Test the argparse-free parsing of common command forms."""
+
+    def test_common_forms_match_argparse(self):
+        """Test fast-parsed forms produce the same values as argparse."""
+        from agentdk.cli import main as cli_main
+
+        for argv in (
+            ['run', 'agent.py'],
+            ['run', '--resume', 'agent.py'],
+            ['sessions', 'list'],
+            ['sessions', 'status', 'my_agent'],
+            ['sessions', 'clear', 'my_agent'],
+            ['sessions', 'clear', '--all'],
+        ):
+            fast = cli_main._fast_parse_args(argv)
+            assert fast is not None, argv
+            assert vars(fast) == vars(cli_main._build_parser(argv).parse_args(argv))
+
+    def test_other_forms_fall_back_to_argparse(self):
+        """Test help, options and malformed input are left to argparse."""
+        from agentdk.cli import main as cli_main
+
+        for argv in (
+            [],
+            ['--help'],
+            ['--log-level', 'DEBUG', 'run', 'agent.py'],
+            ['run'],
+            ['run', 'agent.py', '--verbose'],
+            ['sessions'],
+            ['sessions', 'status'],
+            ['sessions', 'clear', 'a', 'b'],
+        ):
+            assert cli_main._fast_parse_args(argv) is None, argv
+
+    def test_parser_builds_only_the_named_subcommand(self):
+        """Test the fallback parser leaves other subcommands unpopulated."""
+        from agentdk.cli import main as cli_main
+
+        parser = cli_main._build_parser(['--log-level', 'DEBUG', 'run', 'agent.py'])
+        args = parser.parse_args(['--log-level', 'DEBUG', 'run', 'agent.py'])
+        assert args.agent_file == Path('agent.py') and args.log_level == 'DEBUG'
+
+        # The sessions subcommand is registered but its subcommands are not built
+        assert not hasattr(parser.parse_args(['sessions']), 'sessions_command')
+
+
+def test_cli_import_defers_asyncio():
+    """Test importing the CLI does not import asyncio until it is needed."""
+    import subprocess
+
+    code = (
+        "import sys, agentdk.cli.main as m; "
+        "print('asyncio' in sys.modules); "
+        "from agentdk.cli.main import shutdown_event; "
+        "print(shutdown_event is m._get_shutdown_event())"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.split() == ["False", "True"]
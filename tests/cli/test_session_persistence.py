@@ -1,5 +1,6 @@
 """Tests for session persistence functionality."""
 
+import asyncio
 import json
 import pytest
 import tempfile
@@ -7,7 +8,7 @@ from pathlib import Path
 from unittest.mock import Mock, AsyncMock, patch
 from datetime import datetime
 
-from agentdk.agent.session_manager import SessionManager
+from agentdk.agent.session_manager import FLUSH_EVERY_INTERACTIONS, SessionManager
 from agentdk.memory.memory_aware_agent import MemoryAwareSession
 
 
@@ -60,8 +61,10 @@ class TestSessionManager:
         assert session_manager.current_session["format_version"] == "1.0"
         assert session_manager.current_session["interactions"] == []
         assert session_manager.current_session["memory_state"] == {}
-        assert "created_at" in session_manager.current_session
-        assert "last_updated" in session_manager.current_session
+        assert (
+            session_manager.current_session["created_at"]
+            == session_manager.current_session["last_updated"]
+        )
     
     @pytest.mark.asyncio
     async def test_save_interaction(self, session_manager):
@@ -76,6 +79,7 @@ class TestSessionManager:
         assert interactions[0]["user_input"] == "test query"
         assert interactions[0]["agent_response"] == "test response"
         assert "timestamp" in interactions[0]
+        assert session_manager.current_session["last_updated"] == interactions[0]["timestamp"]
         assert session_manager.current_session["memory_state"] == memory_state
     
     @pytest.mark.asyncio
@@ -93,6 +97,7 @@ class TestSessionManager:
         # Create and save a session first
         await session_manager.start_new_session()
         await session_manager.save_interaction("test query", "test response")
+        await session_manager.close()
         
         # Create new manager instance and load session
         new_manager = SessionManager("test_agent", session_dir=session_manager.session_dir)
@@ -113,6 +118,10 @@ class TestSessionManager:
         assert result is False
         # Should create a backup and start fresh
         assert session_manager.current_session["interactions"] == []
+        backups = list(session_manager.session_dir.glob("test_agent_session_corrupted_*.json"))
+        assert len(backups) == 1
+        assert backups[0].read_text() == "invalid json {"
+        assert session_manager._validate_session_format()
     
     def test_validate_session_format(self, session_manager):
         """Test session format validation."""
@@ -159,6 +168,44 @@ class TestSessionManager:
         assert info["has_memory_state"] is True
         assert info["format_version"] == "1.0"
     
+    @pytest.mark.parametrize("memory_state, has_memory_state", [
+        ({"test": "data"}, True),
+        ({}, False),
+        (["fact"], True),
+        ([], False),
+    ])
+    def test_get_session_info_streamed(self, session_manager, memory_state, has_memory_state):
+        """Test the ijson summary matches a full parse of the session file."""
+        pytest.importorskip("ijson")
+        import agentdk.agent.session_manager as session_module
+
+        session = {
+            "agent_name": "test_agent",
+            "created_at": "2024-01-01T00:00:00",
+            "last_updated": "2024-01-01T01:00:00",
+            "format_version": "1.0",
+            "interactions": [
+                {"user_input": "q1", "agent_response": "a1", "agent_name": "nested"},
+                {"user_input": "q2", "agent_response": "a2"},
+            ],
+            "memory_state": memory_state,
+        }
+        session_manager.session_file.write_text(json.dumps(session))
+
+        with patch.object(session_module, "_loads") as loads:
+            info = session_manager.get_session_info()
+        loads.assert_not_called()
+
+        assert info == {
+            "exists": True,
+            "agent_name": "test_agent",
+            "created_at": "2024-01-01T00:00:00",
+            "last_updated": "2024-01-01T01:00:00",
+            "format_version": "1.0",
+            "interaction_count": 2,
+            "has_memory_state": has_memory_state,
+        }
+    
     def test_has_previous_session(self, session_manager):
         """Test checking for previous session existence."""
         assert not session_manager.has_previous_session()
@@ -172,6 +219,91 @@ class TestSessionManager:
         session_manager.session_file.write_text(json.dumps(valid_session))
         assert session_manager.has_previous_session()
     
+    def test_session_file_parsed_once_until_changed(self, session_manager):
+        """Test status checks reuse one parse of an unchanged session file."""
+        import agentdk.agent.session_manager as session_module
+
+        valid_session = {
+            "agent_name": "test_agent",
+            "created_at": datetime.now().isoformat(),
+            "interactions": [],
+        }
+        session_manager.session_file.write_text(json.dumps(valid_session))
+
+        with patch.object(session_module, "_loads", wraps=session_module._loads) as loads:
+            assert session_manager.has_previous_session()
+            assert session_manager.get_session_info()["interaction_count"] == 0
+            assert loads.call_count == 1
+
+            valid_session["interactions"].append({"user_input": "q", "agent_response": "a"})
+            session_manager.session_file.write_text(json.dumps(valid_session))
+            assert session_manager.has_previous_session()
+            assert loads.call_count == 2
+            assert session_manager.get_session_info()["interaction_count"] == 1
+            assert loads.call_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_load_session_parses_file_once(self, session_manager):
+        """Test load_session validates and loads from a single parse."""
+        import agentdk.agent.session_manager as session_module
+
+        old_session = {
+            "agent_name": "test_agent",
+            "created_at": "2024-01-01T00:00:00",
+            "interactions": [{"user_input": "q", "agent_response": "a"}],
+        }
+        session_manager.session_file.write_text(json.dumps(old_session))
+
+        with patch.object(session_module, "_loads", wraps=session_module._loads) as loads:
+            assert await session_manager.load_session() is True
+
+        loads.assert_called_once()
+        assert session_manager.current_session["format_version"] == "0.9"
+        assert session_manager.current_session["last_updated"] == "2024-01-01T00:00:00"
+    
+    @pytest.mark.asyncio
+    async def test_load_session_shows_last_five_interactions(self, session_manager):
+        """Test resuming a long session echoes only the most recent interactions."""
+        session = {
+            "agent_name": "test_agent",
+            "created_at": "2024-01-01T00:00:00",
+            "format_version": "1.0",
+            "interactions": [
+                {"user_input": f"q{i}", "agent_response": f"a{i}"} for i in range(7)
+            ],
+        }
+        session_manager.session_file.write_text(json.dumps(session))
+
+        with patch("agentdk.agent.session_manager._echo") as mock_echo:
+            assert await session_manager.load_session() is True
+
+        echoed = [call.args[0] for call in mock_echo.call_args_list]
+        assert [line for line in echoed if line.startswith("[user]")] == [
+            f"[user]: q{i}" for i in range(2, 7)
+        ]
+        assert "... (2 earlier interactions)" in echoed
+    
+    def test_default_session_dir_resolved_once(self, temp_session_dir):
+        """Test managers without a session_dir share one resolved default."""
+        from agentdk.agent.session_manager import _default_session_dir
+
+        _default_session_dir.cache_clear()
+        try:
+            with patch.object(Path, "home", return_value=temp_session_dir) as mock_home:
+                first = SessionManager("agent_one")
+                second = SessionManager("agent_two")
+        finally:
+            _default_session_dir.cache_clear()
+
+        mock_home.assert_called_once()
+        assert first.session_dir == second.session_dir == temp_session_dir / ".agentdk" / "sessions"
+    
+    def test_session_manager_uses_slots(self, session_manager):
+        """Test SessionManager keeps its state in slots rather than an instance dict."""
+        assert not hasattr(session_manager, "__dict__")
+        with pytest.raises(AttributeError):
+            session_manager.unexpected = True
+    
     def test_get_session_context(self, session_manager):
         """Test getting session context for agent restoration."""
         session_manager.current_session = {
@@ -187,6 +319,188 @@ class TestSessionManager:
         assert context[1]["user_input"] == "query2"
 
 
+class TestSessionWriteCoalescing:
+    """Test SessionManager batches session file writes."""
+
+    @pytest.mark.asyncio
+    async def test_logged_interactions_do_not_rewrite_snapshot(self, temp_session_dir):
+        """Test logged turns spaced beyond flush_delay leave the snapshot alone."""
+        manager = SessionManager("test_agent", session_dir=temp_session_dir, flush_delay=0.01)
+        await manager.start_new_session()
+
+        with patch('agentdk.agent.session_manager.os.replace') as mock_replace:
+            for i in range(FLUSH_EVERY_INTERACTIONS - 1):
+                await manager.save_interaction(f"q{i}", f"a{i}")
+                await asyncio.sleep(0.02)
+
+        mock_replace.assert_not_called()
+        assert manager._flush_task is None
+
+    @pytest.mark.asyncio
+    async def test_unlogged_interactions_coalesced_into_one_write(self, temp_session_dir):
+        """Test interactions the log rejected are flushed together after the delay."""
+        manager = SessionManager("test_agent", session_dir=temp_session_dir, flush_delay=0.01)
+        await manager.start_new_session()
+
+        with patch.object(SessionManager, '_append_to_wal', return_value=False):
+            await manager.save_interaction("q1", "a1")
+            await manager.save_interaction("q2", "a2")
+        assert json.loads(manager.session_file.read_text())["interactions"] == []
+
+        await asyncio.sleep(0.05)
+
+        data = json.loads(manager.session_file.read_text())
+        assert [i["user_input"] for i in data["interactions"]] == ["q1", "q2"]
+
+    @pytest.mark.asyncio
+    async def test_flushes_every_n_interactions(self, temp_session_dir):
+        """Test a full batch of interactions is written without waiting for the delay."""
+        manager = SessionManager("test_agent", session_dir=temp_session_dir, flush_delay=60)
+        await manager.start_new_session()
+
+        for i in range(FLUSH_EVERY_INTERACTIONS):
+            await manager.save_interaction(f"q{i}", f"a{i}")
+
+        data = json.loads(manager.session_file.read_text())
+        assert len(data["interactions"]) == FLUSH_EVERY_INTERACTIONS
+        assert manager._flush_task is None
+
+    @pytest.mark.asyncio
+    async def test_close_writes_pending_interactions(self, temp_session_dir):
+        """Test close() flushes interactions still waiting for the delay."""
+        manager = SessionManager("test_agent", session_dir=temp_session_dir, flush_delay=60)
+        await manager.start_new_session()
+        await manager.save_interaction("q", "a", {"facts": 1})
+
+        await manager.close()
+
+        data = json.loads(manager.session_file.read_text())
+        assert data["interactions"][0]["agent_response"] == "a"
+        assert data["memory_state"] == {"facts": 1}
+        assert manager._flush_task is None
+        assert not manager.wal_file.exists()
+
+    @pytest.mark.asyncio
+    async def test_unflushed_interactions_replayed_from_log(self, temp_session_dir):
+        """Test interactions logged after the last snapshot survive a missed close()."""
+        manager = SessionManager("test_agent", session_dir=temp_session_dir, flush_delay=60)
+        await manager.start_new_session()
+        await manager.save_interaction("q1", "a1")
+        await manager.save_interaction("q2", "a2")
+        manager._cancel_pending_flush()
+
+        resumed = SessionManager("test_agent", session_dir=temp_session_dir)
+        assert await resumed.load_session() is True
+
+        context = resumed.get_session_context()
+        assert [i["user_input"] for i in context] == ["q1", "q2"]
+
+    @pytest.mark.asyncio
+    async def test_unflushed_memory_state_replayed_from_log(self, temp_session_dir):
+        """Test memory state saved with a logged interaction survives a missed close()."""
+        manager = SessionManager("test_agent", session_dir=temp_session_dir, flush_delay=60)
+        await manager.start_new_session()
+        await manager.save_interaction("q1", "a1", {"facts": 1})
+        await manager.save_interaction("q2", "a2", {"facts": 2})
+        manager._cancel_pending_flush()
+
+        resumed = SessionManager("test_agent", session_dir=temp_session_dir)
+        await resumed.load_session()
+
+        assert resumed.get_memory_state() == {"facts": 2}
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("bad_line", [b'{"interaction": {}}', b'1', b'{"index": 1'])
+    async def test_malformed_log_entry_stops_replay(self, temp_session_dir, bad_line):
+        """Test a malformed log line ends replay without discarding the snapshot."""
+        manager = SessionManager("test_agent", session_dir=temp_session_dir, flush_delay=60)
+        await manager.start_new_session()
+        for i in range(3):
+            await manager.save_interaction(f"q{i}", f"a{i}")
+        await manager.close()
+        await manager.save_interaction("q3", "a3")
+        with open(manager.wal_file, 'ab') as f:
+            f.write(bad_line + b"\n")
+        await manager.save_interaction("q4", "a4")
+
+        resumed = SessionManager("test_agent", session_dir=temp_session_dir)
+        assert await resumed.load_session() is True
+
+        assert [i["user_input"] for i in resumed.get_session_context()] == ["q0", "q1", "q2", "q3"]
+        assert not list(temp_session_dir.glob("*_corrupted_*"))
+
+    @pytest.mark.asyncio
+    async def test_log_entries_already_in_snapshot_skipped(self, temp_session_dir):
+        """Test replay ignores logged interactions the snapshot already holds."""
+        manager = SessionManager("test_agent", session_dir=temp_session_dir, flush_delay=60)
+        await manager.start_new_session()
+        await manager.save_interaction("q1", "a1")
+        logged = manager.wal_file.read_text()
+        await manager.close()
+        manager.wal_file.write_text(logged)
+
+        resumed = SessionManager("test_agent", session_dir=temp_session_dir)
+        await resumed.load_session()
+
+        assert len(resumed.get_session_context()) == 1
+
+
+class TestAtomicSessionWrites:
+    """Test session snapshots replace the file atomically."""
+
+    @pytest.mark.asyncio
+    async def test_failed_write_keeps_previous_snapshot(self, temp_session_dir):
+        """Test a write that fails midway leaves the last good snapshot in place."""
+        import agentdk.agent.session_manager as session_module
+
+        manager = SessionManager("test_agent", session_dir=temp_session_dir, flush_delay=60)
+        await manager.start_new_session()
+        await manager.save_interaction("q1", "a1")
+        await manager.close()
+        before = manager.session_file.read_bytes()
+
+        await manager.save_interaction("q2", "a2")
+        with patch.object(session_module, "_dumps", side_effect=TypeError("not serializable")):
+            await manager.close()
+
+        assert manager.session_file.read_bytes() == before
+        assert manager.wal_file.exists()
+
+    @pytest.mark.asyncio
+    async def test_no_temporary_file_left_behind(self, temp_session_dir):
+        """Test a successful write renames its temporary file into place."""
+        manager = SessionManager("test_agent", session_dir=temp_session_dir)
+        await manager.start_new_session()
+
+        assert manager.session_file.exists()
+        assert not manager.session_file.with_suffix('.json.tmp').exists()
+
+
+class TestSessionSerialization:
+    """Test session file encoding."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    async def test_compact_round_trip(self, temp_session_dir, use_orjson):
+        """Test sessions round-trip with and without orjson installed."""
+        import agentdk.agent.session_manager as session_module
+
+        orjson_module = session_module.orjson if use_orjson else None
+        with patch.object(session_module, "orjson", orjson_module):
+            manager = SessionManager("test_agent", session_dir=temp_session_dir)
+            await manager.start_new_session()
+            await manager.save_interaction("héllo", "wörld", {1: "numeric key"})
+            await manager.close()
+
+            raw = manager.session_file.read_text(encoding="utf-8")
+            assert "\n  " not in raw
+
+            resumed = SessionManager("test_agent", session_dir=temp_session_dir)
+            assert await resumed.load_session() is True
+            assert resumed.get_session_context()[0]["user_input"] == "héllo"
+            assert resumed.get_memory_state() == {"1": "numeric key"}
+
+
 class TestMemoryAwareAgentSessionIntegration:
     """Test integration between MemoryAwareAgent and session management."""
     
@@ -268,8 +582,9 @@ class TestSessionFormatMigration:
         session_manager.session_file.write_text(json.dumps(old_session))
         
         # Load and validate migration
-        loaded_session = session_manager._load_and_validate_session()
+        is_valid, loaded_session = session_manager._read_validate_and_migrate()
         
+        assert is_valid
         assert loaded_session["format_version"] == "0.9"
         assert "last_updated" in loaded_session
         assert "memory_state" in loaded_session
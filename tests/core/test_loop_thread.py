@@ -0,0 +1,89 @@
+"""Tests for the shared background event loop thread."""
+
+import asyncio
+import threading
+
+import pytest
+
+from agentdk.core.loop_thread import AsyncLoopThread, get_loop_thread, run_sync, submit
+
+
+class TestAsyncLoopThread:
+    """Test the AsyncLoopThread class."""
+
+    def test_lazy_start(self):
+        """Test that the loop is not started until first use."""
+        loop_thread = AsyncLoopThread(name="test-loop")
+        assert not loop_thread.is_running
+
+        loop_thread.start()
+        try:
+            assert loop_thread.is_running
+        finally:
+            loop_thread.stop()
+
+        assert not loop_thread.is_running
+
+    def test_run_executes_on_background_thread(self):
+        """Test that coroutines run on the loop thread, not the caller."""
+        loop_thread = AsyncLoopThread(name="test-loop")
+
+        async def thread_name():
+            return threading.current_thread().name
+
+        try:
+            assert loop_thread.run(thread_name()) == "test-loop"
+        finally:
+            loop_thread.stop()
+
+    def test_run_reuses_same_loop(self):
+        """Test that repeated calls share one event loop."""
+        loop_thread = AsyncLoopThread(name="test-loop")
+
+        async def current_loop():
+            return asyncio.get_running_loop()
+
+        try:
+            first = loop_thread.run(current_loop())
+            second = loop_thread.run(current_loop())
+            assert first is second is loop_thread.loop
+        finally:
+            loop_thread.stop()
+
+    def test_run_propagates_exceptions(self):
+        """Test that coroutine exceptions surface to the caller."""
+        loop_thread = AsyncLoopThread(name="test-loop")
+
+        async def fail():
+            raise ValueError("boom")
+
+        try:
+            with pytest.raises(ValueError, match="boom"):
+                loop_thread.run(fail())
+        finally:
+            loop_thread.stop()
+
+    def test_run_from_loop_thread_does_not_deadlock(self):
+        """Test re-entrant run() from a coroutine already on the loop."""
+        loop_thread = AsyncLoopThread(name="test-loop")
+
+        async def inner():
+            return "inner"
+
+        async def outer():
+            return loop_thread.run(inner())
+
+        try:
+            assert loop_thread.run(outer(), timeout=5) == "inner"
+        finally:
+            loop_thread.stop()
+
+
+def test_module_helpers_use_shared_loop():
+    """Test submit() and run_sync() use the process-wide loop thread."""
+
+    async def current_loop():
+        return asyncio.get_running_loop()
+
+    assert run_sync(current_loop()) is get_loop_thread().loop
+    assert submit(current_loop()).result(timeout=5) is get_loop_thread().loop
@@ -101,6 +101,27 @@ def test_get_config_search_paths():
         assert Path.cwd() / "mcp_config.json" in paths 
 
 
+def test_get_class_dir_cached_per_class():
+    """Test get_class_dir resolves a class's directory once and caches it."""
+    from agentdk.core.mcp_load import get_class_dir
+
+    class LocalAgent:
+        pass
+
+    with patch('inspect.getfile', return_value="/agent/dir/agent.py") as mock_getfile:
+        assert get_class_dir(LocalAgent) == Path("/agent/dir")
+        assert get_class_dir(LocalAgent) == Path("/agent/dir")
+
+    mock_getfile.assert_called_once_with(LocalAgent)
+
+
+def test_get_class_dir_unknown_location():
+    """Test get_class_dir returns None for classes without a source file."""
+    from agentdk.core.mcp_load import get_class_dir
+
+    assert get_class_dir(int) is None
+
+
 def test_resolve_relative_paths() -> None:
     """Test that relative paths in configuration are resolved relative to config directory."""
     config = {
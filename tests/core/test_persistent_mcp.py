@@ -65,6 +65,22 @@ class TestPersistentSessionContext:
         assert context.session == mock_session
         assert context._is_active is True
 
+    @pytest.mark.asyncio
+    async def test_enter_without_validation_skips_list_tools(self):
+        """Test validate=False opens the session without listing tools."""
+        mock_client = MagicMock()
+        mock_session = AsyncMock()
+        mock_context_manager = AsyncMock()
+        mock_context_manager.__aenter__ = AsyncMock(return_value=mock_session)
+        mock_client.session.return_value = mock_context_manager
+
+        context = _PersistentSessionContext(mock_client, "test_server")
+        await context.enter(validate=False)
+
+        assert context.is_active
+        assert context.listed_tools is None
+        mock_session.list_tools.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_enter_failure_cleanup(self):
         """Test cleanup on entry failure."""
@@ -115,6 +131,31 @@ class TestPersistentSessionContext:
         context.session = None
         assert not context.is_active
 
+    @pytest.mark.asyncio
+    async def test_call_tool_dispatches_to_owner_loop(self):
+        """Test tool calls from another loop run on the session's own loop."""
+        from agentdk.core.loop_thread import AsyncLoopThread
+
+        loop_thread = AsyncLoopThread(name="test-owner-loop")
+        calling_loops = []
+
+        async def call_tool(name, arguments):
+            calling_loops.append(asyncio.get_running_loop())
+            return f"{name}:{arguments['x']}"
+
+        context = _PersistentSessionContext(MagicMock(), "test_server")
+        context.session = MagicMock()
+        context.session.call_tool = call_tool
+        context._loop = loop_thread.loop
+
+        try:
+            result = await context.call_tool("echo", {"x": 1})
+        finally:
+            loop_thread.stop()
+
+        assert result == "echo:1"
+        assert calling_loops[0] is not asyncio.get_running_loop()
+
 
 class TestPersistentSessionManager:
     """Test the PersistentSessionManager class."""
@@ -165,6 +206,55 @@ class TestPersistentSessionManager:
             with pytest.raises(RuntimeError, match="Failed to initialize MCP sessions"):
                 await manager.initialize()
 
+    @pytest.mark.asyncio
+    async def test_initialize_opens_servers_concurrently(self):
+        """Test server sessions are opened concurrently, not one after another."""
+        mock_client = MagicMock()
+        mock_client.connections = {"server1": MagicMock(), "server2": MagicMock()}
+        manager = PersistentSessionManager(mock_client)
+
+        started = []
+        both_started = asyncio.Event()
+
+        def make_context(client, server_name):
+            async def enter(validate=True):
+                started.append(server_name)
+                if len(started) == 2:
+                    both_started.set()
+                # Deadlocks (and times out) if sessions are opened sequentially
+                await asyncio.wait_for(both_started.wait(), timeout=1.0)
+            return AsyncMock(is_active=True, enter=enter)
+
+        with patch('agentdk.core.persistent_mcp._PersistentSessionContext', side_effect=make_context):
+            await manager.initialize()
+
+        assert list(manager._pools) == ["server1", "server2"]
+        assert manager.active_session_count == 2
+
+    @pytest.mark.asyncio
+    async def test_initialize_cancelled_closes_opened_sessions(self):
+        """Test sessions opened before initialize() is cancelled are exited."""
+        mock_client = MagicMock()
+        mock_client.connections = {"fast": MagicMock(), "slow": MagicMock()}
+        manager = PersistentSessionManager(mock_client)
+        contexts = {}
+
+        def make_context(client, server_name):
+            async def enter(validate=True):
+                if server_name == "slow":
+                    await asyncio.sleep(10)
+            contexts[server_name] = AsyncMock(is_active=True, enter=enter)
+            return contexts[server_name]
+
+        with patch('agentdk.core.persistent_mcp._PersistentSessionContext', side_effect=make_context):
+            with pytest.raises(TimeoutError):
+                async with asyncio.timeout(0.05):
+                    await manager.initialize()
+
+        contexts["fast"].exit.assert_awaited_once()
+        assert manager._session_contexts == {}
+        assert not manager.is_initialized
+
     @pytest.mark.asyncio
     async def test_get_tools_persistent_not_initialized(self):
         """Test getting tools when not initialized."""
@@ -191,6 +281,217 @@ class TestPersistentSessionManager:
         manager._session_contexts = {"server1": mock_context1, "server2": mock_context2}
         assert manager.active_session_count == 1
 
+    @pytest.mark.asyncio
+    async def test_session_reuses_pooled_session(self):
+        """Test sequential checkouts reuse the same session without reopening."""
+        mock_client = MagicMock()
+        mock_client.connections = {"server1": MagicMock()}
+        manager = PersistentSessionManager(mock_client)
+
+        with patch('agentdk.core.persistent_mcp._PersistentSessionContext') as MockContext:
+            MockContext.return_value = AsyncMock(is_active=True)
+            await manager.initialize()
+
+            async with manager.session("server1") as first:
+                pass
+            async with manager.session("server1") as second:
+                pass
+
+        assert first is second
+        assert MockContext.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_session_pool_grows_up_to_pool_size(self):
+        """Test concurrent checkouts open extra sessions up to the pool size."""
+        mock_client = MagicMock()
+        mock_client.connections = {"server1": MagicMock()}
+        manager = PersistentSessionManager(mock_client, pool_size=2)
+
+        with patch('agentdk.core.persistent_mcp._PersistentSessionContext') as MockContext:
+            MockContext.side_effect = lambda *args: AsyncMock(is_active=True)
+            await manager.initialize()
+
+            async with manager.session("server1") as first:
+                async with manager.session("server1") as second:
+                    assert first is not second
+
+            assert len(manager._pools["server1"].contexts) == 2
+
+    @pytest.mark.asyncio
+    async def test_session_unknown_server(self):
+        """Test checking out a session for an unknown server."""
+        mock_client = MagicMock()
+        mock_client.connections = {}
+        manager = PersistentSessionManager(mock_client)
+        await manager.initialize()
+
+        with pytest.raises(RuntimeError, match="No persistent session pool"):
+            async with manager.session("missing"):
+                pass
+
+    @pytest.mark.asyncio
+    async def test_evict_idle_keeps_primary_session(self):
+        """Test idle eviction closes extra sessions but keeps the first one."""
+        mock_client = MagicMock()
+        mock_client.connections = {"server1": MagicMock()}
+        manager = PersistentSessionManager(mock_client, pool_size=2)
+
+        with patch('agentdk.core.persistent_mcp._PersistentSessionContext') as MockContext:
+            MockContext.side_effect = lambda *args: AsyncMock(is_active=True)
+            await manager.initialize()
+
+            async with manager.session("server1"):
+                async with manager.session("server1") as extra:
+                    pass
+
+        pool = manager._pools["server1"]
+        await pool.evict_idle(idle_timeout=-1)
+
+        assert len(pool.contexts) == 1
+        extra.exit.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_evict_idle_keeps_primary_while_extra_checked_out(self):
+        """Test a stale idle primary is kept while an extra session is in use."""
+        mock_client = MagicMock()
+        mock_client.connections = {"server1": MagicMock()}
+        manager = PersistentSessionManager(mock_client, pool_size=2)
+
+        with patch('agentdk.core.persistent_mcp._PersistentSessionContext') as MockContext:
+            MockContext.side_effect = lambda *args: AsyncMock(is_active=True)
+            await manager.initialize()
+
+            pool = manager._pools["server1"]
+            primary = await pool.acquire()
+            extra = await pool.acquire()
+            pool.release(primary)
+
+        await pool.evict_idle(idle_timeout=-1)
+
+        assert pool.primary is primary
+        assert pool.contexts == [primary, extra]
+        primary.exit.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_list_server_tools_uses_tool_cache(self, tmp_path):
+        """Test tool definitions are listed live once and then served from cache."""
+        from mcp.types import ListToolsResult, Tool
+        from agentdk.core.tool_cache import ToolCache
+
+        mock_client = MagicMock()
+        mock_client.connections = {"server1": {"command": "uv", "args": ["run"]}}
+        tool_cache = ToolCache(tmp_path / "tools.db")
+
+        listed = ListToolsResult(
+            tools=[Tool(name="query", description="Run SQL", inputSchema={"type": "object"})]
+        )
+        mock_session = AsyncMock()
+        mock_session.list_tools = AsyncMock(return_value=listed)
+        mock_context_manager = AsyncMock()
+        mock_context_manager.__aenter__ = AsyncMock(return_value=mock_session)
+        mock_client.session.return_value = mock_context_manager
+
+        manager = PersistentSessionManager(mock_client, tool_cache=tool_cache)
+        await manager.initialize()
+        first = await manager._list_server_tools("server1")
+
+        # A cache hit skips both the validation listing and tool discovery
+        second_manager = PersistentSessionManager(mock_client, tool_cache=tool_cache)
+        await second_manager.initialize()
+        second = await second_manager._list_server_tools("server1")
+
+        tool_cache.close()
+        assert mock_session.list_tools.await_count == 1
+        assert [tool.name for tool in second] == [tool.name for tool in first] == ["query"]
+        assert second[0].inputSchema == {"type": "object"}
+
+    @pytest.mark.asyncio
+    async def test_list_server_tools_prefers_validation_listing_over_cache(self, tmp_path):
+        """Test a fresh validation listing wins over, and refreshes, the tool cache."""
+        from mcp.types import ListToolsResult, Tool
+        from agentdk.core.tool_cache import ToolCache, hash_server_config
+
+        server_config = {"command": "uv", "args": ["run"]}
+        mock_client = MagicMock()
+        mock_client.connections = {"server1": server_config}
+        tool_cache = ToolCache(tmp_path / "tools.db")
+        cfg_hash = hash_server_config(server_config)
+        tool_cache.put("server1", cfg_hash, [{"name": "stale", "inputSchema": {"type": "object"}}])
+
+        listed = ListToolsResult(tools=[Tool(name="fresh", inputSchema={"type": "object"})])
+        context = AsyncMock(is_active=True, listed_tools=listed)
+
+        with patch('agentdk.core.persistent_mcp._PersistentSessionContext', return_value=context):
+            manager = PersistentSessionManager(mock_client, tool_cache=tool_cache)
+            await manager.initialize()
+            tools = await manager._list_server_tools("server1")
+
+        cached = tool_cache.get("server1", cfg_hash)
+        tool_cache.close()
+        assert [tool.name for tool in tools] == ["fresh"]
+        assert [data["name"] for data in cached] == ["fresh"]
+
+    @pytest.mark.asyncio
+    async def test_tool_cache_read_once_per_server_and_closed(self):
+        """Test startup and tool discovery share one cache lookup; cleanup closes it."""
+        mock_client = MagicMock()
+        mock_client.connections = {"server1": {"command": "uv"}}
+        tool_cache = MagicMock()
+        tool_cache.get.return_value = None
+        context = AsyncMock(is_active=True, listed_tools=MagicMock(tools=[]))
+
+        with patch('agentdk.core.persistent_mcp._PersistentSessionContext', return_value=context):
+            manager = PersistentSessionManager(mock_client, tool_cache=tool_cache)
+            await manager.initialize()
+            await manager._list_server_tools("server1")
+            await manager.cleanup()
+
+        tool_cache.get.assert_called_once()
+        tool_cache.put.assert_called_once()
+        tool_cache.close.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_list_server_tools_reuses_validation_listing(self):
+        """Test the listing made while validating the session is not repeated."""
+        from mcp.types import ListToolsResult, Tool
+
+        mock_client = MagicMock()
+        mock_client.connections = {"server1": MagicMock()}
+        mock_session = AsyncMock()
+        mock_session.list_tools = AsyncMock(
+            return_value=ListToolsResult(tools=[Tool(name="query", inputSchema={"type": "object"})])
+        )
+        mock_context_manager = AsyncMock()
+        mock_context_manager.__aenter__ = AsyncMock(return_value=mock_session)
+        mock_client.session.return_value = mock_context_manager
+
+        manager = PersistentSessionManager(mock_client)
+        await manager.initialize()
+        tools = await manager._list_server_tools("server1")
+
+        assert [tool.name for tool in tools] == ["query"]
+        assert mock_session.list_tools.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_cleanup_cancels_eviction_task(self):
+        """Test cleanup stops the idle eviction task and clears pools."""
+        mock_client = MagicMock()
+        mock_client.connections = {"server1": MagicMock()}
+        manager = PersistentSessionManager(mock_client, idle_timeout=60.0)
+
+        with patch('agentdk.core.persistent_mcp._PersistentSessionContext') as MockContext:
+            MockContext.return_value = AsyncMock(is_active=True)
+            await manager.initialize()
+
+        eviction_task = manager._eviction_task
+        assert eviction_task is not None
+
+        await manager.cleanup()
+        await asyncio.sleep(0)
+
+        assert eviction_task.cancelled()
+        assert manager._pools == {}
+
 
 class TestCleanupManager:
     """Test the CleanupManager class."""
@@ -227,4 +528,23 @@ class TestCleanupManager:
             cleanup.register_cleanup()  # Second call
             
             # Should only register once
-            mock_atexit.register.assert_called_once()
\ No newline at end of file
+            mock_atexit.register.assert_called_once()
+    def test_sync_cleanup_runs_on_owner_loop(self):
+        """Test sync cleanup exits sessions on the loop that opened them."""
+        from agentdk.core.loop_thread import AsyncLoopThread
+
+        loop_thread = AsyncLoopThread(name="test-cleanup-loop")
+        cleanup_loops = []
+
+        async def record_cleanup():
+            cleanup_loops.append(asyncio.get_running_loop())
+
+        mock_session_manager = MagicMock()
+        mock_session_manager._loop = loop_thread.loop
+        mock_session_manager.cleanup = record_cleanup
+        try:
+            CleanupManager(mock_session_manager)._sync_cleanup()
+        finally:
+            loop_thread.stop()
+
+        assert cleanup_loops == [mock_session_manager._loop]
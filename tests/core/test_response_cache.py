@@ -0,0 +1,64 @@
+"""Tests for the query response cache."""
+
+from agentdk.core.response_cache import ResponseCache
+
+
+def test_normalized_exact_match():
+    """Test queries differing only in case and whitespace share an entry."""
+    cache = ResponseCache()
+    cache.put("Show  tables", "customers, orders")
+
+    assert cache.get("show tables") == "customers, orders"
+    assert cache.get("show all tables") is None
+
+
+def test_lru_eviction():
+    """Test the least recently used entry is evicted at capacity."""
+    cache = ResponseCache(capacity=2)
+    cache.put("a", "1")
+    cache.put("b", "2")
+    cache.get("a")
+    cache.put("c", "3")
+
+    assert len(cache) == 2
+    assert cache.get("a") == "1"
+    assert cache.get("b") is None
+
+
+def test_semantic_match_above_threshold():
+    """Test an embedding function enables similarity-based hits."""
+    vectors = {
+        "how many customers": [1.0, 0.0],
+        "count the customers": [0.99, 0.05],
+        "weather today": [0.0, 1.0],
+    }
+    cache = ResponseCache(embed=vectors.__getitem__, threshold=0.95)
+    cache.put("how many customers", "42")
+
+    assert cache.get("count the customers") == "42"
+    assert cache.get("weather today") is None
+
+
+def test_clear():
+    """Test clear removes all entries."""
+    cache = ResponseCache()
+    cache.put("a", "1")
+    cache.clear()
+
+    assert cache.get("a") is None
+
+
+def test_miss_embedding_reused_by_put():
+    """Test a query is embedded once across a get() miss and the following put()."""
+    embedded = []
+
+    def embed(query):
+        embedded.append(query)
+        return [1.0, 0.0]
+
+    cache = ResponseCache(embed=embed)
+    assert cache.get("how many customers") is None
+    cache.put("How many  customers", "42")
+
+    assert embedded == ["how many customers"]
+    assert cache.get("count the customers") == "42"
@@ -0,0 +1,60 @@
+"""Tests for the persistent MCP tool definition cache."""
+
+import sqlite3
+
+from agentdk.core.tool_cache import ToolCache, hash_server_config
+
+
+def test_hash_server_config_is_order_independent():
+    """Test the config hash ignores key order but tracks value changes."""
+    first = hash_server_config({"command": "uv", "args": ["run"], "env": {"A": "1"}})
+    second = hash_server_config({"env": {"A": "1"}, "args": ["run"], "command": "uv"})
+    changed = hash_server_config({"command": "uv", "args": ["run"], "env": {"A": "2"}})
+
+    assert first == second
+    assert first != changed
+
+
+def test_put_and_get_roundtrip(tmp_path):
+    """Test stored tool definitions are returned for the same config hash."""
+    cache = ToolCache(tmp_path / "tools.db")
+    tools = [{"name": "query", "description": "Run SQL", "inputSchema": {"type": "object"}}]
+
+    assert cache.get("mysql", "abc") is None
+    cache.put("mysql", "abc", tools)
+
+    assert cache.get("mysql", "abc") == tools
+    assert cache.get("mysql", "other") is None
+    cache.close()
+
+
+def test_put_replaces_stale_config_entries(tmp_path):
+    """Test storing under a new config hash drops the server's old entry."""
+    cache = ToolCache(tmp_path / "tools.db")
+    cache.put("mysql", "old", [{"name": "a"}])
+    cache.put("mysql", "new", [{"name": "b"}])
+
+    assert cache.get("mysql", "old") is None
+    assert cache.get("mysql", "new") == [{"name": "b"}]
+    cache.close()
+
+
+def test_uses_wal_journal_mode(tmp_path):
+    """Test the database is opened in WAL mode."""
+    db_path = tmp_path / "tools.db"
+    cache = ToolCache(db_path)
+    cache.put("mysql", "abc", [])
+    cache.close()
+
+    with sqlite3.connect(str(db_path)) as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
+def test_unreadable_database_is_a_miss(tmp_path):
+    """Test a corrupt database file degrades to a cache miss."""
+    db_path = tmp_path / "tools.db"
+    db_path.write_bytes(b"not a sqlite database" * 10)
+    cache = ToolCache(db_path)
+
+    assert cache.get("mysql", "abc") is None
+    cache.put("mysql", "abc", [{"name": "a"}])
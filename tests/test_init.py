@@ -94,4 +94,42 @@ def test_imports_work_correctly():
         assert isinstance(AgentInitializationError, type)
         
     except ImportError as e:
-        pytest.fail(f"Import failed: {e}") 
\ No newline at end of file
+        pytest.fail(f"Import failed: {e}") 
+
+def test_memory_package_lazy_exports():
+    """Test that agentdk.memory resolves its public classes on first access."""
+    import agentdk.memory as memory
+    from agentdk.memory.memory_manager import MemoryManager
+
+    assert memory.MemoryManager is MemoryManager
+    assert 'MemoryManager' in vars(memory)
+    for name in memory.__all__:
+        assert getattr(memory, name) is not None
+
+    with pytest.raises(AttributeError):
+        memory.NotAMemoryClass
+
+
+def test_cli_import_skips_agent_stack():
+    """Test that importing the CLI entry point does not load the agent classes."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, agentdk.cli.main; "
+        "print('agentdk.agent.agent_interface' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "False"
+
+
+def test_package_lazy_exports():
+    """Test that agentdk resolves its public names on first access."""
+    assert agentdk.AgentBuilder is AgentBuilder
+    for name in agentdk.__all__:
+        assert getattr(agentdk, name) is not None
+
+    with pytest.raises(AttributeError):
+        agentdk.NotAnExport
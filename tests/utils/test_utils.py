@@ -1,15 +1,23 @@
 """Tests for utils module."""
 
 import os
+import sys
 import pytest
 from unittest.mock import patch, MagicMock
 
-from agentdk.utils.utils import get_llm
+from agentdk.utils.utils import get_llm, _build_llm
 
 
 class TestGetLLM:
     """Test the get_llm function."""
 
+    @pytest.fixture(autouse=True)
+    def clear_llm_cache(self):
+        """Start every test without LLMs cached by earlier tests."""
+        _build_llm.cache_clear()
+        yield
+        _build_llm.cache_clear()
+
     @pytest.mark.unit
     @pytest.mark.skip(reason="Requires optional langchain_openai dependency")
     def test_openai_llm_creation_success(self):
@@ -52,4 +60,18 @@ class TestGetLLM:
             with pytest.raises(ValueError) as exc_info:
                 get_llm()
             
-            assert "No LLM API key found" in str(exc_info.value)
\ No newline at end of file
+            assert "No LLM API key found" in str(exc_info.value)
+
+    def test_llm_reused_until_keys_change(self):
+        """Test the LLM is built once per set of API keys."""
+        fake_openai = MagicMock()
+        fake_openai.ChatOpenAI.side_effect = lambda **kwargs: object()
+
+        with patch.dict(sys.modules, {'langchain_openai': fake_openai}):
+            with patch.dict(os.environ, {'OPENAI_API_KEY': 'key-1'}, clear=True):
+                first = get_llm()
+                assert get_llm() is first
+            with patch.dict(os.environ, {'OPENAI_API_KEY': 'key-2'}, clear=True):
+                assert get_llm() is not first
+
+        assert fake_openai.ChatOpenAI.call_count == 2